@@ -0,0 +1,353 @@
+"""
+Admission control and scheduling for transcription requests.
+
+At most MAX_CONCURRENT_TRANSCRIPTIONS requests run at once and at most
+ADMISSION_QUEUE_DEPTH more wait for a slot. Anything beyond that is rejected
+straight away with ServiceOverloaded (429). Its Retry-After estimate comes
+from the recent service time, so under a spike clients back off instead
+of queueing without bound until their HTTP client times out.
+
+Waiting requests are not served in arrival order. The audio duration is
+known from the file header before inference. With ADMISSION_SCHEDULING=sjf
+the shortest waiting request gets the next free slot, so one two-hour file
+does not hold up a queue of voicemails. Every second spent waiting credits
+ADMISSION_AGING_RATE seconds against a request's duration, so long files
+still get their turn under a steady stream of short ones.
+ADMISSION_RESERVED_SHORT_SLOTS slots are only handed to short requests
+(at most ADMISSION_SHORT_JOB_SECONDS long), so short requests never wait
+for long ones to finish.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, List, NamedTuple, Optional
+
+from .config import settings
+from .exceptions import ServiceOverloaded, TranscriptionCancelled
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest sample in the moving averages
+EWMA_ALPHA = 0.2
+
+# How an admitted request left its slot
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# Assumed service time until the first request completes
+INITIAL_SERVICE_SECONDS = 10.0
+
+
+class Admission(NamedTuple):
+    """How long a request waited for its slot, and how long it was expected to."""
+    
+    wait_seconds: float
+    expected_wait_seconds: float
+
+
+class _Ticket:
+    """A request waiting for, or holding, a transcription slot."""
+    
+    __slots__ = ("duration", "is_short", "queued_at", "started_at", "granted")
+    
+    def __init__(self, duration: Optional[float], is_short: bool, queued_at: float):
+        self.duration = duration
+        self.is_short = is_short
+        self.queued_at = queued_at
+        self.started_at: Optional[float] = None
+        self.granted = asyncio.get_event_loop().create_future()
+
+
+class AdmissionController:
+    """Bounded, duration-aware queue in front of the transcription workers."""
+    
+    def __init__(
+        self,
+        max_concurrent: int,
+        queue_depth: int,
+        scheduling: str = "fifo",
+        short_job_seconds: float = 60.0,
+        reserved_short_slots: int = 0,
+        aging_rate: float = 0.0
+    ):
+        self.max_concurrent = max_concurrent
+        self.queue_depth = queue_depth
+        self.scheduling = scheduling
+        self.short_job_seconds = short_job_seconds
+        # At least one slot is always open to long requests
+        self.reserved_short_slots = min(reserved_short_slots, max_concurrent - 1) if scheduling == "sjf" else 0
+        self.aging_rate = aging_rate
+        self._waiting: List[_Ticket] = []
+        self._active: List[_Ticket] = []
+        
+        self.admitted_total = 0
+        self.rejected_total = 0
+        self.completed_total = 0
+        self.failed_total = 0
+        self.cancelled_total = 0
+        self._avg_wait = 0.0
+        self._max_wait = 0.0
+        self._avg_service = None
+        # Service seconds per second of audio, and the typical audio duration
+        self._avg_rtf = None
+        self._avg_duration = None
+    
+    def is_full(self) -> bool:
+        """Whether a new request would be rejected."""
+        return len(self._waiting) + len(self._active) >= self.max_concurrent + self.queue_depth
+    
+    def priority(self, duration: Optional[float], queued_at: float, now: Optional[float] = None) -> float:
+        """
+        Scheduling key for a waiting request; the lowest goes first.
+        
+        Args:
+            duration: Audio duration in seconds, if known
+            queued_at: time.monotonic() when the request started waiting
+            now: Current time.monotonic() (defaults to now)
+        
+        Returns:
+            Arrival time under FIFO, otherwise the duration less the aging credit
+        """
+        if self.scheduling != "sjf":
+            return queued_at
+        
+        if duration is None:
+            # Unknown durations queue like a typical request
+            duration = self._avg_duration or self.short_job_seconds
+        now = time.monotonic() if now is None else now
+        return duration - self.aging_rate * (now - queued_at)
+    
+    def expected_service_seconds(self, duration: Optional[float]) -> float:
+        """Expected time a request holds a slot, from its duration when known."""
+        if duration is not None and self._avg_rtf is not None:
+            return duration * self._avg_rtf
+        return self._avg_service or INITIAL_SERVICE_SECONDS
+    
+    def estimated_wait_seconds(
+        self,
+        duration: Optional[float] = None,
+        queued_at: Optional[float] = None,
+        ahead: Iterable[Optional[float]] = ()
+    ) -> float:
+        """
+        Expected wait for a slot.
+        
+        Without a duration this is the wait behind every queued request. With
+        one, only the requests the scheduler would serve first are counted.
+        
+        Args:
+            duration: Audio duration of the request, if known
+            queued_at: When the request started waiting (defaults to now)
+            ahead: Durations of requests not yet queued here that will be
+                served first (jobs waiting for a job worker)
+        
+        Returns:
+            Estimated seconds until the request starts
+        """
+        now = time.monotonic()
+        ahead = list(ahead)
+        
+        # Work left on the running requests
+        work = sum(
+            max(0.0, self.expected_service_seconds(ticket.duration) - (now - ticket.started_at))
+            for ticket in self._active
+        )
+        
+        if duration is None and queued_at is None:
+            waiting_ahead = self._waiting
+        else:
+            key = self.priority(duration, now if queued_at is None else queued_at, now)
+            waiting_ahead = [
+                ticket for ticket in self._waiting
+                if self.priority(ticket.duration, ticket.queued_at, now) < key
+            ]
+        work += sum(self.expected_service_seconds(ticket.duration) for ticket in waiting_ahead)
+        work += sum(self.expected_service_seconds(other) for other in ahead)
+        
+        free = self.max_concurrent - len(self._active)
+        if free > 0 and not waiting_ahead and not ahead:
+            return 0.0
+        
+        # Long requests cannot use the reserved slots
+        slots = self.max_concurrent
+        if duration is not None and not self._is_short(duration):
+            slots -= self.reserved_short_slots
+        return work / slots
+    
+    def retry_after_seconds(self) -> int:
+        """Retry-After hint for a rejected request, from current throughput."""
+        seconds = math.ceil(self.estimated_wait_seconds())
+        return min(max(1, seconds), settings.admission_max_retry_after_seconds)
+    
+    def reject(self, duration: Optional[float] = None) -> ServiceOverloaded:
+        """
+        Count a rejection and build the error to raise for it.
+        
+        Args:
+            duration: Audio duration of the rejected request, if known
+        
+        Returns:
+            Error carrying the Retry-After hint and the wait the request would have had
+        """
+        self.rejected_total += 1
+        retry_after = self.retry_after_seconds()
+        logger.warning(
+            f"Rejecting transcription: {len(self._active)} running, {len(self._waiting)} queued, "
+            f"retry after {retry_after}s"
+        )
+        return ServiceOverloaded(
+            queue_depth=len(self._waiting),
+            retry_after_seconds=retry_after,
+            estimated_wait_seconds=round(self.estimated_wait_seconds(duration), 1)
+        )
+    
+    @asynccontextmanager
+    async def admit(
+        self,
+        reject_when_full: bool = True,
+        duration_seconds: Optional[float] = None,
+        queued_at: Optional[float] = None
+    ) -> AsyncIterator[Admission]:
+        """
+        Hold a transcription slot for the duration of the block.
+        
+        Args:
+            reject_when_full: Raise instead of queueing when the queue is full
+                (background jobs pass False and always wait their turn)
+            duration_seconds: Audio duration, used to schedule the request
+            queued_at: time.monotonic() the request was first queued, if it
+                waited elsewhere before (aging counts from then)
+        
+        Yields:
+            Seconds spent waiting in the queue, and the wait expected when queued
+        
+        Raises:
+            ServiceOverloaded: If every slot is busy and the queue is full
+        """
+        if reject_when_full and self.is_full():
+            raise self.reject(duration_seconds)
+        
+        self.admitted_total += 1
+        start_wait = time.monotonic()
+        ticket = _Ticket(
+            duration_seconds,
+            self._is_short(duration_seconds),
+            start_wait if queued_at is None else queued_at
+        )
+        self._waiting.append(ticket)
+        self._dispatch()
+        
+        expected = 0.0
+        if not ticket.granted.done():
+            expected = self.estimated_wait_seconds(duration_seconds, ticket.queued_at)
+            logger.debug(f"Queued for a transcription slot, expected start in {expected:.1f}s")
+        
+        try:
+            await ticket.granted
+        except asyncio.CancelledError:
+            if ticket.granted.cancelled():
+                self._waiting.remove(ticket)
+            else:
+                # Granted just as the waiter was cancelled; hand the slot on
+                self._active.remove(ticket)
+                self._dispatch()
+            raise
+        
+        wait = time.monotonic() - start_wait
+        self._avg_wait += EWMA_ALPHA * (wait - self._avg_wait)
+        self._max_wait = max(self._max_wait, wait)
+        
+        outcome = FAILED
+        try:
+            yield Admission(wait, expected)
+            outcome = COMPLETED
+        except (asyncio.CancelledError, TranscriptionCancelled):
+            outcome = CANCELLED
+            raise
+        finally:
+            self._release(ticket, outcome)
+    
+    def _is_short(self, duration: Optional[float]) -> bool:
+        """Whether a request may use the slots reserved for short requests."""
+        return duration is not None and duration <= self.short_job_seconds
+    
+    def _dispatch(self) -> None:
+        """Hand free slots to the waiting requests the schedule picks."""
+        now = time.monotonic()
+        while self._waiting and len(self._active) < self.max_concurrent:
+            long_running = sum(1 for ticket in self._active if not ticket.is_short)
+            long_allowed = long_running < self.max_concurrent - self.reserved_short_slots
+            candidates = [ticket for ticket in self._waiting if ticket.is_short or long_allowed]
+            if not candidates:
+                return
+            
+            ticket = min(candidates, key=lambda t: self.priority(t.duration, t.queued_at, now))
+            self._waiting.remove(ticket)
+            self._active.append(ticket)
+            ticket.started_at = now
+            ticket.granted.set_result(None)
+    
+    def _release(self, ticket: _Ticket, outcome: str) -> None:
+        """Free a ticket's slot, record its outcome and service time and dispatch the next request."""
+        self._active.remove(ticket)
+        
+        service = time.monotonic() - ticket.started_at
+        if outcome == COMPLETED:
+            self.completed_total += 1
+        elif outcome == CANCELLED:
+            self.cancelled_total += 1
+        else:
+            self.failed_total += 1
+        if self._avg_service is None:
+            self._avg_service = service
+        else:
+            self._avg_service += EWMA_ALPHA * (service - self._avg_service)
+        
+        # Failed and cancelled requests say nothing about the speed of transcription
+        if outcome == COMPLETED and ticket.duration:
+            rtf = service / ticket.duration
+            if self._avg_rtf is None:
+                self._avg_rtf = rtf
+                self._avg_duration = ticket.duration
+            else:
+                self._avg_rtf += EWMA_ALPHA * (rtf - self._avg_rtf)
+                self._avg_duration += EWMA_ALPHA * (ticket.duration - self._avg_duration)
+        
+        self._dispatch()
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, wait and throughput figures for the metrics endpoint."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "queue_capacity": self.queue_depth,
+            "scheduling": self.scheduling,
+            "reserved_short_slots": self.reserved_short_slots,
+            "running": len(self._active),
+            "running_long": sum(1 for ticket in self._active if not ticket.is_short),
+            "queue_depth": len(self._waiting),
+            "admitted_total": self.admitted_total,
+            "rejected_total": self.rejected_total,
+            "completed_total": self.completed_total,
+            "failed_total": self.failed_total,
+            "cancelled_total": self.cancelled_total,
+            "avg_wait_seconds": round(self._avg_wait, 3),
+            "max_wait_seconds": round(self._max_wait, 3),
+            "avg_service_seconds": round(self._avg_service, 3) if self._avg_service is not None else None,
+            "avg_real_time_factor": round(self._avg_rtf, 3) if self._avg_rtf is not None else None,
+            "estimated_wait_seconds": round(self.estimated_wait_seconds(), 3)
+        }
+
+
+# Global admission controller instance
+admission_controller = AdmissionController(
+    settings.max_concurrent_transcriptions,
+    settings.admission_queue_depth,
+    settings.admission_scheduling,
+    settings.admission_short_job_seconds,
+    settings.admission_reserved_short_slots,
+    settings.admission_aging_rate
+)
@@ -0,0 +1,736 @@
+"""
+Header-only parsers for common audio containers.
+
+These parsers read duration, sample rate and channel count from container
+metadata alone (WAV fmt/data chunks, FLAC STREAMINFO, Ogg granule positions,
+MP3 Xing/VBRI frames and the MP4 mvhd box). Every parser reads a small,
+bounded number of bytes, so junk or truncated uploads are rejected without
+decoding any audio.
+"""
+
+import logging
+import os
+import struct
+from typing import BinaryIO, NamedTuple, Optional, Tuple
+
+from .exceptions import InvalidAudioFormat
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from the start of the file for signature and header parsing
+MAX_HEADER_BYTES = 64 * 1024
+
+# Bytes read from the end of the file to find the last Ogg page or FLAC frame
+MAX_TAIL_BYTES = 64 * 1024
+
+# Maximum number of RIFF chunks / MP4 boxes visited per container level
+MAX_CHUNKS = 64
+
+
+class AudioHeader(NamedTuple):
+    """Stream information read from container metadata."""
+    
+    format: str
+    duration: float
+    sample_rate: int
+    channels: int
+    codec: Optional[str] = None
+    bits_per_sample: Optional[int] = None
+    data_offset: Optional[int] = None
+    data_size: Optional[int] = None
+
+
+def detect_format_from_header(header: bytes) -> Optional[str]:
+    """
+    Detect audio container format from the first bytes of a file.
+    
+    Args:
+        header: At least the first 12 bytes of the file
+    
+    Returns:
+        Format name, or None if the signature is not recognized
+    """
+    if header.startswith(b'ID3'):
+        return 'mp3'
+    elif header.startswith(b'RIFF') and header[8:12] == b'WAVE':
+        return 'wav'
+    elif header.startswith(b'OggS'):
+        return 'ogg'
+    elif header.startswith(b'fLaC'):
+        return 'flac'
+    elif header[4:8] == b'ftyp':
+        return 'm4a'
+    elif header.startswith(b'\x30\x26\xB2\x75'):
+        return 'wma'
+    elif _parse_mp3_frame_header(header[:4]) is not None:
+        return 'mp3'
+    return None
+
+
+def parse_audio_header(file_path: str, file_format: Optional[str] = None) -> Optional[AudioHeader]:
+    """
+    Read stream information from container metadata without decoding audio.
+    
+    Args:
+        file_path: Path to audio file
+        file_format: Format hint used when the signature is not recognized
+    
+    Returns:
+        AudioHeader, or None if the container has no header parser or its
+        metadata does not carry a duration (callers should fall back to a decoder)
+    
+    Raises:
+        InvalidAudioFormat: If the file is junk or truncated
+    """
+    file_size = os.path.getsize(file_path)
+    
+    with open(file_path, 'rb') as f:
+        head = f.read(MAX_HEADER_BYTES)
+        
+        detected = detect_format_from_header(head) or file_format
+        
+        # ID3v2 tags are occasionally prepended to FLAC streams as well
+        if detected == 'mp3' and head.startswith(b'ID3'):
+            if _read_at(f, _skip_id3v2(head), 4) == b'fLaC':
+                detected = 'flac'
+        
+        if detected == 'wav':
+            return _parse_wav(f, head, file_size)
+        elif detected == 'flac':
+            return _parse_flac(f, head, file_size)
+        elif detected == 'ogg':
+            return _parse_ogg(f, head, file_size)
+        elif detected == 'mp3':
+            return _parse_mp3(f, head, file_size)
+        elif detected == 'm4a':
+            return _parse_mp4(f, head, file_size)
+    
+    return None
+
+
+def _invalid(message: str, file_format: str) -> InvalidAudioFormat:
+    """Build the exception raised for junk or truncated files."""
+    return InvalidAudioFormat(message=message, file_format=file_format)
+
+
+def _read_at(f: BinaryIO, offset: int, size: int) -> bytes:
+    """Read up to size bytes at an absolute offset."""
+    f.seek(offset)
+    return f.read(size)
+
+
+def _skip_id3v2(head: bytes) -> int:
+    """Return the offset just past a leading ID3v2 tag (0 if absent)."""
+    if len(head) < 10 or not head.startswith(b'ID3'):
+        return 0
+    
+    size_bytes = head[6:10]
+    if any(b & 0x80 for b in size_bytes):
+        raise _invalid("Corrupt ID3v2 tag size", "mp3")
+    
+    size = (size_bytes[0] << 21) | (size_bytes[1] << 14) | (size_bytes[2] << 7) | size_bytes[3]
+    footer = 10 if head[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+# WAV
+
+# WAVE_FORMAT codes for PCM and IEEE float sample data
+_WAV_CODECS = {0x0001: "pcm", 0x0003: "float", 0x0006: "alaw", 0x0007: "mulaw"}
+
+
+def _parse_wav(f: BinaryIO, head: bytes, file_size: int) -> AudioHeader:
+    """Parse RIFF/WAVE fmt and data chunks."""
+    if len(head) < 12 or not head.startswith(b'RIFF') or head[8:12] != b'WAVE':
+        raise _invalid("Missing RIFF/WAVE header", "wav")
+    
+    fmt = None
+    data_offset = None
+    data_size = None
+    pos = 12
+    
+    for _ in range(MAX_CHUNKS):
+        if pos + 8 > file_size:
+            break
+        
+        chunk_id, chunk_size = struct.unpack('<4sI', _read_at(f, pos, 8))
+        
+        if chunk_id == b'fmt ':
+            if chunk_size < 16:
+                raise _invalid("WAV fmt chunk is too short", "wav")
+            body = _read_at(f, pos + 8, min(chunk_size, 40))
+            if len(body) < 16:
+                raise _invalid("WAV fmt chunk is truncated", "wav")
+            fmt = struct.unpack('<HHIIHH', body[:16])
+            
+            # WAVE_FORMAT_EXTENSIBLE stores the real codec in the subformat GUID
+            if fmt[0] == 0xFFFE and len(body) >= 26:
+                fmt = (struct.unpack('<H', body[24:26])[0],) + fmt[1:]
+        
+        elif chunk_id == b'data':
+            data_offset = pos + 8
+            available = file_size - data_offset
+            # Streamed WAVs may leave the size unset; otherwise it must be present
+            if chunk_size in (0, 0xFFFFFFFF):
+                # Runs to the end of the file, so no chunk can follow it
+                data_size = available
+                break
+            if chunk_size > available:
+                raise _invalid("WAV data chunk is truncated", "wav")
+            data_size = chunk_size
+        
+        if fmt is not None and data_offset is not None:
+            break
+        # fmt is allowed after data, so keep scanning until both are found
+        pos += 8 + chunk_size + (chunk_size & 1)
+    
+    if fmt is None:
+        raise _invalid("WAV file has no fmt chunk", "wav")
+    if data_offset is None:
+        raise _invalid("WAV file has no data chunk", "wav")
+    
+    codec_id, channels, sample_rate, byte_rate, block_align, bits = fmt
+    if channels == 0 or sample_rate == 0 or block_align == 0:
+        raise _invalid("WAV fmt chunk has invalid stream parameters", "wav")
+    if data_size <= 0:
+        raise _invalid("WAV file contains no audio data", "wav")
+    
+    frames = data_size // block_align
+    return AudioHeader(
+        format="wav",
+        duration=frames / sample_rate,
+        sample_rate=sample_rate,
+        channels=channels,
+        codec=_WAV_CODECS.get(codec_id, f"0x{codec_id:04x}"),
+        bits_per_sample=bits,
+        data_offset=data_offset,
+        data_size=frames * block_align
+    )
+
+
+# FLAC
+
+# Block sizes of FLAC frame header codes 1-5 and 8-15 (6 and 7 are stored after the number)
+_FLAC_BLOCK_SIZES = {
+    1: 192, 2: 576, 3: 1152, 4: 2304, 5: 4608,
+    8: 256, 9: 512, 10: 1024, 11: 2048, 12: 4096, 13: 8192, 14: 16384, 15: 32768,
+}
+
+
+def _crc8(data: bytes) -> int:
+    """CRC-8 with polynomial 0x07, as used by FLAC frame headers."""
+    crc = 0
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x07) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+    return crc
+
+
+def _flac_frame_at(buf: bytes, pos: int) -> Optional[Tuple[bool, int, int]]:
+    """
+    Parse the FLAC frame header at pos in buf.
+    
+    Returns:
+        Tuple of (variable block size, frame or sample number, block size),
+        or None if there is no valid header (including its CRC-8) at pos
+    """
+    if pos + 5 > len(buf) or buf[pos] != 0xFF or (buf[pos + 1] & 0xFE) != 0xF8:
+        return None
+    
+    variable = bool(buf[pos + 1] & 0x01)
+    block_code = buf[pos + 2] >> 4
+    rate_code = buf[pos + 2] & 0x0F
+    if block_code == 0 or rate_code == 15 or (buf[pos + 3] >> 4) > 10 or buf[pos + 3] & 0x01:
+        return None
+    
+    # Frame or sample number, UTF-8 style: leading ones give the byte count
+    first = buf[pos + 4]
+    length = 1
+    number = first
+    if first & 0x80:
+        length = 0
+        mask = 0x80
+        while first & mask:
+            length += 1
+            mask >>= 1
+        if length < 2 or length > (7 if variable else 6):
+            return None
+        number = first & (mask - 1)
+    end = pos + 4 + length
+    if end > len(buf):
+        return None
+    for byte in buf[pos + 5:end]:
+        if byte & 0xC0 != 0x80:
+            return None
+        number = (number << 6) | (byte & 0x3F)
+    
+    if block_code in (6, 7):
+        size_bytes = block_code - 5
+        if end + size_bytes > len(buf):
+            return None
+        block_size = int.from_bytes(buf[end:end + size_bytes], 'big') + 1
+        end += size_bytes
+    else:
+        block_size = _FLAC_BLOCK_SIZES[block_code]
+    end += {12: 1, 13: 2, 14: 2}.get(rate_code, 0)
+    
+    if end >= len(buf) or _crc8(buf[pos:end]) != buf[end]:
+        return None
+    return variable, number, block_size
+
+
+def _flac_samples_present(tail: bytes, max_block_size: int) -> Optional[int]:
+    """
+    Samples up to the end of the furthest frame whose header is in tail.
+    
+    Every valid-looking header is considered rather than just the last one,
+    so a frame sync pattern inside compressed audio cannot make a complete
+    file look short.
+    
+    Returns:
+        Sample count, or None if tail contains no frame header
+    """
+    present = None
+    pos = tail.rfind(b'\xff')
+    while pos >= 0:
+        frame = _flac_frame_at(tail, pos)
+        if frame is not None:
+            variable, number, block_size = frame
+            first_sample = number if variable else number * max_block_size
+            present = max(present or 0, first_sample + block_size)
+        pos = tail.rfind(b'\xff', 0, pos)
+    return present
+
+
+def _parse_streaminfo(block: bytes) -> Tuple[int, int, int, int]:
+    """Unpack sample rate, channels, bits per sample and total samples from STREAMINFO."""
+    sample_rate = int.from_bytes(block[10:13], 'big') >> 4
+    channels = ((block[12] >> 1) & 0x07) + 1
+    bits = (((block[12] & 0x01) << 4) | (block[13] >> 4)) + 1
+    total_samples = ((block[13] & 0x0F) << 32) | int.from_bytes(block[14:18], 'big')
+    return sample_rate, channels, bits, total_samples
+
+
+def _parse_flac(f: BinaryIO, head: bytes, file_size: int) -> Optional[AudioHeader]:
+    """Parse the FLAC STREAMINFO metadata block."""
+    pos = _skip_id3v2(head)
+    marker = _read_at(f, pos, 8)
+    if len(marker) < 8 or marker[:4] != b'fLaC':
+        raise _invalid("Missing fLaC stream marker", "flac")
+    
+    # STREAMINFO is always the first metadata block and is 34 bytes long
+    block_type = marker[4] & 0x7F
+    block_length = int.from_bytes(marker[5:8], 'big')
+    if block_type != 0 or block_length != 34:
+        raise _invalid("FLAC STREAMINFO block is missing", "flac")
+    
+    block = _read_at(f, pos + 8, 34)
+    if len(block) < 34:
+        raise _invalid("FLAC STREAMINFO block is truncated", "flac")
+    
+    sample_rate, channels, bits, total_samples = _parse_streaminfo(block)
+    if sample_rate == 0:
+        raise _invalid("FLAC STREAMINFO has invalid sample rate", "flac")
+    
+    # Walk the remaining metadata block headers to the first audio frame
+    last = marker[4] & 0x80
+    pos += 8 + block_length
+    for _ in range(MAX_CHUNKS):
+        if last:
+            break
+        block_header = _read_at(f, pos, 4)
+        if len(block_header) < 4:
+            raise _invalid("FLAC metadata is truncated", "flac")
+        last = block_header[0] & 0x80
+        pos += 4 + int.from_bytes(block_header[1:4], 'big')
+    
+    sync = _read_at(f, pos, 2)
+    if len(sync) < 2 or sync[0] != 0xFF or (sync[1] & 0xFE) != 0xF8:
+        raise _invalid("FLAC file contains no audio frames", "flac")
+    
+    # Total samples of 0 means unknown length; let a decoder work it out
+    if total_samples == 0:
+        return None
+    
+    # STREAMINFO is written up front, so check the frames at the end reach it
+    tail_offset = max(pos, file_size - MAX_TAIL_BYTES)
+    max_block_size = int.from_bytes(block[2:4], 'big')
+    present = _flac_samples_present(_read_at(f, tail_offset, MAX_TAIL_BYTES), max_block_size)
+    if present is not None and present < total_samples:
+        raise _invalid("FLAC stream is truncated", "flac")
+    
+    return AudioHeader(
+        format="flac",
+        duration=total_samples / sample_rate,
+        sample_rate=sample_rate,
+        channels=channels,
+        codec="flac",
+        bits_per_sample=bits
+    )
+
+
+# Ogg
+
+def _ogg_page_at(buf: bytes, pos: int) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Parse the Ogg page header at pos in buf.
+    
+    Returns:
+        Tuple of (granule position, serial number, payload offset, payload length),
+        or None if the page does not fit completely inside buf
+    """
+    if pos + 27 > len(buf) or buf[pos:pos + 4] != b'OggS':
+        return None
+    
+    granule, serial = struct.unpack('<qI', buf[pos + 6:pos + 18])
+    segments = buf[pos + 26]
+    if pos + 27 + segments > len(buf):
+        return None
+    
+    payload_offset = pos + 27 + segments
+    payload_length = sum(buf[pos + 27:payload_offset])
+    if payload_offset + payload_length > len(buf):
+        return None
+    
+    return granule, serial, payload_offset, payload_length
+
+
+def _parse_ogg(f: BinaryIO, head: bytes, file_size: int) -> Optional[AudioHeader]:
+    """Parse the Ogg identification header and the granule position of the last page."""
+    page = _ogg_page_at(head, 0)
+    if page is None:
+        raise _invalid("Ogg first page is missing or truncated", "ogg")
+    
+    _, serial, payload_offset, payload_length = page
+    packet = head[payload_offset:payload_offset + payload_length]
+    
+    pre_skip = 0
+    if packet.startswith(b'\x01vorbis') and len(packet) >= 16:
+        codec = "vorbis"
+        channels = packet[11]
+        sample_rate = struct.unpack('<I', packet[12:16])[0]
+        granule_rate = sample_rate
+    elif packet.startswith(b'OpusHead') and len(packet) >= 16:
+        codec = "opus"
+        channels = packet[9]
+        pre_skip = struct.unpack('<H', packet[10:12])[0]
+        # Opus input rate is informational; granule positions are always 48kHz
+        sample_rate = struct.unpack('<I', packet[12:16])[0] or 48000
+        granule_rate = 48000
+    elif packet.startswith(b'\x7fFLAC') and len(packet) >= 51 and packet[9:13] == b'fLaC':
+        codec = "flac"
+        sample_rate, channels, _, _ = _parse_streaminfo(packet[17:51])
+        granule_rate = sample_rate
+    else:
+        # Speex and other codecs are left to the decoder
+        return None
+    
+    if channels == 0 or sample_rate == 0:
+        raise _invalid("Ogg identification header has invalid stream parameters", "ogg")
+    
+    # Find the last complete page of this logical stream
+    tail_offset = max(0, file_size - MAX_TAIL_BYTES)
+    tail = head if tail_offset == 0 else _read_at(f, tail_offset, MAX_TAIL_BYTES)
+    
+    last_page = None
+    pos = tail.rfind(b'OggS')
+    while pos >= 0:
+        page = _ogg_page_at(tail, pos)
+        if page is not None and page[1] == serial and page[0] >= 0:
+            last_page = pos
+            break
+        pos = tail.rfind(b'OggS', 0, pos)
+    
+    if last_page is None:
+        raise _invalid("Ogg stream is truncated", "ogg")
+    
+    # Some encoders and stream recorders never set the end-of-stream flag;
+    # the last complete page still gives the duration of the audio present
+    if not tail[last_page + 5] & 0x04:
+        logger.warning("Ogg stream has no end-of-stream page; using the last complete page")
+    last_granule = _ogg_page_at(tail, last_page)[0]
+    
+    samples = max(0, last_granule - pre_skip)
+    if samples == 0:
+        raise _invalid("Ogg stream contains no audio", "ogg")
+    
+    return AudioHeader(
+        format="ogg",
+        duration=samples / granule_rate,
+        sample_rate=sample_rate,
+        channels=channels,
+        codec=codec
+    )
+
+
+# MP3
+
+# Bitrates in kbps indexed by [version is MPEG-1][layer][bitrate index]
+_MP3_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# Sample rates indexed by version bits (0 = MPEG-2.5, 2 = MPEG-2, 3 = MPEG-1)
+_MP3_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+
+
+class _Mp3Frame(NamedTuple):
+    """Fields of an MPEG audio frame header."""
+    
+    version: int
+    layer: int
+    bitrate: int
+    sample_rate: int
+    channels: int
+    frame_length: int
+    samples_per_frame: int
+
+
+def _parse_mp3_frame_header(data: bytes) -> Optional[_Mp3Frame]:
+    """Parse a 4-byte MPEG audio frame header, returning None if invalid."""
+    if len(data) < 4 or data[0] != 0xFF or (data[1] & 0xE0) != 0xE0:
+        return None
+    
+    version = (data[1] >> 3) & 0x03
+    layer = 4 - ((data[1] >> 1) & 0x03)
+    bitrate_index = data[2] >> 4
+    sample_rate_index = (data[2] >> 2) & 0x03
+    padding = (data[2] >> 1) & 0x01
+    
+    # Reject reserved version/layer and free-format or invalid bitrates
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    
+    # MPEG-2.5 is only defined for Layer III
+    if version == 0 and layer != 3:
+        return None
+    
+    mpeg1 = version == 3
+    bitrate = _MP3_BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][sample_rate_index]
+    channels = 1 if (data[3] >> 6) == 3 else 2
+    
+    if layer == 1:
+        samples_per_frame = 384
+        frame_length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples_per_frame = 1152 if (layer == 2 or mpeg1) else 576
+        frame_length = samples_per_frame // 8 * bitrate // sample_rate + padding
+    
+    return _Mp3Frame(version, layer, bitrate, sample_rate, channels, frame_length, samples_per_frame)
+
+
+def _mp3_frames_chain(head: bytes, offset: int, frame: _Mp3Frame, count: int = 3) -> bool:
+    """Check that frames following offset are consistent with the first frame."""
+    for _ in range(count):
+        offset += frame.frame_length
+        if offset + 4 > len(head):
+            return True
+        following = _parse_mp3_frame_header(head[offset:offset + 4])
+        if following is None or following.sample_rate != frame.sample_rate or following.layer != frame.layer:
+            return False
+        frame = following
+    return True
+
+
+def _parse_mp3(f: BinaryIO, head: bytes, file_size: int) -> AudioHeader:
+    """Parse the first MPEG audio frame and its Xing/Info or VBRI header."""
+    audio_start = _skip_id3v2(head)
+    if audio_start:
+        head = _read_at(f, audio_start, MAX_HEADER_BYTES)
+    
+    # Find the first frame sync that starts a chain of consistent frames
+    frame = None
+    offset = head.find(b'\xff')
+    while 0 <= offset <= len(head) - 4:
+        candidate = _parse_mp3_frame_header(head[offset:offset + 4])
+        if candidate is not None and _mp3_frames_chain(head, offset, candidate):
+            frame = candidate
+            break
+        offset = head.find(b'\xff', offset + 1)
+    
+    if frame is None:
+        raise _invalid("No MPEG audio frame found", "mp3")
+    
+    frame_start = audio_start + offset
+    frame_data = head[offset:offset + frame.frame_length]
+    total_frames = None
+    total_bytes = None
+    
+    # Xing/Info header follows the side information in the first frame
+    if frame.version == 3:
+        side_info = 17 if frame.channels == 1 else 32
+    else:
+        side_info = 9 if frame.channels == 1 else 17
+    xing = frame_data[4 + side_info:4 + side_info + 16]
+    if xing[:4] in (b'Xing', b'Info') and len(xing) >= 8:
+        flags = struct.unpack('>I', xing[4:8])[0]
+        fields = xing[8:]
+        if flags & 0x01 and len(fields) >= 4:
+            total_frames = struct.unpack('>I', fields[:4])[0]
+            fields = fields[4:]
+        if flags & 0x02 and len(fields) >= 4:
+            total_bytes = struct.unpack('>I', fields[:4])[0]
+    
+    # VBRI header sits at a fixed 32 bytes after the frame header
+    vbri = frame_data[36:36 + 18]
+    if total_frames is None and vbri[:4] == b'VBRI' and len(vbri) >= 18:
+        total_bytes, total_frames = struct.unpack('>II', vbri[10:18])
+    
+    if total_bytes and file_size - frame_start < total_bytes:
+        raise _invalid("MPEG audio stream is truncated", "mp3")
+    
+    if total_frames:
+        duration = total_frames * frame.samples_per_frame / frame.sample_rate
+    else:
+        # Constant bitrate: estimate from the audio payload size
+        audio_bytes = file_size - frame_start
+        if file_size >= 128 and _read_at(f, file_size - 128, 3) == b'TAG':
+            audio_bytes -= 128
+        duration = audio_bytes * 8 / frame.bitrate
+    
+    if duration <= 0:
+        raise _invalid("MPEG audio stream contains no audio", "mp3")
+    
+    return AudioHeader(
+        format="mp3",
+        duration=duration,
+        sample_rate=frame.sample_rate,
+        channels=frame.channels,
+        codec=f"mp{frame.layer}",
+        data_offset=frame_start
+    )
+
+
+# MP4 / M4A
+
+def _iter_boxes(f: BinaryIO, start: int, end: int):
+    """Yield (box type, payload offset, box end) for boxes between start and end."""
+    pos = start
+    for _ in range(MAX_CHUNKS):
+        if pos + 8 > end:
+            return
+        
+        header = _read_at(f, pos, 16)
+        if len(header) < 8:
+            raise _invalid("MP4 box header is truncated", "m4a")
+        
+        size, box_type = struct.unpack('>I4s', header[:8])
+        payload = pos + 8
+        if size == 1:
+            if len(header) < 16:
+                raise _invalid("MP4 box header is truncated", "m4a")
+            size = struct.unpack('>Q', header[8:16])[0]
+            payload = pos + 16
+        elif size == 0:
+            size = end - pos
+        
+        if size < payload - pos:
+            raise _invalid("MP4 box has invalid size", "m4a")
+        if pos + size > end:
+            raise _invalid(f"MP4 '{box_type.decode('latin-1')}' box is truncated", "m4a")
+        
+        yield box_type, payload, pos + size
+        pos += size
+
+
+def _find_box(f: BinaryIO, start: int, end: int, box_type: bytes) -> Optional[Tuple[int, int]]:
+    """Return (payload offset, box end) of the first box of a type, or None."""
+    for found, payload, box_end in _iter_boxes(f, start, end):
+        if found == box_type:
+            return payload, box_end
+    return None
+
+
+def _parse_mp4(f: BinaryIO, head: bytes, file_size: int) -> Optional[AudioHeader]:
+    """Parse the MP4 mvhd box and the first audio track's sample description."""
+    if len(head) < 12 or head[4:8] != b'ftyp':
+        raise _invalid("Missing MP4 ftyp box", "m4a")
+    
+    # Walk every top-level box so a truncated mdat is caught as well
+    top_level = {}
+    for box_type, payload, box_end in _iter_boxes(f, 0, file_size):
+        top_level.setdefault(box_type, (payload, box_end))
+    
+    moov = top_level.get(b'moov')
+    if moov is None:
+        raise _invalid("MP4 file has no moov box", "m4a")
+    
+    mvhd = _find_box(f, moov[0], moov[1], b'mvhd')
+    if mvhd is None:
+        raise _invalid("MP4 file has no mvhd box", "m4a")
+    
+    body = _read_at(f, mvhd[0], 32)
+    if len(body) >= 32 and body[0] == 1:
+        timescale, duration = struct.unpack('>IQ', body[20:32])
+    elif len(body) >= 20:
+        timescale, duration = struct.unpack('>II', body[12:20])
+    else:
+        raise _invalid("MP4 mvhd box is truncated", "m4a")
+    
+    if timescale == 0:
+        raise _invalid("MP4 mvhd box has invalid timescale", "m4a")
+    
+    # Locate the first sound track and read its sample description
+    for box_type, trak_start, trak_end in _iter_boxes(f, moov[0], moov[1]):
+        if box_type != b'trak':
+            continue
+        
+        mdia = _find_box(f, trak_start, trak_end, b'mdia')
+        if mdia is None:
+            continue
+        hdlr = _find_box(f, mdia[0], mdia[1], b'hdlr')
+        if hdlr is None or _read_at(f, hdlr[0] + 8, 4) != b'soun':
+            continue
+        
+        minf = _find_box(f, mdia[0], mdia[1], b'minf')
+        stbl = _find_box(f, minf[0], minf[1], b'stbl') if minf else None
+        stsd = _find_box(f, stbl[0], stbl[1], b'stsd') if stbl else None
+        if stsd is None:
+            raise _invalid("MP4 audio track has no sample description", "m4a")
+        
+        # stsd: version/flags, entry count, then the first sample entry
+        entry = _read_at(f, stsd[0] + 8, 36)
+        if len(entry) < 36:
+            raise _invalid("MP4 sample description is truncated", "m4a")
+        
+        codec = entry[4:8].decode('latin-1').strip()
+        channels = struct.unpack('>H', entry[24:26])[0]
+        bits = struct.unpack('>H', entry[26:28])[0]
+        sample_rate = struct.unpack('>I', entry[32:36])[0] >> 16
+        
+        # Rates above 65535 Hz do not fit the 16.16 field; use the media timescale
+        if sample_rate == 0:
+            mdhd = _find_box(f, mdia[0], mdia[1], b'mdhd')
+            if mdhd is not None:
+                mdhd_body = _read_at(f, mdhd[0], 24)
+                offset = 20 if mdhd_body[:1] == b'\x01' else 12
+                sample_rate = struct.unpack('>I', mdhd_body[offset:offset + 4])[0]
+        
+        if channels == 0 or sample_rate == 0:
+            raise _invalid("MP4 audio track has invalid stream parameters", "m4a")
+        
+        # Fragmented files leave the movie duration empty; let a decoder work it out
+        if duration == 0:
+            return None
+        
+        return AudioHeader(
+            format="m4a",
+            duration=duration / timescale,
+            sample_rate=sample_rate,
+            channels=channels,
+            codec=codec,
+            bits_per_sample=bits or None
+        )
+    
+    raise _invalid("MP4 file has no audio track", "m4a")
@@ -0,0 +1,34 @@
+"""
+Inference backends for the Whisperrr service.
+
+Backends are selected by name per deployment (INFERENCE_BACKEND) or per model
+size (INFERENCE_BACKEND_OVERRIDES).
+"""
+
+from .base import InferenceBackend
+from .faster_whisper import FasterWhisperBackend
+from .openai_whisper import OpenAIWhisperBackend
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (OpenAIWhisperBackend(), FasterWhisperBackend())
+}
+
+
+def get_backend(name: str) -> InferenceBackend:
+    """
+    Get an inference backend by name.
+    
+    Args:
+        name: Backend name ('openai-whisper' or 'faster-whisper')
+    
+    Returns:
+        The backend instance
+    """
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown inference backend: {name}. Available: {sorted(BACKENDS)}")
+
+
+__all__ = ["BACKENDS", "InferenceBackend", "get_backend"]
@@ -0,0 +1,71 @@
+"""
+Inference backend interface.
+
+A backend knows how to load a model for a given size, run a transcription
+and describe a loaded model. Every backend returns results in the
+openai-whisper result shape (text, segments with start/end/text/avg_logprob,
+language) so the service maps them into one TranscriptionResponse.
+"""
+
+from typing import Any, Dict, Union
+
+import numpy as np
+
+
+class InferenceBackend:
+    """Base class for inference backends."""
+    
+    # Name used in settings and reported by the API
+    name = "base"
+    
+    # Whether a model loaded before os.fork() keeps working in the children
+    fork_safe = False
+    
+    def load(self, model_size: str, device: str, cpu_threads: int = 0) -> Any:
+        """
+        Load a model.
+        
+        Args:
+            model_size: Whisper model size
+            device: Device to load the model on ('cpu' or 'cuda')
+            cpu_threads: CPU threads per transcription (0 = backend default)
+        
+        Returns:
+            Backend-specific loaded model
+        """
+        raise NotImplementedError
+    
+    def transcribe(self, model: Any, audio: Union[str, np.ndarray], options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Transcribe audio with a loaded model.
+        
+        Args:
+            model: Model returned by load()
+            audio: Path to an audio file, or a 16kHz mono float32 array
+            options: openai-whisper style options (language, task, temperature,
+                initial_prompt); options a backend does not support are ignored
+        
+        Returns:
+            Whisper-style result dict with text, segments and language
+        """
+        raise NotImplementedError
+    
+    def enable_batching(self, model: Any, max_batch_size: int, max_wait_seconds: float) -> None:
+        """
+        Batch encoder work across concurrent requests on a loaded model.
+        
+        Backends without cross-request batching leave the model unchanged.
+        
+        Args:
+            model: Model returned by load()
+            max_batch_size: Most requests encoded in one pass
+            max_wait_seconds: How long to wait for a batch to fill
+        """
+    
+    def describe(self, model: Any) -> Dict[str, Any]:
+        """Describe a loaded model (backend, device, precision)."""
+        return {"backend": self.name}
+    
+    def estimate_memory_mb(self, model: Any) -> float:
+        """Estimate the memory held by a loaded model in MB."""
+        return 0.0
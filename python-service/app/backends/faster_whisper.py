@@ -0,0 +1,112 @@
+"""
+CTranslate2 inference backend via faster-whisper.
+
+faster-whisper is an optional dependency; it is imported when a model is
+first loaded with this backend.
+"""
+
+import logging
+import os
+from typing import Any, Dict, Union
+
+import numpy as np
+
+from ..cancellation import check_cancelled
+from ..config import settings
+from .base import InferenceBackend
+
+logger = logging.getLogger(__name__)
+
+# openai-whisper options that map directly onto faster-whisper keyword arguments
+PASSTHROUGH_OPTIONS = ("language", "task", "temperature", "initial_prompt", "condition_on_previous_text")
+
+
+class FasterWhisperModel:
+    """A loaded CTranslate2 model and the files it was loaded from."""
+    
+    def __init__(self, model: Any, model_path: str, device: str, compute_type: str):
+        self.model = model
+        self.model_path = model_path
+        self.device = device
+        self.compute_type = compute_type
+
+
+class FasterWhisperBackend(InferenceBackend):
+    """Runs CTranslate2 conversions of the Whisper models."""
+    
+    name = "faster-whisper"
+    
+    def load(self, model_size: str, device: str, cpu_threads: int = 0) -> FasterWhisperModel:
+        """Download (if needed) and load a CTranslate2 model."""
+        try:
+            from faster_whisper import WhisperModel, download_model
+        except ImportError as e:
+            raise RuntimeError("The faster-whisper backend requires the faster-whisper package") from e
+        
+        compute_type = settings.ct2_compute_type
+        model_path = download_model(model_size, cache_dir=settings.model_cache_dir)
+        model = WhisperModel(
+            model_path,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            # Let concurrent executor threads transcribe with this model in parallel
+            num_workers=settings.max_concurrent_transcriptions
+        )
+        logger.info(f"Loaded CTranslate2 model {model_size} ({compute_type}) from {model_path}")
+        return FasterWhisperModel(model, model_path, device, compute_type)
+    
+    def transcribe(
+        self,
+        model: FasterWhisperModel,
+        audio: Union[str, np.ndarray],
+        options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Transcribe and convert the result to the openai-whisper shape.
+        
+        Decoding is greedy (beam_size=1) like openai-whisper's transcribe
+        defaults, so the two backends can be compared like for like.
+        """
+        kwargs = {key: options[key] for key in PASSTHROUGH_OPTIONS if key in options}
+        kwargs.setdefault("beam_size", options.get("beam_size", 1))
+        
+        # Segments are generated lazily; decoding happens while iterating
+        segments_iter, info = model.model.transcribe(audio, **kwargs)
+        segments = []
+        for index, segment in enumerate(segments_iter):
+            segments.append({
+                "id": index,
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "avg_logprob": segment.avg_logprob,
+                "no_speech_prob": segment.no_speech_prob
+            })
+            # Stop before decoding the next window if the request was cancelled
+            check_cancelled()
+        
+        return {
+            "text": "".join(segment["text"] for segment in segments),
+            "segments": segments,
+            "language": info.language
+        }
+    
+    def describe(self, model: FasterWhisperModel) -> Dict[str, Any]:
+        """Describe the device and CTranslate2 compute type."""
+        return {
+            "backend": self.name,
+            "device": model.device,
+            "compute_type": model.compute_type
+        }
+    
+    def estimate_memory_mb(self, model: FasterWhisperModel) -> float:
+        """Estimate memory from the size of the converted weights on disk."""
+        weights = os.path.join(model.model_path, "model.bin")
+        if not os.path.exists(weights):
+            return 0.0
+        size_mb = os.path.getsize(weights) / (1024 * 1024)
+        # Checkpoints are stored in float16; int8 compute halves the resident weights
+        if model.compute_type.startswith("int8"):
+            size_mb /= 2
+        return round(size_mb, 2)
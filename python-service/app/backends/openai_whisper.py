@@ -0,0 +1,63 @@
+"""
+openai-whisper inference backend (PyTorch).
+"""
+
+from typing import Any, Dict, Union
+
+import numpy as np
+
+from ..batching import EncoderBatcher, enable_encoder_batching
+from ..cancellation import install_decode_checkpoint
+from ..config import settings
+from ..model_pool import estimate_model_memory_mb
+from ..quantization import load_whisper_model
+from .base import InferenceBackend
+
+
+class OpenAIWhisperBackend(InferenceBackend):
+    """Runs models with the reference openai-whisper implementation."""
+    
+    name = "openai-whisper"
+    
+    # Plain tensors; torch thread pools are started per worker after the fork
+    fork_safe = True
+    
+    def load(self, model_size: str, device: str, cpu_threads: int = 0) -> Any:
+        """Load a model, int8-quantized on CPU if configured, that stops between windows when cancelled."""
+        # Thread counts are applied per worker by the executor initializer
+        model = load_whisper_model(model_size, device, settings.model_quantization)
+        install_decode_checkpoint(model)
+        return model
+    
+    def transcribe(self, model: Any, audio: Union[str, np.ndarray], options: Dict[str, Any]) -> Dict[str, Any]:
+        """Transcribe with model.transcribe."""
+        return model.transcribe(audio, **options)
+    
+    def enable_batching(self, model: Any, max_batch_size: int, max_wait_seconds: float) -> None:
+        """Route the model's encoder passes through a cross-request batcher."""
+        enable_encoder_batching(model, max_batch_size, max_wait_seconds)
+    
+    def describe(self, model: Any) -> Dict[str, Any]:
+        """Describe the device, whether linear layers are quantized and encoder batching."""
+        device = str(model.device)
+        quantized = any(
+            type(module).__module__.startswith("torch.ao.nn.quantized")
+            for module in model.modules()
+        )
+        
+        # transcribe() runs fp16 on GPU and fp32 on CPU
+        compute_type = "float16" if device.startswith("cuda") else "float32"
+        if quantized:
+            compute_type = "int8"
+        
+        description = {"backend": self.name, "device": device, "compute_type": compute_type}
+        
+        batcher = model.__dict__.get("encoder")
+        if isinstance(batcher, EncoderBatcher):
+            description["encoder_batching"] = batcher.stats()
+        
+        return description
+    
+    def estimate_memory_mb(self, model: Any) -> float:
+        """Estimate memory from the model's weights and buffers."""
+        return estimate_model_memory_mb(model)
@@ -0,0 +1,162 @@
+"""
+Cross-request batching of Whisper encoder passes.
+
+Concurrent requests on the same model each encode their 30 s mel windows
+one at a time. EncoderBatcher stands in for the model's encoder. The first
+caller to arrive becomes the leader: it waits up to the batching window for
+other callers' windows, runs them through the real encoder as one batch and
+hands each caller its slice of the output. Callers then continue their own
+decoding loops.
+
+There is no batching thread. Leaders are ordinary transcription worker
+threads, so when a caller is alone it pays at most the batching window.
+Each worker thread runs with its share of the CPUs (see cpu_topology), and
+the followers sit idle while the leader encodes. The leader therefore runs
+the batch with the torch threads of every caller in it.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingEncode:
+    """One caller's mel batch waiting for the encoder."""
+    
+    __slots__ = ("mel", "threads", "result", "error", "done")
+    
+    def __init__(self, mel: Any, threads: int):
+        self.mel = mel
+        # torch intra-op threads of the calling worker
+        self.threads = threads
+        self.result = None
+        self.error = None
+        self.done = False
+
+
+class EncoderBatcher:
+    """Drop-in replacement for a Whisper model's encoder that batches across threads."""
+    
+    def __init__(self, encoder: Any, max_batch_size: int, max_wait_seconds: float):
+        self.encoder = encoder
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._cond = threading.Condition()
+        self._pending: List[_PendingEncode] = []
+        self._leader_active = False
+        self.batches = 0
+        self.windows = 0
+    
+    def __call__(self, mel: Any) -> Any:
+        """
+        Encode a (batch, n_mels, frames) mel tensor, batched with concurrent callers.
+        
+        Returns:
+            Audio features for this caller's windows only
+        """
+        import torch
+        
+        request = _PendingEncode(mel, torch.get_num_threads())
+        
+        with self._cond:
+            self._pending.append(request)
+            # Wake a leader that is waiting for its batch to fill
+            self._cond.notify_all()
+            
+            while not request.done:
+                if self._leader_active:
+                    self._cond.wait()
+                    continue
+                
+                batch = self._collect_batch()
+                self._cond.release()
+                try:
+                    self._run_batch(batch)
+                finally:
+                    self._cond.acquire()
+                    for item in batch:
+                        item.done = True
+                    self._leader_active = False
+                    self._cond.notify_all()
+        
+        if request.error is not None:
+            raise request.error
+        return request.result
+    
+    def _collect_batch(self) -> List[_PendingEncode]:
+        """Become leader and take up to a full batch (called with the lock held)."""
+        self._leader_active = True
+        deadline = time.monotonic() + self.max_wait_seconds
+        
+        while len(self._pending) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._cond.wait(remaining)
+        
+        batch = self._pending[:self.max_batch_size]
+        del self._pending[:self.max_batch_size]
+        return batch
+    
+    def _run_batch(self, batch: List[_PendingEncode]) -> None:
+        """Run one encoder pass over every caller's windows and split the output."""
+        import torch
+        
+        # Use the cores of the callers waiting on this batch as well as the leader's
+        own_threads = torch.get_num_threads()
+        torch.set_num_threads(max(own_threads, sum(item.threads for item in batch)))
+        try:
+            with torch.no_grad():
+                shapes = {(item.mel.shape[1:], item.mel.dtype) for item in batch}
+                if len(shapes) == 1:
+                    features = self.encoder(torch.cat([item.mel for item in batch]))
+                    sizes = [item.mel.shape[0] for item in batch]
+                    for item, result in zip(batch, torch.split(features, sizes)):
+                        item.result = result
+                else:
+                    # Windows that cannot be stacked are encoded one caller at a time
+                    for item in batch:
+                        item.result = self.encoder(item.mel)
+            
+            self.batches += 1
+            self.windows += sum(item.mel.shape[0] for item in batch)
+        except Exception as e:
+            for item in batch:
+                item.error = e
+        finally:
+            torch.set_num_threads(own_threads)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Batching settings and the average batch size so far."""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 1),
+            "batches": self.batches,
+            "avg_batch_size": round(self.windows / self.batches, 2) if self.batches else None
+        }
+
+
+def enable_encoder_batching(model: Any, max_batch_size: int, max_wait_seconds: float) -> EncoderBatcher:
+    """
+    Route a Whisper model's encoder passes through an EncoderBatcher.
+    
+    The batcher is set as an instance attribute, which takes precedence over
+    the registered submodule for attribute lookup, so decoding and language
+    detection call it while parameters, state_dict() and .to() still see the
+    real encoder.
+    
+    Args:
+        model: Loaded openai-whisper model
+        max_batch_size: Most callers encoded in one pass
+        max_wait_seconds: How long a leader waits for the batch to fill
+    
+    Returns:
+        The installed batcher
+    """
+    batcher = EncoderBatcher(model._modules["encoder"], max_batch_size, max_wait_seconds)
+    object.__setattr__(model, "encoder", batcher)
+    logger.info(f"Encoder batching enabled (batch {max_batch_size}, wait {max_wait_seconds * 1000:.0f}ms)")
+    return batcher
@@ -0,0 +1,120 @@
+"""
+Per-request deadlines and cooperative cancellation of transcriptions.
+
+Decoding runs in executor threads and cannot be interrupted from outside, so
+each request carries a CancellationToken that the decoding loop checks
+between 30 s windows: on every openai-whisper decode call, on every
+faster-whisper segment and on every streamed window. Once the deadline
+passes or the token is cancelled (client disconnected, job cancelled), the
+next checkpoint raises and frees the worker thread for queued requests.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from .exceptions import TranscriptionCancelled, TranscriptionTimeout
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+class CancellationToken:
+    """Deadline and cancellation flag shared by a request and its worker threads."""
+    
+    def __init__(self, timeout_seconds: Optional[float] = None):
+        self.timeout_seconds = timeout_seconds
+        self.deadline = time.monotonic() + timeout_seconds if timeout_seconds else None
+        self.reason: Optional[str] = None
+        self._cancelled = threading.Event()
+    
+    @property
+    def cancelled(self) -> bool:
+        """Whether the request was cancelled or ran past its deadline."""
+        return self._cancelled.is_set() or self.expired
+    
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+    
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (None without one)."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+    
+    def cancel(self, reason: str) -> None:
+        """Ask the worker to stop at its next checkpoint."""
+        if not self._cancelled.is_set():
+            self.reason = reason
+            self._cancelled.set()
+    
+    def check(self) -> None:
+        """
+        Raise if the request should stop.
+        
+        Raises:
+            TranscriptionTimeout: If the deadline has passed
+            TranscriptionCancelled: If the token was cancelled
+        """
+        if self.expired or self.reason == "timeout":
+            raise TranscriptionTimeout(timeout_seconds=self.timeout_seconds)
+        if self._cancelled.is_set():
+            raise TranscriptionCancelled(reason=self.reason)
+
+
+@contextmanager
+def bind_token(token: Optional[CancellationToken]) -> Iterator[None]:
+    """Make a token the current thread's token for checkpoints."""
+    previous = getattr(_local, "token", None)
+    _local.token = token
+    try:
+        yield
+    finally:
+        _local.token = previous
+
+
+def check_cancelled() -> None:
+    """Checkpoint: raise if the current thread's request should stop."""
+    token = getattr(_local, "token", None)
+    if token is not None:
+        token.check()
+
+
+def install_decode_checkpoint(model: Any) -> None:
+    """
+    Check for cancellation before each 30 s window an openai-whisper model decodes.
+    
+    transcribe() calls model.decode once per window (and per temperature
+    fallback); the wrapper is set as an instance attribute so the shared model
+    checks whichever request's token is bound to the calling thread.
+    """
+    decode = model.decode
+    
+    def decode_with_checkpoint(*args, **kwargs):
+        check_cancelled()
+        return decode(*args, **kwargs)
+    
+    object.__setattr__(model, "decode", decode_with_checkpoint)
+
+
+async def watch_disconnect(request: Any, task: "asyncio.Future", poll_interval: float) -> None:
+    """
+    Cancel a request's transcription task if the client goes away.
+    
+    Args:
+        request: Starlette request being served
+        task: Task running the transcription
+        poll_interval: Seconds between disconnect checks
+    """
+    while not task.done():
+        if await request.is_disconnected():
+            logger.info("Client disconnected, cancelling transcription")
+            task.cancel()
+            return
+        await asyncio.sleep(poll_interval)
@@ -0,0 +1,165 @@
+"""
+Memory-mapped Whisper checkpoints for fast model loads.
+
+whisper.load_model unpickles the downloaded fp16 checkpoint, builds a
+randomly initialised fp32 model and copies the weights into it, so a load
+costs the full model size twice over. Here each checkpoint is converted
+once into a flat fp32 state dict in the model cache directory. Later loads
+memory-map that file (torch.load(mmap=True)) and assign the mapped tensors
+straight into a model built on the meta device, so no weights are copied:
+pages are read on first use and shared through the page cache by every
+process on the host that loads the same model.
+"""
+
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def checkpoint_sha(model_size: str) -> Optional[str]:
+    """SHA256 prefix of the official checkpoint for a size (None if unknown)."""
+    import whisper
+    
+    url = getattr(whisper, "_MODELS", {}).get(model_size)
+    if url is None:
+        return None
+    # URLs look like .../models/<sha256>/<name>.pt
+    return url.split("/")[-2][:12]
+
+
+def cached_checkpoint_path(model_size: str, cache_dir: str, variant: str) -> Optional[str]:
+    """
+    Path of a file derived from an official checkpoint in the model cache.
+    
+    The upstream checkpoint's SHA is part of the name, so a new upstream
+    checkpoint never reuses a file derived from the old one.
+    
+    Args:
+        model_size: Whisper model size
+        cache_dir: Model cache directory
+        variant: What the file holds, e.g. 'fp32-mmap'
+    
+    Returns:
+        File path, or None for sizes without an official checkpoint
+    """
+    sha = checkpoint_sha(model_size)
+    if sha is None:
+        return None
+    return os.path.join(cache_dir, f"whisper-{model_size}-{sha}-{variant}.pt")
+
+
+def non_persistent_buffers(model: Any) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Collect the buffers a state dict leaves out (decoder attention mask, alignment heads).
+    
+    Sparse buffers are stored densely so they load with weights_only=True.
+    
+    Returns:
+        Tuple of the buffers by name and the names of those that were sparse
+    """
+    persistent = model.state_dict()
+    buffers: Dict[str, Any] = {}
+    sparse_buffers = []
+    for name, buffer in model.named_buffers():
+        if name in persistent:
+            continue
+        if buffer.is_sparse:
+            sparse_buffers.append(name)
+            buffer = buffer.to_dense()
+        buffers[name] = buffer
+    return buffers, sparse_buffers
+
+
+def restore_buffers(model: Any, buffers: Dict[str, Any], sparse_buffers: List[str]) -> None:
+    """Register buffers collected by non_persistent_buffers() on a rebuilt model."""
+    for name, buffer in buffers.items():
+        if name in sparse_buffers:
+            buffer = buffer.to_sparse()
+        module_name, _, buffer_name = name.rpartition(".")
+        model.get_submodule(module_name).register_buffer(buffer_name, buffer, persistent=False)
+
+
+def convert_checkpoint(model_size: str, path: str) -> None:
+    """
+    Convert an official Whisper checkpoint into a memory-mappable file.
+    
+    Besides the state dict, the non-persistent buffers (decoder attention
+    mask, alignment heads) are stored densely so a meta-device model can be
+    fully materialised without recomputing them.
+    
+    Args:
+        model_size: Whisper model size
+        path: Destination file
+    """
+    import dataclasses
+    import torch
+    import whisper
+    
+    start_time = time.time()
+    model = whisper.load_model(model_size, device="cpu")
+    
+    buffers, sparse_buffers = non_persistent_buffers(model)
+    checkpoint = {
+        "dims": dataclasses.asdict(model.dims),
+        "state_dict": {name: tensor.contiguous() for name, tensor in model.state_dict().items()},
+        "buffers": buffers,
+        "sparse_buffers": sparse_buffers
+    }
+    
+    # Write to a temporary name so concurrent loaders never map a partial file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        torch.save(checkpoint, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    logger.info(f"Converted model {model_size} to a mappable checkpoint in {time.time() - start_time:.2f}s: {path}")
+
+
+def load_mapped_model(model_size: str, device: str, cache_dir: str) -> Any:
+    """
+    Load a Whisper model from a memory-mapped checkpoint, converting it on a miss.
+    
+    Falls back to whisper.load_model for sizes without an official checkpoint
+    and for torch versions without mmap/assign loading (before 2.1).
+    
+    Args:
+        model_size: Whisper model size
+        device: Device to load the model on
+        cache_dir: Directory holding converted checkpoints
+    
+    Returns:
+        Loaded Whisper model in eval mode
+    """
+    import torch
+    import whisper
+    from whisper.model import ModelDimensions, Whisper
+    
+    path = cached_checkpoint_path(model_size, cache_dir, "fp32-mmap")
+    if path is None:
+        logger.warning(f"No official checkpoint for {model_size}; loading without memory mapping")
+        return whisper.load_model(model_size, device=device)
+    
+    try:
+        if not os.path.exists(path):
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            convert_checkpoint(model_size, path)
+        
+        checkpoint = torch.load(path, map_location="cpu", mmap=True, weights_only=True)
+        
+        # Build on the meta device: no memory is allocated for the random init
+        with torch.device("meta"):
+            model = Whisper(ModelDimensions(**checkpoint["dims"]))
+        model.load_state_dict(checkpoint["state_dict"], assign=True)
+        restore_buffers(model, checkpoint["buffers"], checkpoint["sparse_buffers"])
+    except Exception as e:
+        logger.warning(f"Memory-mapped load of {model_size} failed, loading normally: {e}")
+        return whisper.load_model(model_size, device=device)
+    
+    logger.info(f"Memory-mapped model {model_size} from {path}")
+    return model.to(device).eval()
@@ -3,18 +3,35 @@ Configuration management for the Whisperrr FastAPI service.
 """
 
 import os
-from typing import List, Union
+from typing import Dict, List, Union
 from pydantic import validator, field_validator
 from pydantic_settings import BaseSettings
 
 
+# Names of the inference backends in app.backends
+INFERENCE_BACKENDS = ["openai-whisper", "faster-whisper"]
+
+
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
     
     # Model configuration
     model_size: str = "base"
+    model_pool_memory_budget_mb: int = 2048
+    model_load_wait_timeout_seconds: float = 120.0
+    startup_queue_timeout_seconds: float = 5.0
+    model_loading_retry_after_seconds: int = 5
+    inference_backend: str = "openai-whisper"
+    inference_backend_overrides: Union[Dict[str, str], str] = {}
+    ct2_compute_type: str = "int8"
+    model_quantization: str = "none"
+    model_cache_dir: str = os.path.join(os.path.expanduser("~"), ".cache", "whisperrr", "models")
+    model_mmap_enabled: bool = False
+    model_warmup_enabled: bool = True
+    model_warmup_seconds: Union[List[float], str] = [2.0, 15.0]
     max_file_size_mb: int = 25
     upload_dir: str = "/tmp/whisperrr_uploads"
+    upload_chunk_size_kb: int = 1024
     log_level: str = "INFO"
     
     # API configuration
@@ -25,8 +42,51 @@ class Settings(BaseSettings):
     
     # Processing configuration
     max_concurrent_transcriptions: int = 3
+    admission_queue_depth: int = 10
+    admission_max_retry_after_seconds: int = 120
+    admission_scheduling: str = "sjf"
+    admission_short_job_seconds: float = 60.0
+    admission_reserved_short_slots: int = 1
+    admission_aging_rate: float = 60.0
+    jobs_workers: int = 2
+    jobs_queue_depth: int = 100
+    jobs_max_stored: int = 1000
+    jobs_result_ttl_seconds: float = 3600.0
+    jobs_poll_interval_seconds: int = 2
+    encoder_batching_enabled: bool = False
+    encoder_batch_max_size: int = 8
+    encoder_batch_max_wait_ms: float = 10.0
+    torch_intra_op_threads: int = 0
+    torch_inter_op_threads: int = 0
     request_timeout_seconds: int = 300
+    disconnect_poll_interval_seconds: float = 1.0
     cleanup_temp_files: bool = True
+    audio_pipeline_mode: str = "memory"
+    resampler_backend: str = "soxr_hq"
+    fast_lane_enabled: bool = True
+    vad_enabled: bool = False
+    vad_aggressiveness: int = 1
+    
+    # Streaming decode for very long recordings
+    streaming_decode_enabled: bool = True
+    streaming_min_duration_seconds: float = 1800.0
+    streaming_window_seconds: float = 30.0
+    
+    # Long-form transcription
+    longform_enabled: bool = False
+    longform_min_duration_seconds: float = 600.0
+    longform_chunk_seconds: float = 120.0
+    longform_overlap_seconds: float = 2.0
+    longform_workers: int = 0
+    
+    # Production server (app.server)
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    server_workers: int = 1
+    server_preload_model: bool = True
+    server_max_requests: int = 1000
+    server_max_requests_jitter: int = 100
+    server_graceful_timeout_seconds: int = 3600
     
     # Performance and monitoring
     enable_metrics: bool = True
@@ -59,6 +119,231 @@ class Settings(BaseSettings):
             raise ValueError(f"Log level must be one of: {valid_levels}")
         return v.upper()
     
+    @validator("audio_pipeline_mode")
+    def validate_audio_pipeline_mode(cls, v):
+        """Validate audio pipeline mode."""
+        valid_modes = ["memory", "file"]
+        if v not in valid_modes:
+            raise ValueError(f"Audio pipeline mode must be one of: {valid_modes}")
+        return v
+    
+    @validator("resampler_backend")
+    def validate_resampler_backend(cls, v):
+        """Validate resampler backend is supported."""
+        valid_backends = ["soxr_hq", "soxr_qq", "polyphase", "integer"]
+        if v not in valid_backends:
+            raise ValueError(f"Resampler backend must be one of: {valid_backends}")
+        return v
+    
+    @validator("vad_aggressiveness")
+    def validate_vad_aggressiveness(cls, v):
+        """Validate VAD aggressiveness level."""
+        if v not in (0, 1, 2, 3):
+            raise ValueError("VAD aggressiveness must be between 0 and 3")
+        return v
+    
+    @validator("streaming_window_seconds")
+    def validate_streaming_window_seconds(cls, v):
+        """Validate streaming window length."""
+        if v < 1:
+            raise ValueError("Streaming window must be at least 1 second")
+        return v
+    
+    @validator("longform_chunk_seconds")
+    def validate_longform_chunk_seconds(cls, v):
+        """Validate long-form chunk length."""
+        if v < 30:
+            raise ValueError("Long-form chunk length must be at least 30 seconds")
+        return v
+    
+    @validator("longform_overlap_seconds")
+    def validate_longform_overlap_seconds(cls, v, values):
+        """Validate long-form overlap is shorter than half a chunk."""
+        if v < 0 or v * 2 >= values.get("longform_chunk_seconds", 120.0):
+            raise ValueError("Long-form overlap must be non-negative and less than half a chunk")
+        return v
+    
+    @validator("longform_workers")
+    def validate_longform_workers(cls, v):
+        """Validate long-form worker count (0 uses the CPUs per server worker, at most 4)."""
+        if v < 0:
+            raise ValueError("Long-form workers must be 0 (auto) or positive")
+        return v
+    
+    @validator("model_pool_memory_budget_mb")
+    def validate_model_pool_memory_budget(cls, v):
+        """Validate model pool memory budget."""
+        if v <= 0:
+            raise ValueError("Model pool memory budget must be positive")
+        return v
+    
+    @validator("model_load_wait_timeout_seconds")
+    def validate_model_load_wait_timeout(cls, v):
+        """Validate model load wait timeout."""
+        if v <= 0:
+            raise ValueError("Model load wait timeout must be positive")
+        return v
+    
+    @validator("startup_queue_timeout_seconds")
+    def validate_startup_queue_timeout(cls, v):
+        """Validate startup queue timeout."""
+        if v < 0:
+            raise ValueError("Startup queue timeout cannot be negative")
+        return v
+    
+    @validator("model_loading_retry_after_seconds")
+    def validate_model_loading_retry_after(cls, v):
+        """Validate Retry-After hint for requests made while loading."""
+        if v < 1:
+            raise ValueError("Retry-After must be at least 1 second")
+        return v
+    
+    @validator("admission_queue_depth")
+    def validate_admission_queue_depth(cls, v):
+        """Validate admission queue depth (0 = reject whenever every slot is busy)."""
+        if v < 0:
+            raise ValueError("Admission queue depth cannot be negative")
+        return v
+    
+    @validator("admission_max_retry_after_seconds")
+    def validate_admission_max_retry_after(cls, v):
+        """Validate the cap on Retry-After for rejected requests."""
+        if v < 1:
+            raise ValueError("Admission max Retry-After must be at least 1 second")
+        return v
+    
+    @validator("admission_scheduling")
+    def validate_admission_scheduling(cls, v):
+        """Validate the order waiting requests are served in."""
+        if v not in ("fifo", "sjf"):
+            raise ValueError("Admission scheduling must be 'fifo' or 'sjf'")
+        return v
+    
+    @validator("admission_short_job_seconds")
+    def validate_admission_short_job_seconds(cls, v):
+        """Validate the longest audio that counts as a short request."""
+        if v <= 0:
+            raise ValueError("Short job threshold must be positive")
+        return v
+    
+    @validator("admission_reserved_short_slots", "admission_aging_rate")
+    def validate_admission_scheduling_limits(cls, v):
+        """Validate reserved short slots and the aging rate."""
+        if v < 0:
+            raise ValueError("Reserved short slots and aging rate cannot be negative")
+        return v
+    
+    @validator("jobs_workers", "jobs_queue_depth", "jobs_max_stored", "jobs_poll_interval_seconds")
+    def validate_jobs_limits(cls, v):
+        """Validate job worker, queue and store limits."""
+        if v < 1:
+            raise ValueError("Job workers, queue depth, store size and poll interval must be at least 1")
+        return v
+    
+    @validator("jobs_result_ttl_seconds")
+    def validate_jobs_result_ttl(cls, v):
+        """Validate how long finished jobs are kept."""
+        if v <= 0:
+            raise ValueError("Job result TTL must be positive")
+        return v
+    
+    @validator("encoder_batch_max_size")
+    def validate_encoder_batch_max_size(cls, v):
+        """Validate encoder batch size."""
+        if v < 1:
+            raise ValueError("Encoder batch size must be at least 1")
+        return v
+    
+    @validator("encoder_batch_max_wait_ms")
+    def validate_encoder_batch_max_wait(cls, v):
+        """Validate how long an encoder batch waits to fill."""
+        if v < 0 or v > 1000:
+            raise ValueError("Encoder batch wait must be between 0 and 1000 ms")
+        return v
+    
+    @validator("request_timeout_seconds")
+    def validate_request_timeout(cls, v):
+        """Validate the per-request deadline (0 = no deadline)."""
+        if v < 0:
+            raise ValueError("Request timeout cannot be negative")
+        return v
+    
+    @validator("disconnect_poll_interval_seconds")
+    def validate_disconnect_poll_interval(cls, v):
+        """Validate how often running requests check for a disconnected client."""
+        if v <= 0:
+            raise ValueError("Disconnect poll interval must be positive")
+        return v
+    
+    @validator("torch_intra_op_threads", "torch_inter_op_threads")
+    def validate_torch_threads(cls, v):
+        """Validate torch thread counts (0 = automatic)."""
+        if v < 0:
+            raise ValueError("Torch thread counts cannot be negative")
+        return v
+    
+    @validator("server_workers")
+    def validate_server_workers(cls, v):
+        """Validate server worker process count."""
+        if v < 1:
+            raise ValueError("Server workers must be at least 1")
+        return v
+    
+    @validator("server_max_requests", "server_max_requests_jitter")
+    def validate_server_max_requests(cls, v):
+        """Validate worker recycling limits (0 = never recycle)."""
+        if v < 0:
+            raise ValueError("Server max requests cannot be negative")
+        return v
+    
+    @validator("server_graceful_timeout_seconds")
+    def validate_server_graceful_timeout(cls, v):
+        """Validate how long a stopping worker may finish in-flight work (0 would kill it at once)."""
+        if v < 1:
+            raise ValueError("Server graceful timeout must be at least 1 second")
+        return v
+    
+    @validator("inference_backend")
+    def validate_inference_backend(cls, v):
+        """Validate inference backend name."""
+        if v not in INFERENCE_BACKENDS:
+            raise ValueError(f"Inference backend must be one of: {INFERENCE_BACKENDS}")
+        return v
+    
+    @validator("inference_backend_overrides", pre=True)
+    def parse_inference_backend_overrides(cls, v):
+        """Parse per-model backends from 'size=backend' pairs or a dict."""
+        if isinstance(v, str):
+            # Handle comma-separated string from environment variables
+            pairs = [pair.split("=", 1) for pair in v.split(",") if pair.strip()]
+            if any(len(pair) != 2 for pair in pairs):
+                raise ValueError("Backend overrides must be comma-separated size=backend pairs")
+            v = {size.strip(): backend.strip() for size, backend in pairs}
+        for backend in v.values():
+            if backend not in INFERENCE_BACKENDS:
+                raise ValueError(f"Inference backend must be one of: {INFERENCE_BACKENDS}")
+        return v
+    
+    @validator("model_quantization")
+    def validate_model_quantization(cls, v):
+        """Validate model quantization mode."""
+        if v not in ("none", "int8"):
+            raise ValueError("Model quantization must be 'none' or 'int8'")
+        return v
+    
+    @validator("model_warmup_seconds", pre=True)
+    def parse_model_warmup_seconds(cls, v):
+        """Parse warm-up clip lengths from string or list."""
+        if isinstance(v, str):
+            # Handle comma-separated string from environment variables
+            v = [float(seconds) for seconds in v.split(",") if seconds.strip()]
+        elif isinstance(v, (int, float)):
+            # A single number in the environment arrives JSON-decoded
+            v = [float(v)]
+        if any(seconds <= 0 or seconds > 30 for seconds in v):
+            raise ValueError("Warm-up clip lengths must be between 0 and 30 seconds")
+        return v
+    
     @validator("max_file_size_mb")
     def validate_max_file_size(cls, v):
         """Validate max file size is reasonable."""
@@ -66,12 +351,30 @@ class Settings(BaseSettings):
             raise ValueError("Max file size must be between 1 and 1000 MB")
         return v
     
+    @validator("upload_chunk_size_kb")
+    def validate_upload_chunk_size(cls, v):
+        """Validate upload chunk size is reasonable."""
+        if v <= 0 or v > 64 * 1024:  # Max 64MB per chunk
+            raise ValueError("Upload chunk size must be between 1 and 65536 KB")
+        return v
+    
     @validator("upload_dir")
     def validate_upload_dir(cls, v):
         """Ensure upload directory exists."""
         os.makedirs(v, exist_ok=True)
         return v
     
+    @validator("model_cache_dir")
+    def validate_model_cache_dir(cls, v):
+        """Ensure the model cache directory exists and only the service user can write to it."""
+        v = os.path.expanduser(v)
+        os.makedirs(v, mode=0o700, exist_ok=True)
+        if hasattr(os, "getuid") and os.stat(v).st_uid != os.getuid():
+            raise ValueError(f"Model cache directory {v} must be owned by the service user")
+        # Cached models are loaded into the process; nobody else may plant files here
+        os.chmod(v, 0o700)
+        return v
+    
     @validator("cors_origins", pre=True)
     def parse_cors_origins(cls, v):
         """Parse CORS origins from string or list."""
@@ -80,11 +383,25 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",") if origin.strip()]
         return v
     
+    def backend_for(self, model_size: str) -> str:
+        """Get the inference backend used for a model size."""
+        return self.inference_backend_overrides.get(model_size, self.inference_backend)
+    
+    @property
+    def jobs_available(self) -> bool:
+        """Whether asynchronous jobs can be served (their store lives in one process)."""
+        return self.server_workers == 1
+    
     @property
     def max_file_size_bytes(self) -> int:
         """Get max file size in bytes."""
         return self.max_file_size_mb * 1024 * 1024
     
+    @property
+    def upload_chunk_size_bytes(self) -> int:
+        """Get upload chunk size in bytes."""
+        return self.upload_chunk_size_kb * 1024
+    
     @property
     def supported_formats_set(self) -> set:
         """Get supported formats as a set for faster lookup."""
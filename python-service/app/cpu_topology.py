@@ -0,0 +1,140 @@
+"""
+CPU topology detection and torch thread layout for transcription workers.
+
+Each transcription worker thread runs its own torch intra-op thread team.
+Left at torch's default (every core), N concurrent workers start N x cores
+threads and slow each other down. The layout here splits the CPUs actually
+available to the process (affinity mask and cgroup quota, so containers get
+their limit rather than the host's core count) evenly across workers.
+"""
+
+import logging
+import math
+import os
+import threading
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# cgroup v2 and v1 CPU quota files
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+_interop_lock = threading.Lock()
+_interop_configured = False
+
+
+class ThreadLayout(NamedTuple):
+    """How CPUs are divided between concurrent transcription workers."""
+    
+    cpus: int
+    cpu_source: str
+    workers: int
+    intra_op_threads: int
+    inter_op_threads: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Describe the layout for the model info endpoint."""
+        return self._asdict()
+
+
+def _read_cgroup_quota() -> Optional[float]:
+    """Read the cgroup CPU quota in CPUs, or None when unlimited or unavailable."""
+    try:
+        with open(CGROUP_V2_CPU_MAX) as f:
+            quota, period = f.read().split()[:2]
+        if quota != "max":
+            return int(quota) / int(period)
+        return None
+    except (OSError, ValueError):
+        pass
+    
+    try:
+        with open(CGROUP_V1_QUOTA) as f:
+            quota = int(f.read())
+        with open(CGROUP_V1_PERIOD) as f:
+            period = int(f.read())
+        if quota > 0 and period > 0:
+            return quota / period
+    except (OSError, ValueError):
+        pass
+    
+    return None
+
+
+def available_cpus() -> Tuple[int, str]:
+    """
+    Count the CPUs this process can actually use.
+    
+    Returns:
+        Tuple of CPU count and where the limit came from
+        ('cgroup', 'affinity' or 'os')
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus, source = len(os.sched_getaffinity(0)), "affinity"
+    else:
+        cpus, source = os.cpu_count() or 1, "os"
+    
+    quota = _read_cgroup_quota()
+    if quota is not None and quota < cpus:
+        # Round down: threads beyond the quota only get throttled
+        cpus, source = max(1, math.floor(quota)), "cgroup"
+    
+    return cpus, source
+
+
+def plan_thread_layout(
+    workers: int,
+    intra_op_threads: int = 0,
+    inter_op_threads: int = 0
+) -> ThreadLayout:
+    """
+    Split the available CPUs across concurrent workers.
+    
+    Args:
+        workers: Number of concurrent transcription workers
+        intra_op_threads: Threads per worker (0 = available CPUs / workers)
+        inter_op_threads: torch inter-op threads (0 = 1; Whisper runs ops sequentially)
+    
+    Returns:
+        ThreadLayout with the chosen thread counts
+    """
+    cpus, source = available_cpus()
+    
+    layout = ThreadLayout(
+        cpus=cpus,
+        cpu_source=source,
+        workers=workers,
+        intra_op_threads=intra_op_threads or max(1, cpus // workers),
+        inter_op_threads=inter_op_threads or 1
+    )
+    logger.info(
+        f"Thread layout: {layout.workers} workers x {layout.intra_op_threads} threads "
+        f"on {layout.cpus} CPUs ({layout.cpu_source})"
+    )
+    return layout
+
+
+def configure_worker_threads(layout: ThreadLayout) -> None:
+    """
+    Apply a thread layout to the calling worker thread (executor initializer).
+    
+    torch's intra-op setting applies to parallel regions started by the
+    calling thread, so each worker sets its own; the inter-op pool is
+    process-wide and can only be sized once, before it is first used.
+    """
+    global _interop_configured
+    
+    # A failing initializer would break the whole executor, so only warn
+    try:
+        import torch
+        
+        torch.set_num_threads(layout.intra_op_threads)
+        
+        with _interop_lock:
+            if not _interop_configured:
+                _interop_configured = True
+                torch.set_num_interop_threads(layout.inter_op_threads)
+    except Exception as e:
+        logger.warning(f"Could not apply torch thread layout: {e}")
@@ -72,11 +72,14 @@ class ModelNotLoaded(WhisperrrException):
     def __init__(
         self,
         message: str = "Whisper model is not loaded",
-        model_size: Optional[str] = None
+        model_size: Optional[str] = None,
+        retry_after_seconds: Optional[int] = None
     ):
         details = {}
         if model_size:
             details["requested_model"] = model_size
+        if retry_after_seconds:
+            details["retry_after_seconds"] = retry_after_seconds
         
         super().__init__(
             message=message,
@@ -85,6 +88,97 @@ class ModelNotLoaded(WhisperrrException):
         )
 
 
+class ServiceOverloaded(WhisperrrException):
+    """Raised when the transcription queue is full."""
+    
+    def __init__(
+        self,
+        message: str = "Too many transcriptions in progress, retry later",
+        queue_depth: Optional[int] = None,
+        retry_after_seconds: Optional[int] = None,
+        estimated_wait_seconds: Optional[float] = None
+    ):
+        details = {}
+        if queue_depth is not None:
+            details["queue_depth"] = queue_depth
+        if retry_after_seconds:
+            details["retry_after_seconds"] = retry_after_seconds
+        if estimated_wait_seconds is not None:
+            details["estimated_wait_seconds"] = estimated_wait_seconds
+        
+        super().__init__(
+            message=message,
+            error_code="SERVICE_OVERLOADED",
+            details=details
+        )
+
+
+class JobNotFound(WhisperrrException):
+    """Raised when a transcription job does not exist or has expired."""
+    
+    def __init__(
+        self,
+        message: str = "Job not found or expired",
+        job_id: Optional[str] = None
+    ):
+        details = {}
+        if job_id:
+            details["job_id"] = job_id
+        
+        super().__init__(
+            message=message,
+            error_code="JOB_NOT_FOUND",
+            details=details
+        )
+
+
+class JobsUnavailable(WhisperrrException):
+    """Raised when the jobs API is used with more than one server worker."""
+    
+    def __init__(
+        self,
+        message: str = "Asynchronous jobs require SERVER_WORKERS=1",
+        server_workers: Optional[int] = None
+    ):
+        details = {}
+        if server_workers:
+            details["server_workers"] = server_workers
+        
+        super().__init__(
+            message=message,
+            error_code="JOBS_UNAVAILABLE",
+            details=details
+        )
+
+
+class JobNotCompleted(WhisperrrException):
+    """Raised when the result of a job that has not completed is requested."""
+    
+    def __init__(
+        self,
+        message: str = "Job has not completed",
+        job_id: Optional[str] = None,
+        status: Optional[str] = None,
+        error: Optional[Dict[str, Any]] = None,
+        retry_after_seconds: Optional[int] = None
+    ):
+        details = {}
+        if job_id:
+            details["job_id"] = job_id
+        if status:
+            details["status"] = status
+        if error:
+            details["error"] = error
+        if retry_after_seconds:
+            details["retry_after_seconds"] = retry_after_seconds
+        
+        super().__init__(
+            message=message,
+            error_code="JOB_NOT_COMPLETED",
+            details=details
+        )
+
+
 class TranscriptionFailed(WhisperrrException):
     """Raised when transcription process fails."""
     
@@ -107,6 +201,44 @@ class TranscriptionFailed(WhisperrrException):
         )
 
 
+class TranscriptionTimeout(WhisperrrException):
+    """Raised when a transcription runs past the request timeout."""
+    
+    def __init__(
+        self,
+        message: str = "Transcription exceeded the request timeout",
+        timeout_seconds: Optional[float] = None
+    ):
+        details = {}
+        if timeout_seconds:
+            details["timeout_seconds"] = timeout_seconds
+        
+        super().__init__(
+            message=message,
+            error_code="TRANSCRIPTION_TIMEOUT",
+            details=details
+        )
+
+
+class TranscriptionCancelled(WhisperrrException):
+    """Raised when a transcription is stopped before it finishes."""
+    
+    def __init__(
+        self,
+        message: str = "Transcription was cancelled",
+        reason: Optional[str] = None
+    ):
+        details = {}
+        if reason:
+            details["reason"] = reason
+        
+        super().__init__(
+            message=message,
+            error_code="TRANSCRIPTION_CANCELLED",
+            details=details
+        )
+
+
 class ModelLoadFailed(WhisperrrException):
     """Raised when model loading fails."""
     
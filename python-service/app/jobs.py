@@ -0,0 +1,341 @@
+"""
+Asynchronous transcription jobs.
+
+POST /jobs stores the upload, queues a job and returns its id straight
+away; a fixed set of worker tasks drain the queue through the same
+admission slots as /transcribe. Clients poll for status and progress and
+fetch the result when it is done, so connection lifetime no longer bounds
+how long a transcription may take. Finished jobs are kept for
+JOBS_RESULT_TTL_SECONDS and the store holds at most JOBS_MAX_STORED jobs,
+oldest finished first to go. Queued jobs are picked in the admission
+controller's order, so short jobs are not stuck behind long ones.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from .admission import admission_controller
+from .config import settings
+from .exceptions import JobNotFound, ServiceOverloaded, WhisperrrException
+from .models import TranscriptionResponse
+from .utils import cleanup_temp_file
+from .whisper_service import whisper_service
+
+logger = logging.getLogger(__name__)
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+
+class Job:
+    """A submitted transcription and its outcome."""
+    
+    def __init__(
+        self,
+        job_id: str,
+        file_path: str,
+        filename: str,
+        file_size: int,
+        params: Dict[str, Any],
+        duration: Optional[float] = None
+    ):
+        self.id = job_id
+        self.file_path = file_path
+        self.filename = filename
+        self.file_size = file_size
+        self.duration = duration
+        # Keyword arguments for WhisperService.transcribe_audio
+        self.params = params
+        self.status = QUEUED
+        self.progress = 0.0
+        self.created_at = time.time()
+        # Scheduling clock, shared with the admission controller
+        self.queued_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Optional[TranscriptionResponse] = None
+        self.error: Optional[Dict[str, Any]] = None
+        self.task: Optional[asyncio.Task] = None
+    
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job has completed, failed or been cancelled."""
+        return self.status in FINISHED_STATES
+    
+    def set_progress(self, fraction: float) -> None:
+        """Record transcription progress (called from worker threads)."""
+        self.progress = round(fraction, 3)
+
+
+class JobManager:
+    """Queue, workers and TTL-bounded store for asynchronous jobs."""
+    
+    def __init__(self, workers: int, queue_depth: int, max_jobs: int, ttl_seconds: float):
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self.max_jobs = max_jobs
+        self.ttl_seconds = ttl_seconds
+        # Submission order, so the oldest finished jobs are evicted first
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+    
+    def start(self) -> None:
+        """Start the worker tasks (call from the running event loop)."""
+        self._queue = asyncio.Queue()
+        self._worker_tasks = [
+            asyncio.ensure_future(self._worker(index))
+            for index in range(self.workers)
+        ]
+        logger.info(f"Started {self.workers} job workers")
+    
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Cancel queued jobs, let running jobs finish and stop the workers.
+        
+        Args:
+            timeout: Seconds to wait for running jobs before cancelling them
+                (None waits for as long as they take)
+        """
+        cancelled = []
+        for job in list(self._jobs.values()):
+            if job.status == QUEUED:
+                self._cancel(job)
+                if job.task is not None:
+                    cancelled.append(job.task)
+        if cancelled:
+            # Jobs waiting for a transcription slot give it up before the workers stop
+            await asyncio.wait(cancelled)
+        
+        running = [job for job in self._jobs.values() if job.status == RUNNING]
+        if running:
+            logger.info(f"Waiting up to {timeout}s for {len(running)} running jobs to finish")
+            await asyncio.wait([job.task for job in running], timeout=timeout)
+            for job in running:
+                if not job.is_finished:
+                    self._cancel(job)
+            await asyncio.wait([job.task for job in running])
+        
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+    
+    def submit(
+        self,
+        file_path: str,
+        filename: str,
+        file_size: int,
+        params: Dict[str, Any],
+        duration: Optional[float] = None
+    ) -> Job:
+        """
+        Queue a transcription job for a stored upload.
+        
+        Args:
+            file_path: Stored upload; the job owns it and deletes it when finished
+            filename: Original file name
+            file_size: Upload size in bytes
+            params: Keyword arguments for WhisperService.transcribe_audio
+            duration: Audio duration in seconds, if known, used to schedule the job
+        
+        Returns:
+            The queued job
+        
+        Raises:
+            ServiceOverloaded: If the job queue or the job store is full
+        """
+        self._evict_expired()
+        
+        queued = sum(1 for job in self._jobs.values() if job.status == QUEUED)
+        if queued >= self.queue_depth or not self._make_room():
+            raise ServiceOverloaded(
+                message="Too many queued jobs, retry later",
+                queue_depth=queued,
+                retry_after_seconds=admission_controller.retry_after_seconds()
+            )
+        
+        job = Job(uuid.uuid4().hex, file_path, filename, file_size, params, duration)
+        self._jobs[job.id] = job
+        self._queue.put_nowait(job)
+        logger.info(f"Queued job {job.id} for {filename} ({queued + 1} queued)")
+        return job
+    
+    def get(self, job_id: str) -> Job:
+        """
+        Look up a job.
+        
+        Raises:
+            JobNotFound: If the job does not exist or has expired
+        """
+        self._evict_expired()
+        
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFound(job_id=job_id)
+        return job
+    
+    async def cancel(self, job_id: str) -> Job:
+        """
+        Cancel an unfinished job, or delete a finished one and its result.
+        
+        Returns:
+            The job in its final state
+        """
+        job = self.get(job_id)
+        if job.is_finished:
+            del self._jobs[job_id]
+        else:
+            self._cancel(job)
+            if job.task is not None:
+                # Let the job record its cancellation before reporting it
+                await asyncio.wait([job.task])
+        return job
+    
+    def queue_position(self, job: Job) -> Optional[int]:
+        """1-based position of a queued job in the order queued jobs will run."""
+        # Jobs already waiting for a transcription slot go before those waiting for a worker
+        queued = self._jobs_awaiting_slot() + self._queued_jobs()
+        if job not in queued:
+            return None
+        return queued.index(job) + 1
+    
+    def estimated_start_seconds(self, job: Job) -> Optional[float]:
+        """Expected seconds until a queued job starts transcribing."""
+        if job in self._jobs_awaiting_slot():
+            # Its turn is up to the admission controller alone
+            return round(admission_controller.estimated_wait_seconds(job.duration, job.queued_at), 1)
+        
+        queued = self._queued_jobs()
+        if job not in queued:
+            return None
+        ahead = [other.duration for other in queued[:queued.index(job)]]
+        return round(admission_controller.estimated_wait_seconds(job.duration, job.queued_at, ahead), 1)
+    
+    def metrics(self) -> Dict[str, int]:
+        """Job counts by state."""
+        counts = {state: 0 for state in (QUEUED, RUNNING) + FINISHED_STATES}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return counts
+    
+    def _cancel(self, job: Job) -> None:
+        """Mark a queued job cancelled, or cancel a running job's task."""
+        if job.status == QUEUED:
+            # The worker skips it when it reaches the front of the queue
+            job.status = CANCELLED
+            job.finished_at = time.time()
+            cleanup_temp_file(job.file_path)
+            if job.task is not None:
+                # Picked by a worker but still waiting for a slot; the task must not run it
+                job.task.cancel()
+        elif job.task is not None:
+            job.task.cancel()
+        logger.info(f"Cancelled job {job.id}")
+    
+    def _queued_jobs(self) -> List[Job]:
+        """Jobs not yet picked up by a worker, in the order they will run."""
+        now = time.monotonic()
+        queued = [job for job in self._jobs.values() if job.status == QUEUED and job.task is None]
+        return sorted(queued, key=lambda job: admission_controller.priority(job.duration, job.queued_at, now))
+    
+    def _jobs_awaiting_slot(self) -> List[Job]:
+        """Jobs picked up by a worker but still waiting for a transcription slot."""
+        now = time.monotonic()
+        waiting = [job for job in self._jobs.values() if job.status == QUEUED and job.task is not None]
+        return sorted(waiting, key=lambda job: admission_controller.priority(job.duration, job.queued_at, now))
+    
+    def _make_room(self) -> bool:
+        """Evict the oldest finished jobs until a new job fits."""
+        if len(self._jobs) < self.max_jobs:
+            return True
+        
+        for job_id, job in list(self._jobs.items()):
+            if job.is_finished:
+                del self._jobs[job_id]
+                if len(self._jobs) < self.max_jobs:
+                    return True
+        return False
+    
+    def _evict_expired(self) -> None:
+        """Drop finished jobs older than the result TTL."""
+        cutoff = time.time() - self.ttl_seconds
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.is_finished and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+    
+    async def _worker(self, index: int) -> None:
+        """Run queued jobs one at a time."""
+        while True:
+            # Each submission wakes a worker; which job runs is up to the schedule
+            await self._queue.get()
+            queued = self._queued_jobs()
+            if not queued:
+                continue
+            
+            job = queued[0]
+            job.task = asyncio.ensure_future(self._run(job))
+            # Wait without propagating the job's own cancellation into the worker
+            await asyncio.wait([job.task])
+    
+    async def _run(self, job: Job) -> None:
+        """Transcribe a job's upload and record the outcome."""
+        try:
+            # Share transcription slots with /transcribe, waiting rather than being rejected;
+            # the job stays queued until it holds a slot
+            async with admission_controller.admit(
+                reject_when_full=False,
+                duration_seconds=job.duration,
+                queued_at=job.queued_at
+            ):
+                job.status = RUNNING
+                job.started_at = time.time()
+                # Jobs exist for transcriptions longer than a request may take
+                job.result = await whisper_service.transcribe_audio(
+                    file_path=job.file_path,
+                    progress_callback=job.set_progress,
+                    timeout_seconds=0,
+                    **job.params
+                )
+            job.status = COMPLETED
+            job.progress = 1.0
+        
+        except asyncio.CancelledError:
+            job.status = CANCELLED
+        except WhisperrrException as e:
+            job.status = FAILED
+            job.error = {"error_type": e.error_code, "message": e.message, "details": e.details}
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}", exc_info=True)
+            job.status = FAILED
+            job.error = {"error_type": "INTERNAL_SERVER_ERROR", "message": "Transcription failed"}
+        
+        finally:
+            job.finished_at = time.time()
+            cleanup_temp_file(job.file_path)
+            if job.started_at is None:
+                logger.info(f"Job {job.id} {job.status} before it started")
+            else:
+                logger.info(f"Job {job.id} {job.status} in {job.finished_at - job.started_at:.2f}s")
+
+
+# Global job manager instance
+job_manager = JobManager(
+    settings.jobs_workers,
+    settings.jobs_queue_depth,
+    settings.jobs_max_stored,
+    settings.jobs_result_ttl_seconds
+)
@@ -0,0 +1,223 @@
+"""
+Long-form transcription: split long audio at silence and transcribe the chunks
+concurrently on a process pool.
+
+Chunks overlap slightly so no speech is lost at a cut. Each chunk "owns" the
+span between its cut points; segments whose midpoint falls outside that span
+are dropped during stitching, and words repeated across a cut are removed.
+"""
+
+import logging
+import re
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from .cpu_topology import available_cpus
+from .utils import VAD_FRAME_SECONDS, WHISPER_SAMPLE_RATE, frame_energy_db
+
+logger = logging.getLogger(__name__)
+
+# Fraction of the chunk length searched on each side of a target cut for silence
+CUT_SEARCH_FRACTION = 0.1
+
+# Maximum number of words compared when removing text repeated across a cut
+MAX_OVERLAP_WORDS = 8
+
+# Default cap on worker processes; each one holds a full copy of the model
+DEFAULT_MAX_WORKERS = 4
+
+# Backend and model loaded once per worker process by _init_worker
+_worker_backend = None
+_worker_model = None
+
+
+class Chunk(NamedTuple):
+    """A slice of the input audio and the span of the timeline it owns."""
+    
+    # Sample range of the chunk, including overlap with its neighbours
+    start: int
+    end: int
+    # Sample range this chunk is responsible for when stitching
+    own_start: int
+    own_end: int
+
+
+def plan_chunks(
+    audio: np.ndarray,
+    sample_rate: int = WHISPER_SAMPLE_RATE,
+    chunk_seconds: float = 120.0,
+    overlap_seconds: float = 2.0
+) -> List[Chunk]:
+    """
+    Split audio into overlapping chunks cut at the quietest nearby frame.
+    
+    Args:
+        audio: Mono float32 audio samples
+        sample_rate: Sample rate of the audio
+        chunk_seconds: Target chunk length in seconds
+        overlap_seconds: Audio shared by neighbouring chunks on each side of a cut
+    
+    Returns:
+        Chunks covering the whole audio, in order
+    """
+    total = len(audio)
+    chunk_length = int(chunk_seconds * sample_rate)
+    if total <= chunk_length:
+        return [Chunk(0, total, 0, total)]
+    
+    energy_db = frame_energy_db(audio, sample_rate)
+    frame_length = int(sample_rate * VAD_FRAME_SECONDS)
+    search = int(chunk_length * CUT_SEARCH_FRACTION) // frame_length
+    
+    # Move each target cut to the lowest-energy frame within the search window
+    cuts = [0]
+    while total - cuts[-1] > chunk_length + search * frame_length:
+        target = (cuts[-1] + chunk_length) // frame_length
+        low = max(target - search, 0)
+        high = min(target + search + 1, len(energy_db))
+        cuts.append((low + int(np.argmin(energy_db[low:high]))) * frame_length)
+    cuts.append(total)
+    
+    overlap = int(overlap_seconds * sample_rate)
+    return [
+        Chunk(max(own_start - overlap, 0), min(own_end + overlap, total), own_start, own_end)
+        for own_start, own_end in zip(cuts[:-1], cuts[1:])
+    ]
+
+
+def _init_worker(backend_name: str, model_size: str, device: str, num_threads: int) -> None:
+    """Load the model once in a pool worker process."""
+    global _worker_backend, _worker_model
+    
+    import torch
+    
+    from .backends import get_backend
+    
+    torch.set_num_threads(num_threads)
+    _worker_backend = get_backend(backend_name)
+    _worker_model = _worker_backend.load(model_size, device, num_threads)
+
+
+def transcribe_chunk(audio: np.ndarray, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Transcribe one chunk with the worker's model (runs in a pool process)."""
+    return _worker_backend.transcribe(_worker_model, audio, options)
+
+
+def default_worker_count(server_workers: int = 1) -> int:
+    """Worker processes per server worker: its share of the CPUs, at most DEFAULT_MAX_WORKERS."""
+    cpu_count, _ = available_cpus()
+    return max(1, min(DEFAULT_MAX_WORKERS, cpu_count // server_workers))
+
+
+def create_worker_pool(
+    backend_name: str,
+    model_size: str,
+    device: str,
+    workers: int,
+    server_workers: int = 1
+):
+    """
+    Create a process pool whose workers each hold a loaded model.
+    
+    Args:
+        backend_name: Inference backend the workers load the model with
+        model_size: Whisper model size to load in every worker
+        device: Device to load the model on
+        workers: Number of worker processes
+        server_workers: Server processes each running their own pool, which share the CPUs
+    
+    Returns:
+        ProcessPoolExecutor ready for transcribe_chunk calls
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    
+    cpu_count, _ = available_cpus()
+    num_threads = max(1, cpu_count // server_workers // workers)
+    
+    logger.info(
+        f"Starting long-form pool: {workers} workers x {num_threads} threads, model {model_size}"
+    )
+    
+    # Spawn rather than fork: torch thread pools do not survive fork safely
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(backend_name, model_size, device, num_threads)
+    )
+
+
+def _normalize_word(word: str) -> str:
+    """Lowercase a word and strip punctuation for overlap comparison."""
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def _drop_repeated_words(previous_text: str, text: str) -> str:
+    """Remove leading words of text that repeat the end of previous_text."""
+    previous = [_normalize_word(w) for w in previous_text.split()][-MAX_OVERLAP_WORDS:]
+    words = text.split()
+    current = [_normalize_word(w) for w in words[:MAX_OVERLAP_WORDS]]
+    
+    for size in range(min(len(previous), len(current)), 0, -1):
+        if previous[-size:] == current[:size]:
+            return " ".join(words[size:])
+    return text
+
+
+def stitch_results(
+    results: List[Dict[str, Any]],
+    chunks: List[Chunk],
+    sample_rate: int = WHISPER_SAMPLE_RATE
+) -> Dict[str, Any]:
+    """
+    Combine per-chunk Whisper results into one result on the full timeline.
+    
+    Args:
+        results: Whisper results, one per chunk, in chunk order
+        chunks: Chunks the results were produced from
+        sample_rate: Sample rate of the audio
+    
+    Returns:
+        Whisper-style result dict with text, segments and language
+    """
+    segments = []
+    
+    for result, chunk in zip(results, chunks):
+        offset = chunk.start / sample_rate
+        own_start = chunk.own_start / sample_rate
+        own_end = chunk.own_end / sample_rate
+        
+        first_in_chunk = True
+        
+        for segment in result.get("segments", []):
+            start = segment.get("start", 0.0) + offset
+            end = segment.get("end", 0.0) + offset
+            
+            # Keep only segments centred in the span this chunk owns
+            if not own_start <= (start + end) / 2 < own_end:
+                continue
+            
+            text = segment.get("text", "").strip()
+            if segments:
+                # Text straddling the cut may be transcribed by both chunks
+                if first_in_chunk:
+                    text = _drop_repeated_words(segments[-1]["text"], text)
+                start = max(start, segments[-1]["end"])
+            first_in_chunk = False
+            if not text or end <= start:
+                continue
+            
+            stitched = dict(segment)
+            stitched.update(id=len(segments), start=round(start, 3), end=round(end, 3), text=text)
+            segments.append(stitched)
+    
+    languages = Counter(r.get("language") for r in results if r.get("language"))
+    
+    return {
+        "text": " ".join(segment["text"] for segment in segments),
+        "segments": segments,
+        "language": languages.most_common(1)[0][0] if languages else None
+    }
@@ -2,14 +2,20 @@
 FastAPI application for the Whisperrr transcription service.
 """
 
+import asyncio
 import logging
 import time
 import uuid
 from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Optional, Tuple
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, Query, Request
+from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import uvicorn
 
 from .config import settings
@@ -17,16 +23,33 @@ from .models import (
     TranscriptionRequest,
     TranscriptionResponse,
     ModelInfoResponse,
+    ModelPoolResponse,
+    MetricsResponse,
+    JobResponse,
     HealthResponse,
     ErrorResponse
 )
 from .whisper_service import whisper_service
-from .exceptions import WhisperrrException
+from .admission import admission_controller
+from .jobs import COMPLETED, Job, job_manager
+from .cancellation import watch_disconnect
+from .exceptions import (
+    FileTooLarge,
+    JobNotCompleted,
+    JobsUnavailable,
+    TranscriptionCancelled,
+    WhisperrrException
+)
 from .utils import (
+    AudioProbe,
+    cleanup_temp_file,
     get_correlation_id,
+    get_file_extension,
     get_memory_usage,
     log_performance_metrics,
-    safe_filename
+    parse_raw_pcm_content_type,
+    safe_filename,
+    save_upload_file
 )
 
 # Configure logging
@@ -36,6 +59,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Endpoints that accept audio uploads
+UPLOAD_PATHS = ("/transcribe", "/jobs")
+
+# Allowance for multipart boundaries and part headers on top of the file itself
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -45,9 +74,15 @@ async def lifespan(app: FastAPI):
     start_time = time.time()
     
     try:
-        # Load default model
-        logger.info(f"Loading default model: {settings.model_size}")
-        await whisper_service.load_model(settings.model_size)
+        # Load default model without holding up the server; readiness reports progress
+        whisper_service.start_background_load(settings.model_size)
+        if settings.jobs_available:
+            job_manager.start()
+        else:
+            logger.warning(
+                f"Asynchronous jobs disabled: jobs are stored per process "
+                f"and SERVER_WORKERS={settings.server_workers}"
+            )
         
         startup_time = time.time() - start_time
         logger.info(f"Service started successfully in {startup_time:.2f}s")
@@ -61,6 +96,8 @@ async def lifespan(app: FastAPI):
     finally:
         # Shutdown
         logger.info("Shutting down Whisperrr transcription service")
+        # Running jobs finish before the process exits, within the server's graceful timeout
+        await job_manager.stop(timeout=settings.server_graceful_timeout_seconds)
         await whisper_service.cleanup()
         logger.info("Service shutdown completed")
 
@@ -83,43 +120,141 @@ app.add_middleware(
 )
 
 
-# Middleware for request logging and correlation IDs
-@app.middleware("http")
-async def logging_middleware(request: Request, call_next):
-    """Middleware for request logging and correlation ID tracking."""
-    correlation_id = get_correlation_id()
-    request.state.correlation_id = correlation_id
+# The middlewares below are plain ASGI rather than @app.middleware("http"):
+# BaseHTTPMiddleware wraps the receive channel, so endpoints behind it never
+# see the client's http.disconnect and could not cancel abandoned work.
+
+class AdmissionMiddleware:
+    """Reject transcription requests with 429 while the admission queue is full."""
     
-    start_time = time.time()
+    def __init__(self, app: ASGIApp):
+        self.app = app
     
-    # Log request
-    logger.info(
-        f"Request started: {request.method} {request.url.path} "
-        f"[{correlation_id}]"
-    )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["method"] == "POST"
+            and scope["path"] == "/transcribe"
+            and admission_controller.is_full()
+        ):
+            request = Request(scope, receive)
+            response = await whisperrr_exception_handler(request, admission_controller.reject())
+            await response(scope, receive, send)
+            return
+        
+        await self.app(scope, receive, send)
+
+
+class UploadSizeMiddleware:
+    """
+    Reject upload requests whose body exceeds the file size limit as it arrives.
     
-    try:
-        response = await call_next(request)
+    Starlette reads the whole multipart body into a spooled temporary file
+    before the endpoint runs, so the limit has to be enforced here: a declared
+    Content-Length over the limit is refused before any of the body is read,
+    and bodies without one are cut off as soon as they pass it.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in UPLOAD_PATHS:
+            await self.app(scope, receive, send)
+            return
         
-        # Log response
-        duration = time.time() - start_time
-        logger.info(
-            f"Request completed: {request.method} {request.url.path} "
-            f"[{correlation_id}] - {response.status_code} - {duration:.3f}s"
-        )
+        # The body is the file plus multipart boundaries and part headers
+        limit = settings.max_file_size_bytes + MULTIPART_OVERHEAD_BYTES
+        content_length = Headers(scope=scope).get("content-length", "")
+        if content_length.isdigit() and int(content_length) > limit:
+            await self._reject(scope, receive, send, int(content_length))
+            return
         
-        # Add correlation ID to response headers
-        response.headers["X-Correlation-ID"] = correlation_id
+        received = 0
+        rejected = False
         
-        return response
+        async def receive_limited() -> Message:
+            nonlocal received, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+            
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Answer now and make the app stop reading as if the client had left
+                    rejected = True
+                    await self._reject(scope, receive, send, received)
+                    return {"type": "http.disconnect"}
+            return message
+        
+        async def send_unless_rejected(message: Message) -> None:
+            if not rejected:
+                await send(message)
+        
+        await self.app(scope, receive_limited, send_unless_rejected)
     
-    except Exception as e:
-        duration = time.time() - start_time
-        logger.error(
-            f"Request failed: {request.method} {request.url.path} "
-            f"[{correlation_id}] - {duration:.3f}s - {str(e)}"
-        )
-        raise
+    async def _reject(self, scope: Scope, receive: Receive, send: Send, size: int) -> None:
+        """Send the 413 response for an oversized body."""
+        request = Request(scope, receive)
+        error = FileTooLarge(file_size=size, max_size=settings.max_file_size_bytes)
+        response = await whisperrr_exception_handler(request, error)
+        await response(scope, receive, send)
+
+
+class LoggingMiddleware:
+    """Middleware for request logging and correlation ID tracking."""
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        correlation_id = get_correlation_id()
+        # Backs request.state for the handlers
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
+        method, path = scope["method"], scope["path"]
+        status_code = None
+        
+        start_time = time.time()
+        
+        # Log request
+        logger.info(f"Request started: {method} {path} [{correlation_id}]")
+        
+        async def send_with_correlation_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add correlation ID to response headers
+                MutableHeaders(scope=message)["X-Correlation-ID"] = correlation_id
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_correlation_id)
+            
+            # Log response
+            duration = time.time() - start_time
+            logger.info(
+                f"Request completed: {method} {path} "
+                f"[{correlation_id}] - {status_code} - {duration:.3f}s"
+            )
+        
+        except Exception as e:
+            duration = time.time() - start_time
+            logger.error(
+                f"Request failed: {method} {path} "
+                f"[{correlation_id}] - {duration:.3f}s - {str(e)}"
+            )
+            raise
+
+
+# Registered innermost first: logging wraps the others, so rejections are logged too
+app.add_middleware(AdmissionMiddleware)
+app.add_middleware(UploadSizeMiddleware)
+app.add_middleware(LoggingMiddleware)
 
 
 # Global exception handler
@@ -140,6 +275,12 @@ async def whisperrr_exception_handler(request: Request, exc: WhisperrrException)
         "INVALID_AUDIO_FORMAT": 400,
         "FILE_TOO_LARGE": 413,
         "MODEL_NOT_LOADED": 503,
+        "SERVICE_OVERLOADED": 429,
+        "JOB_NOT_FOUND": 404,
+        "JOB_NOT_COMPLETED": 409,
+        "JOBS_UNAVAILABLE": 503,
+        "TRANSCRIPTION_TIMEOUT": 504,
+        "TRANSCRIPTION_CANCELLED": 499,
         "TRANSCRIPTION_FAILED": 500,
         "MODEL_LOAD_FAILED": 500,
         "AUDIO_PROCESSING_ERROR": 400,
@@ -148,9 +289,15 @@ async def whisperrr_exception_handler(request: Request, exc: WhisperrrException)
     
     status_code = status_code_map.get(exc.error_code, 500)
     
+    # Tell clients when to come back for errors that are expected to clear
+    headers = None
+    if exc.details.get("retry_after_seconds"):
+        headers = {"Retry-After": str(exc.details["retry_after_seconds"])}
+    
     return JSONResponse(
         status_code=status_code,
-        content=error_response.dict()
+        content=jsonable_encoder(error_response),
+        headers=headers
     )
 
 
@@ -170,7 +317,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     
     return JSONResponse(
         status_code=500,
-        content=error_response.dict()
+        content=jsonable_encoder(error_response)
     )
 
 
@@ -180,10 +327,112 @@ def get_correlation_id_dependency(request: Request) -> str:
     return getattr(request.state, 'correlation_id', str(uuid.uuid4()))
 
 
+async def store_upload(
+    file: UploadFile,
+    model_size: Optional[str],
+    correlation_id: str
+) -> Tuple[str, int, Optional[str]]:
+    """
+    Validate an upload and stream it to the upload directory.
+    
+    Args:
+        file: Uploaded audio file
+        model_size: Requested model size, if any
+        correlation_id: Request correlation ID for logging
+    
+    Returns:
+        Tuple of stored file path, size in bytes and raw PCM sample format (if headerless)
+    """
+    # Validate file
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No file provided")
+    
+    # Create safe filename
+    safe_name = safe_filename(file.filename)
+    logger.info(f"Processing file: {safe_name} [{correlation_id}]")
+    
+    # Validate file size
+    if file.size and file.size > settings.max_file_size_bytes:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size: {settings.max_file_size_mb}MB"
+        )
+    
+    # Validate requested model size before it can trigger a pool load
+    if model_size and model_size not in settings.available_model_sizes:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid model size. Available: {settings.available_model_sizes}"
+        )
+    
+    # Headerless 16kHz mono PCM is identified by its content type
+    raw_pcm_format = parse_raw_pcm_content_type(file.content_type)
+    
+    # Stream upload to the upload directory in bounded chunks
+    temp_file_path, file_size = await save_upload_file(
+        file,
+        suffix="pcm" if raw_pcm_format else get_file_extension(safe_name)
+    )
+    return temp_file_path, file_size, raw_pcm_format
+
+
+async def probe_upload(file_path: str, raw_pcm_format: Optional[str]) -> Tuple[AudioProbe, Optional[float]]:
+    """
+    Probe an upload once, reading its duration for scheduling before it is queued.
+    
+    The probe is handed on to the transcription so the headers are not parsed again.
+    
+    Returns:
+        Tuple of the probe and the duration in seconds, or None if it cannot
+        be determined here (the transcription itself reports invalid audio)
+    """
+    probe = AudioProbe(file_path, raw_pcm_format=raw_pcm_format)
+    try:
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, probe.probe)
+        return probe, probe.duration
+    except WhisperrrException:
+        return probe, None
+
+
+def require_jobs() -> None:
+    """
+    Refuse job requests when more than one server worker is running.
+    
+    Jobs are kept in the memory of the worker that accepted them, so polls
+    routed to any other worker would report them missing.
+    """
+    if not settings.jobs_available:
+        raise JobsUnavailable(server_workers=settings.server_workers)
+
+
+def job_response(job: Job) -> JobResponse:
+    """Build the API view of a job."""
+    def timestamp(seconds: Optional[float]) -> Optional[datetime]:
+        return datetime.fromtimestamp(seconds) if seconds is not None else None
+    
+    return JobResponse(
+        job_id=job.id,
+        status=job.status,
+        progress=job.progress,
+        filename=job.filename,
+        model_size=job.params.get("model_size"),
+        duration=job.duration,
+        queue_position=job_manager.queue_position(job),
+        estimated_start_seconds=job_manager.estimated_start_seconds(job),
+        created_at=timestamp(job.created_at),
+        started_at=timestamp(job.started_at),
+        finished_at=timestamp(job.finished_at),
+        error=job.error
+    )
+
+
 # API Endpoints
 
 @app.post("/transcribe", response_model=TranscriptionResponse)
 async def transcribe_audio(
+    request: Request,
+    response: Response,
     file: UploadFile = File(..., description="Audio file to transcribe"),
     model_size: str = Query(None, description="Model size to use"),
     language: str = Query(None, description="Language hint (ISO 639-1)"),
@@ -195,73 +444,150 @@ async def transcribe_audio(
     Transcribe an audio file using Whisper.
     
     Supports multiple audio formats and provides detailed transcription results
-    with timing information and confidence scores.
+    with timing information and confidence scores. Headerless 16kHz mono PCM
+    can be uploaded with content type audio/x-pcm-s16le or audio/x-pcm-f32le.
+    Transcriptions past REQUEST_TIMEOUT_SECONDS get a 504, and decoding stops
+    if the client disconnects. When every slot is busy, shorter files are
+    scheduled ahead of longer ones; the expected and actual wait for a slot
+    are returned in the X-Expected-Queue-Wait-Seconds and X-Queue-Wait-Seconds
+    headers.
     """
     start_time = time.time()
     
     try:
-        # Validate file
-        if not file.filename:
-            raise HTTPException(status_code=400, detail="No file provided")
-        
-        # Create safe filename
-        safe_name = safe_filename(file.filename)
-        logger.info(f"Processing file: {safe_name} [{correlation_id}]")
-        
-        # Validate file size
-        if file.size and file.size > settings.max_file_size_bytes:
-            raise HTTPException(
-                status_code=413,
-                detail=f"File too large. Maximum size: {settings.max_file_size_mb}MB"
-            )
-        
-        # Create temporary file
-        import tempfile
-        import os
-        
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{safe_name.split('.')[-1]}") as temp_file:
-            # Write uploaded file to temporary location
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        temp_file_path, file_size, raw_pcm_format = await store_upload(file, model_size, correlation_id)
         
         try:
-            # Transcribe audio
-            result = await whisper_service.transcribe_audio(
-                file_path=temp_file_path,
-                model_size=model_size,
-                language=language,
-                temperature=temperature,
-                task=task
-            )
+            probe, duration = await probe_upload(temp_file_path, raw_pcm_format)
+            
+            # Wait for a transcription slot, or get a 429 if the queue is full
+            async with admission_controller.admit(duration_seconds=duration) as admission:
+                if admission.wait_seconds > 1:
+                    logger.info(
+                        f"Queued {admission.wait_seconds:.2f}s for a transcription slot, "
+                        f"expected {admission.expected_wait_seconds:.2f}s [{correlation_id}]"
+                    )
+                response.headers["X-Expected-Queue-Wait-Seconds"] = f"{admission.expected_wait_seconds:.1f}"
+                response.headers["X-Queue-Wait-Seconds"] = f"{admission.wait_seconds:.1f}"
+                
+                transcription = asyncio.ensure_future(whisper_service.transcribe_audio(
+                    file_path=temp_file_path,
+                    model_size=model_size,
+                    language=language,
+                    temperature=temperature,
+                    task=task,
+                    raw_pcm_format=raw_pcm_format,
+                    probe=probe
+                ))
+                # Stop decoding if the client goes away
+                watcher = asyncio.ensure_future(watch_disconnect(
+                    request, transcription, settings.disconnect_poll_interval_seconds
+                ))
+                try:
+                    result = await transcription
+                except asyncio.CancelledError:
+                    if not watcher.done():
+                        raise
+                    raise TranscriptionCancelled(reason="client disconnected")
+                finally:
+                    watcher.cancel()
             
             # Log performance metrics
             duration = time.time() - start_time
             log_performance_metrics(
                 operation="api_transcription",
                 duration=duration,
-                file_size=file.size,
+                file_size=file_size,
                 memory_usage=get_memory_usage(),
                 correlation_id=correlation_id,
-                model_size=model_size or whisper_service.get_current_model_size()
+                model_size=result.model_used
             )
             
             return result
         
         finally:
             # Cleanup temporary file
-            try:
-                os.unlink(temp_file_path)
-            except Exception as e:
-                logger.warning(f"Failed to cleanup temp file {temp_file_path}: {e}")
+            cleanup_temp_file(temp_file_path)
     
-    except HTTPException:
+    except (HTTPException, WhisperrrException):
         raise
     except Exception as e:
         logger.error(f"Transcription failed [{correlation_id}]: {e}")
         raise HTTPException(status_code=500, detail="Transcription failed")
 
 
+@app.post("/jobs", response_model=JobResponse, status_code=202, dependencies=[Depends(require_jobs)])
+async def submit_job(
+    file: UploadFile = File(..., description="Audio file to transcribe"),
+    model_size: str = Query(None, description="Model size to use"),
+    language: str = Query(None, description="Language hint (ISO 639-1)"),
+    temperature: float = Query(0.0, ge=0.0, le=1.0, description="Temperature for sampling"),
+    task: str = Query("transcribe", description="Task: transcribe or translate"),
+    correlation_id: str = Depends(get_correlation_id_dependency)
+):
+    """
+    Queue an audio file for transcription and return immediately.
+    
+    Poll GET /jobs/{job_id} for status and progress, then fetch the
+    transcription from GET /jobs/{job_id}/result.
+    """
+    temp_file_path, file_size, raw_pcm_format = await store_upload(file, model_size, correlation_id)
+    
+    try:
+        probe, duration = await probe_upload(temp_file_path, raw_pcm_format)
+        job = job_manager.submit(
+            temp_file_path,
+            safe_filename(file.filename),
+            file_size,
+            {
+                "model_size": model_size,
+                "language": language,
+                "temperature": temperature,
+                "task": task,
+                "raw_pcm_format": raw_pcm_format,
+                "probe": probe
+            },
+            duration=duration
+        )
+    except Exception:
+        cleanup_temp_file(temp_file_path)
+        raise
+    
+    logger.info(f"Submitted job {job.id} [{correlation_id}]")
+    return JSONResponse(
+        status_code=202,
+        content=jsonable_encoder(job_response(job)),
+        headers={"Location": f"/jobs/{job.id}", "Retry-After": str(settings.jobs_poll_interval_seconds)}
+    )
+
+
+@app.get("/jobs/{job_id}", response_model=JobResponse, dependencies=[Depends(require_jobs)])
+async def get_job(job_id: str):
+    """Get a job's status and progress."""
+    return job_response(job_manager.get(job_id))
+
+
+@app.get("/jobs/{job_id}/result", response_model=TranscriptionResponse, dependencies=[Depends(require_jobs)])
+async def get_job_result(job_id: str):
+    """Get a completed job's transcription; 409 while it is queued, running, failed or cancelled."""
+    job = job_manager.get(job_id)
+    if job.status != COMPLETED:
+        raise JobNotCompleted(
+            message=f"Job is {job.status}",
+            job_id=job.id,
+            status=job.status,
+            error=job.error,
+            retry_after_seconds=None if job.is_finished else settings.jobs_poll_interval_seconds
+        )
+    return job.result
+
+
+@app.delete("/jobs/{job_id}", response_model=JobResponse, dependencies=[Depends(require_jobs)])
+async def delete_job(job_id: str):
+    """Cancel a queued or running job, or delete a finished job and its result."""
+    return job_response(await job_manager.cancel(job_id))
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
@@ -273,12 +599,71 @@ async def health_check():
     )
 
 
+@app.get("/health/live", response_model=HealthResponse)
+async def liveness_check():
+    """Liveness probe: the process is up and serving HTTP, whether or not a model is loaded."""
+    return HealthResponse(
+        status="alive",
+        model_loaded=whisper_service.is_model_loaded(),
+        model_size=whisper_service.get_current_model_size(),
+        uptime=round(whisper_service.get_uptime(), 2)
+    )
+
+
+@app.get("/health/ready", response_model=HealthResponse)
+async def readiness_check():
+    """Readiness probe: 200 once the default model can serve requests, 503 until then."""
+    if whisper_service.is_model_loaded():
+        status = "ready"
+    elif whisper_service.is_model_loading():
+        status = "loading"
+    else:
+        status = "unavailable"
+    
+    health = HealthResponse(
+        status=status,
+        model_loaded=whisper_service.is_model_loaded(),
+        model_size=whisper_service.get_current_model_size(),
+        uptime=round(whisper_service.get_uptime(), 2)
+    )
+    
+    if not health.model_loaded:
+        return JSONResponse(
+            status_code=503,
+            content=jsonable_encoder(health),
+            headers={"Retry-After": str(settings.model_loading_retry_after_seconds)}
+        )
+    
+    return health
+
+
+@app.get("/metrics", response_model=MetricsResponse)
+async def get_metrics():
+    """Get admission queue depth, wait times, throughput and silence skipped by VAD."""
+    if not settings.enable_metrics:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    
+    return MetricsResponse(
+        uptime=round(whisper_service.get_uptime(), 2),
+        memory_usage_mb=get_memory_usage(),
+        admission=admission_controller.metrics(),
+        jobs=job_manager.metrics(),
+        vad=whisper_service.get_vad_metrics()
+    )
+
+
 @app.get("/model/info", response_model=ModelInfoResponse)
 async def get_model_info():
     """Get information about the currently loaded model."""
     return whisper_service.get_model_info()
 
 
+@app.get("/model/pool", response_model=ModelPoolResponse)
+async def get_model_pool():
+    """Get the models resident in the pool and their memory use."""
+    return whisper_service.get_pool_info()
+
+
 @app.post("/model/load/{model_size}")
 async def load_model(model_size: str):
     """Load a specific Whisper model size."""
@@ -295,6 +680,8 @@ async def load_model(model_size: str):
         return {
             "success": True,
             "model_size": model_size,
+            "load_time_seconds": result["load_time_seconds"],
+            "warmup_time_seconds": result["warmup_time_seconds"],
             "message": f"Model {model_size} loaded successfully"
         }
     
@@ -310,7 +697,7 @@ async def load_model(model_size: str):
 
 
 if __name__ == "__main__":
-    # Run the application
+    # Development server with auto-reload; production runs app.server
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
@@ -0,0 +1,284 @@
+"""
+Resident pool of loaded Whisper models with memory-budgeted LRU eviction.
+
+Models are keyed by size. When the estimated memory of all resident models
+exceeds the budget, the least recently used models are dropped until the
+pool fits again. The pinned model (the service's default) and the model just
+added are never evicted, so a single model larger than the budget still stays
+resident.
+
+Requests hold an immutable ModelHandle for their whole lifetime. A model in
+use by any request is never evicted; once its last handle is released the
+pool is trimmed back under budget.
+
+Model copies held outside the pool, such as the long-form worker processes,
+are counted against the same budget through reservations.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _tensor_bytes(value: Any) -> int:
+    """Bytes held by a tensor, or by the tensors in a (nested) tuple or list."""
+    if isinstance(value, (tuple, list)):
+        return sum(_tensor_bytes(item) for item in value)
+    if hasattr(value, "numel") and hasattr(value, "element_size"):
+        return value.numel() * value.element_size()
+    return 0
+
+
+def estimate_model_memory_mb(model: Any) -> float:
+    """
+    Estimate the memory held by a model's weights and buffers.
+    
+    The state dict is used when available because dynamically quantized
+    layers keep their int8 weights in packed params rather than parameters.
+    
+    Args:
+        model: torch.nn.Module (or any object exposing parameters/buffers)
+    
+    Returns:
+        Estimated size in MB (0.0 if the model exposes no tensors)
+    """
+    if hasattr(model, "state_dict"):
+        total_bytes = sum(_tensor_bytes(value) for value in model.state_dict().values())
+    else:
+        total_bytes = 0
+        for attr in ("parameters", "buffers"):
+            tensors = getattr(model, attr, None)
+            if tensors is None:
+                continue
+            for tensor in tensors():
+                total_bytes += _tensor_bytes(tensor)
+    return round(total_bytes / (1024 * 1024), 2)
+
+
+class ModelHandle(NamedTuple):
+    """Immutable reference to a loaded model, held by one request."""
+    
+    model_size: str
+    model: Any
+    memory_mb: float
+    loaded_at: float
+    warmup_seconds: float = 0.0
+    backend: str = "openai-whisper"
+
+
+class PooledModel:
+    """A resident model and its bookkeeping."""
+    
+    def __init__(self, handle: ModelHandle):
+        self.handle = handle
+        self.last_used = handle.loaded_at
+        self.use_count = 0
+        # Handles currently held by in-flight requests
+        self.refs = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Describe the pooled model for the pool endpoint."""
+        return {
+            "model_size": self.handle.model_size,
+            "memory_mb": self.handle.memory_mb,
+            "loaded_at": datetime.fromtimestamp(self.handle.loaded_at),
+            "warmup_seconds": self.handle.warmup_seconds,
+            "backend": self.handle.backend,
+            "last_used": datetime.fromtimestamp(self.last_used),
+            "use_count": self.use_count,
+            "in_use": self.refs
+        }
+
+
+class ModelPool:
+    """
+    Thread-safe LRU pool of loaded models under a memory budget.
+    
+    Entries are kept in least- to most-recently-used order.
+    """
+    
+    def __init__(self, memory_budget_mb: float):
+        self.memory_budget_mb = memory_budget_mb
+        self._models = OrderedDict()
+        # Memory held outside the pool, by name
+        self._reserved: Dict[str, float] = {}
+        self._pinned = None
+        self._lock = threading.Lock()
+    
+    def pin(self, model_size: str) -> None:
+        """Exempt one model size from eviction, replacing any previous pin."""
+        with self._lock:
+            self._pinned = model_size
+    
+    def acquire(self, model_size: str) -> Optional[ModelHandle]:
+        """
+        Take a handle on a resident model and mark it as most recently used.
+        
+        The model cannot be evicted until the handle is passed to release().
+        
+        Args:
+            model_size: Model size to look up
+        
+        Returns:
+            Handle on the loaded model, or None if it is not resident
+        """
+        with self._lock:
+            entry = self._models.get(model_size)
+            if entry is None:
+                return None
+            
+            self._models.move_to_end(model_size)
+            entry.last_used = time.time()
+            entry.use_count += 1
+            entry.refs += 1
+            return entry.handle
+    
+    def release(self, handle: ModelHandle) -> List[str]:
+        """
+        Give back a handle taken with acquire().
+        
+        Args:
+            handle: Handle returned by acquire()
+        
+        Returns:
+            Sizes of models evicted now that they are no longer in use
+        """
+        with self._lock:
+            entry = self._models.get(handle.model_size)
+            if entry is None or entry.handle is not handle:
+                return []
+            
+            entry.refs -= 1
+            evicted = self._evict_over_budget()
+        
+        if evicted:
+            logger.info(f"Evicted models from pool after release: {evicted}")
+        return evicted
+    
+    def peek(self, model_size: str) -> Optional[ModelHandle]:
+        """Get a resident model's handle without using or holding it."""
+        with self._lock:
+            entry = self._models.get(model_size)
+            return entry.handle if entry is not None else None
+    
+    def add(
+        self,
+        model_size: str,
+        model: Any,
+        warmup_seconds: float = 0.0,
+        backend: str = "openai-whisper",
+        memory_mb: Optional[float] = None
+    ) -> List[str]:
+        """
+        Add a loaded model, evicting least recently used models over budget.
+        
+        Args:
+            model_size: Size the model is registered under
+            model: The loaded model
+            warmup_seconds: Time spent warming the model up before it was added
+            backend: Inference backend the model was loaded with
+            memory_mb: Memory held by the model (estimated from its weights if omitted)
+        
+        Returns:
+            Sizes of the models that were evicted
+        """
+        if memory_mb is None:
+            memory_mb = estimate_model_memory_mb(model)
+        handle = ModelHandle(model_size, model, memory_mb, time.time(), warmup_seconds, backend)
+        
+        with self._lock:
+            if model_size in self._models:
+                # Never replace a resident model that requests may hold handles on
+                logger.warning(f"Model {model_size} is already in the pool; keeping the resident copy")
+                return []
+            
+            self._models[model_size] = PooledModel(handle)
+            evicted = self._evict_over_budget(keep=model_size)
+        
+        logger.info(
+            f"Model {model_size} added to pool ({handle.memory_mb} MB), "
+            f"pool uses {self.used_memory_mb} of {self.memory_budget_mb} MB"
+        )
+        if evicted:
+            logger.info(f"Evicted models from pool: {evicted}")
+        return evicted
+    
+    def reserve(self, name: str, memory_mb: float) -> bool:
+        """
+        Count memory held outside the pool against the budget.
+        
+        Idle models are evicted to make room. Nothing is evicted or reserved
+        if the reservation cannot fit even then.
+        
+        Args:
+            name: Name of the reservation (replaces an earlier one of the same name)
+            memory_mb: Memory to reserve in MB
+        
+        Returns:
+            Whether the memory was reserved
+        """
+        with self._lock:
+            self._reserved.pop(name, None)
+            evictable = sum(
+                entry.handle.memory_mb for model_size, entry in self._models.items()
+                if model_size != self._pinned and entry.refs == 0
+            )
+            if self._used_memory_mb() - evictable + memory_mb > self.memory_budget_mb:
+                return False
+            
+            self._reserved[name] = memory_mb
+            evicted = self._evict_over_budget()
+        
+        logger.info(f"Reserved {memory_mb} MB for {name}, pool uses {self.used_memory_mb} of {self.memory_budget_mb} MB")
+        if evicted:
+            logger.info(f"Evicted models from pool: {evicted}")
+        return True
+    
+    def unreserve(self, name: str) -> None:
+        """Release memory reserved with reserve()."""
+        with self._lock:
+            self._reserved.pop(name, None)
+    
+    def _evict_over_budget(self, keep: Optional[str] = None) -> List[str]:
+        """Drop least recently used idle models until the pool fits the budget (lock held)."""
+        evicted = []
+        for model_size, entry in list(self._models.items()):
+            if self._used_memory_mb() <= self.memory_budget_mb:
+                break
+            if model_size in (keep, self._pinned) or entry.refs > 0:
+                continue
+            del self._models[model_size]
+            evicted.append(model_size)
+        return evicted
+    
+    def clear(self) -> None:
+        """Drop every resident model and reservation."""
+        with self._lock:
+            self._models.clear()
+            self._reserved.clear()
+    
+    def __contains__(self, model_size: str) -> bool:
+        """Check whether a model size is resident."""
+        with self._lock:
+            return model_size in self._models
+    
+    @property
+    def used_memory_mb(self) -> float:
+        """Estimated memory of all resident models and reservations in MB."""
+        with self._lock:
+            return self._used_memory_mb()
+    
+    def _used_memory_mb(self) -> float:
+        """Estimated memory of all resident models and reservations in MB (lock held)."""
+        models = sum(e.handle.memory_mb for e in self._models.values())
+        return round(models + sum(self._reserved.values()), 2)
+    
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Describe resident models, most recently used first."""
+        with self._lock:
+            return [entry.to_dict() for entry in reversed(self._models.values())]
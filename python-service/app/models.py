@@ -80,6 +80,22 @@ class TranscriptionResponse(BaseModel):
     )
     model_used: str = Field(description="Whisper model size used")
     processing_time: float = Field(description="Processing time in seconds")
+    skipped_audio_ratio: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of the audio skipped as silence before inference"
+    )
+
+
+class ThreadLayoutInfo(BaseModel):
+    """CPU and torch thread layout used by transcription workers."""
+    
+    cpus: int = Field(description="CPUs available to the process")
+    cpu_source: str = Field(description="Where the CPU limit came from (cgroup, affinity or os)")
+    workers: int = Field(description="Concurrent transcription workers")
+    intra_op_threads: int = Field(description="torch intra-op threads per worker")
+    inter_op_threads: int = Field(description="torch inter-op threads")
 
 
 class ModelInfoResponse(BaseModel):
@@ -88,9 +104,104 @@ class ModelInfoResponse(BaseModel):
     model_size: str = Field(description="Current model size")
     memory_usage_mb: float = Field(description="Model memory usage in MB")
     load_time_seconds: float = Field(description="Model load time in seconds")
+    warmup_time_seconds: Optional[float] = Field(
+        default=None,
+        description="Time spent on warm-up inference when the model was loaded"
+    )
     supported_languages: List[str] = Field(description="Supported languages")
     is_loaded: bool = Field(description="Whether model is currently loaded")
     last_loaded: Optional[datetime] = Field(description="When model was last loaded")
+    backend: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Inference backend, device and compute type of the model"
+    )
+    thread_layout: Optional[ThreadLayoutInfo] = Field(
+        default=None,
+        description="CPU and thread layout of the transcription workers"
+    )
+
+
+class PooledModelInfo(BaseModel):
+    """A model resident in the model pool."""
+    
+    model_size: str = Field(description="Model size")
+    memory_mb: float = Field(description="Estimated model memory in MB")
+    loaded_at: datetime = Field(description="When the model was loaded")
+    warmup_seconds: float = Field(description="Time spent on warm-up inference at load")
+    backend: str = Field(description="Inference backend serving the model")
+    last_used: datetime = Field(description="When the model was last used")
+    use_count: int = Field(description="Requests served since the model was loaded")
+    in_use: int = Field(description="In-flight requests holding the model")
+
+
+class ModelPoolResponse(BaseModel):
+    """Response model for the resident model pool."""
+    
+    default_model: Optional[str] = Field(description="Model used when a request names no size")
+    memory_budget_mb: float = Field(description="Memory budget for resident models in MB")
+    used_memory_mb: float = Field(description="Estimated memory of resident models in MB")
+    models: List[PooledModelInfo] = Field(description="Resident models, most recently used first")
+
+
+class JobResponse(BaseModel):
+    """Response model for an asynchronous transcription job."""
+    
+    job_id: str = Field(description="Job identifier")
+    status: str = Field(description="queued, running, completed, failed or cancelled")
+    progress: float = Field(ge=0.0, le=1.0, description="Fraction of the audio transcribed so far")
+    filename: str = Field(description="Uploaded file name")
+    model_size: Optional[str] = Field(default=None, description="Requested model size")
+    duration: Optional[float] = Field(default=None, description="Audio duration in seconds, from the file header")
+    queue_position: Optional[int] = Field(default=None, description="Position among queued jobs (1 = next)")
+    estimated_start_seconds: Optional[float] = Field(
+        default=None,
+        description="Expected seconds until a queued job starts, from its duration and the recent throughput"
+    )
+    created_at: datetime = Field(description="When the job was submitted")
+    started_at: Optional[datetime] = Field(default=None, description="When transcription started")
+    finished_at: Optional[datetime] = Field(default=None, description="When the job finished")
+    error: Optional[Dict[str, Any]] = Field(default=None, description="Failure details for failed jobs")
+
+
+class AdmissionMetrics(BaseModel):
+    """Admission queue state and throughput."""
+    
+    max_concurrent: int = Field(description="Transcriptions allowed to run at once")
+    queue_capacity: int = Field(description="Requests allowed to wait for a slot")
+    scheduling: str = Field(description="Order waiting requests get slots in (sjf or fifo)")
+    reserved_short_slots: int = Field(description="Slots only short requests may use")
+    running: int = Field(description="Transcriptions running now")
+    running_long: int = Field(description="Running transcriptions longer than the short threshold")
+    queue_depth: int = Field(description="Requests waiting for a slot now")
+    admitted_total: int = Field(description="Requests admitted since startup")
+    rejected_total: int = Field(description="Requests rejected with 429 since startup")
+    completed_total: int = Field(description="Admitted requests that finished successfully since startup")
+    failed_total: int = Field(description="Admitted requests that failed or timed out since startup")
+    cancelled_total: int = Field(description="Admitted requests cancelled (client gone or job cancelled) since startup")
+    avg_wait_seconds: float = Field(description="Moving average of time spent queued")
+    max_wait_seconds: float = Field(description="Longest time spent queued since startup")
+    avg_service_seconds: Optional[float] = Field(description="Moving average of time holding a slot")
+    avg_real_time_factor: Optional[float] = Field(description="Moving average of service seconds per second of audio")
+    estimated_wait_seconds: float = Field(description="Expected queue wait for a request arriving now")
+
+
+class VadMetrics(BaseModel):
+    """Silence skipped by voice activity detection."""
+    
+    enabled: bool = Field(description="Whether silence is skipped before inference")
+    audio_seconds_total: float = Field(description="Audio passed through VAD since startup")
+    speech_seconds_total: float = Field(description="Audio kept as speech and sent to the model since startup")
+    skipped_seconds_total: float = Field(description="Audio skipped as silence since startup")
+
+
+class MetricsResponse(BaseModel):
+    """Response model for service metrics."""
+    
+    uptime: float = Field(description="Service uptime in seconds")
+    memory_usage_mb: float = Field(description="Process memory usage in MB")
+    admission: AdmissionMetrics = Field(description="Admission queue metrics")
+    jobs: Dict[str, int] = Field(description="Asynchronous jobs by status")
+    vad: VadMetrics = Field(description="Silence skipped by voice activity detection")
 
 
 class HealthResponse(BaseModel):
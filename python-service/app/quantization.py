@@ -0,0 +1,173 @@
+"""
+Dynamic int8 quantization of Whisper models for CPU inference.
+
+Linear layers are converted to int8 weights with activations quantized on
+the fly; convolutions, layer norms and embeddings stay in fp32. Quantized
+weights are cached on disk per model size, upstream checkpoint and torch
+version, so a reload (including after pool eviction) reads the smaller int8
+state dict into an uninitialised model instead of loading fp32 weights and
+quantizing again.
+"""
+
+import logging
+import os
+import time
+from typing import Any, Dict
+
+from .checkpoints import cached_checkpoint_path, load_mapped_model, non_persistent_buffers, restore_buffers
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def quantize_dynamic_int8(model: Any) -> Any:
+    """
+    Apply dynamic int8 quantization to a Whisper model's linear layers.
+    
+    Whisper uses its own nn.Linear subclass (casting weights to the input
+    dtype for fp16); quantize_dynamic only matches exact module types, so
+    those layers are switched back to plain nn.Linear first. On CPU the
+    forward pass is identical.
+    
+    Args:
+        model: fp32 Whisper model on CPU
+    
+    Returns:
+        Quantized model in eval mode
+    """
+    import torch
+    
+    for module in model.modules():
+        if isinstance(module, torch.nn.Linear) and type(module) is not torch.nn.Linear:
+            module.__class__ = torch.nn.Linear
+    
+    model.eval()
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _cache_variant() -> str:
+    """Cache file variant for int8 weights; packed layouts differ between torch versions."""
+    import torch
+    
+    torch_version = torch.__version__.split("+")[0]
+    return f"int8-torch{torch_version}"
+
+
+def _build_quantized_model(checkpoint: Dict[str, Any]) -> Any:
+    """
+    Rebuild an int8 Whisper model from cached dimensions, weights and buffers.
+    
+    The model is built on the meta device and its linear layers are replaced
+    by empty dynamically quantized ones, so no fp32 weights are allocated,
+    initialised or quantized; loading the state dict assigns the cached
+    tensors in place.
+    """
+    import torch
+    from torch.ao.nn.quantized.dynamic import Linear as DynamicQuantizedLinear
+    from whisper.model import ModelDimensions, Whisper
+    
+    with torch.device("meta"):
+        model = Whisper(ModelDimensions(**checkpoint["dims"]))
+    
+    for name, module in list(model.named_modules()):
+        if isinstance(module, torch.nn.Linear):
+            parent_name, _, child_name = name.rpartition(".")
+            quantized = DynamicQuantizedLinear(
+                module.in_features,
+                module.out_features,
+                bias_=module.bias is not None,
+                dtype=torch.qint8
+            )
+            setattr(model.get_submodule(parent_name), child_name, quantized)
+    
+    model.load_state_dict(checkpoint["state_dict"], assign=True)
+    restore_buffers(model, checkpoint["buffers"], checkpoint["sparse_buffers"])
+    return model.eval()
+
+
+def load_quantized_model(model_size: str, cache_dir: str) -> Any:
+    """
+    Load an int8 Whisper model from the disk cache, building it on a miss.
+    
+    Only tensors and model dimensions are cached, never pickled modules, so
+    the cache is read with torch.load(weights_only=True). Sizes without an
+    official checkpoint are quantized on every load.
+    
+    Args:
+        model_size: Whisper model size
+        cache_dir: Directory holding quantized models
+    
+    Returns:
+        Dynamically quantized Whisper model on CPU
+    """
+    import dataclasses
+    import torch
+    import whisper
+    
+    path = cached_checkpoint_path(model_size, cache_dir, _cache_variant())
+    if path is None:
+        logger.warning(f"No official checkpoint for {model_size}; quantizing without the disk cache")
+        return quantize_dynamic_int8(whisper.load_model(model_size, device="cpu"))
+    
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    
+    if os.path.exists(path):
+        try:
+            checkpoint = torch.load(path, map_location="cpu", weights_only=True)
+            model = _build_quantized_model(checkpoint)
+            logger.info(f"Loaded quantized model {model_size} from cache: {path}")
+            return model
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable quantized model cache {path}: {e}")
+    
+    start_time = time.time()
+    model = quantize_dynamic_int8(whisper.load_model(model_size, device="cpu"))
+    logger.info(f"Quantized model {model_size} to int8 in {time.time() - start_time:.2f}s")
+    
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        buffers, sparse_buffers = non_persistent_buffers(model)
+        checkpoint = {
+            "dims": dataclasses.asdict(model.dims),
+            "state_dict": model.state_dict(),
+            "buffers": buffers,
+            "sparse_buffers": sparse_buffers
+        }
+        # Write to a temporary name so concurrent loaders never read a partial file
+        torch.save(checkpoint, tmp_path)
+        os.replace(tmp_path, path)
+        logger.info(f"Cached quantized model {model_size}: {path}")
+    except Exception as e:
+        logger.warning(f"Could not cache quantized model {model_size}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    return model
+
+
+def load_whisper_model(model_size: str, device: str, quantization: str = "none") -> Any:
+    """
+    Load a Whisper model, quantized if requested and supported on the device.
+    
+    Unquantized models are memory-mapped from converted checkpoints when
+    MODEL_MMAP_ENABLED is set.
+    
+    Args:
+        model_size: Whisper model size
+        device: Device to load the model on
+        quantization: 'none' or 'int8' (int8 applies to CPU only)
+    
+    Returns:
+        Loaded Whisper model
+    """
+    import whisper
+    
+    if quantization == "int8":
+        if device == "cpu":
+            return load_quantized_model(model_size, settings.model_cache_dir)
+        logger.warning(f"int8 quantization is CPU-only; loading {model_size} unquantized on {device}")
+    
+    if settings.model_mmap_enabled:
+        return load_mapped_model(model_size, device, settings.model_cache_dir)
+    
+    return whisper.load_model(model_size, device=device)
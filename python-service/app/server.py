@@ -0,0 +1,103 @@
+"""
+Production server for the Whisperrr FastAPI service.
+
+Runs gunicorn with uvicorn workers (uvloop event loop, httptools parser).
+The app and the default model are loaded once in the gunicorn master
+process; workers are forked from it and share the model weights
+copy-on-write, so N workers use little more memory than one. Python-side
+decoding holds the GIL, so separate processes are what let throughput
+scale with cores.
+
+To keep the shared pages shared, the garbage collector is disabled while
+the app loads and everything allocated so far is frozen before each fork.
+Otherwise a collection in a worker would write to the reference-tracking
+headers of every inherited object and copy their pages. Workers are
+recycled after SERVER_MAX_REQUESTS requests (with jitter so they do not all
+restart together). A recycled worker finishes in-flight requests and
+running jobs within SERVER_GRACEFUL_TIMEOUT_SECONDS and its replacement is
+forked from the preloaded master.
+
+Usage (from the python-service directory):
+    python -m app.server
+"""
+
+import gc
+import logging
+import os
+
+# Check for CUDA through NVML so the master can fork after probing the device
+os.environ.setdefault("PYTORCH_NVML_BASED_CUDA_CHECK", "1")
+
+from gunicorn.app.base import BaseApplication
+from uvicorn.workers import UvicornWorker
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class WhisperrrUvicornWorker(UvicornWorker):
+    """Uvicorn worker using uvloop and httptools."""
+    
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}
+
+
+def freeze_before_fork(server, worker) -> None:
+    """gunicorn pre_fork hook: move the master's objects out of the collector's reach."""
+    gc.freeze()
+
+
+class WhisperrrServer(BaseApplication):
+    """gunicorn application that preloads the model in the master process."""
+    
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+    
+    def load_config(self) -> None:
+        """Apply the options to gunicorn's settings."""
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+    
+    def load(self):
+        """Import the app and preload the default model (runs once, in the master)."""
+        # Avoid collections leaving freed holes in pages the workers will share
+        gc.disable()
+        try:
+            from .main import app
+            from .whisper_service import whisper_service
+            
+            if settings.server_preload_model:
+                whisper_service.preload_model(settings.model_size)
+        finally:
+            gc.freeze()
+            gc.enable()
+        
+        return app
+
+
+def run() -> None:
+    """Start gunicorn with the configured workers."""
+    if settings.jobs_available and settings.server_max_requests:
+        logger.warning(
+            "Worker recycling (SERVER_MAX_REQUESTS) drops queued jobs and stored job results; "
+            "set SERVER_MAX_REQUESTS=0 if clients rely on /jobs"
+        )
+    
+    options = {
+        "bind": f"{settings.server_host}:{settings.server_port}",
+        "workers": settings.server_workers,
+        "worker_class": f"{__name__}.WhisperrrUvicornWorker",
+        "preload_app": True,
+        "pre_fork": freeze_before_fork,
+        "max_requests": settings.server_max_requests,
+        "max_requests_jitter": settings.server_max_requests_jitter,
+        # Let recycled and stopping workers finish in-flight transcriptions and running jobs
+        "graceful_timeout": settings.server_graceful_timeout_seconds,
+        "loglevel": settings.log_level.lower()
+    }
+    WhisperrrServer(options).run()
+
+
+if __name__ == "__main__":
+    run()
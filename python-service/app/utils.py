@@ -2,14 +2,19 @@
 Utility functions for file handling, audio processing, and other common operations.
 """
 
+import asyncio
+import itertools
 import os
 import uuid
 import logging
+from functools import lru_cache
+from math import gcd
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
-import librosa
+from typing import Optional, Tuple, Dict, Any, Callable, Iterator, List
+import numpy as np
 import soundfile as sf
 
+from .audio_headers import AudioHeader, detect_format_from_header, parse_audio_header
 from .config import settings
 from .exceptions import (
     InvalidAudioFormat,
@@ -20,6 +25,18 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Sample rate expected by Whisper models
+WHISPER_SAMPLE_RATE = 16000
+
+# Raw PCM sample formats accepted without a container (16kHz mono, little-endian)
+RAW_PCM_FORMATS = {"s16le": "<i2", "f32le": "<f4"}
+
+# Upload content types that carry raw PCM
+RAW_PCM_CONTENT_TYPES = {
+    "audio/x-pcm-s16le": "s16le",
+    "audio/x-pcm-f32le": "f32le",
+}
+
 
 def get_file_extension(filename: str) -> str:
     """Extract file extension from filename."""
@@ -44,28 +61,55 @@ def detect_audio_format(file_path: str) -> Optional[str]:
         with open(file_path, 'rb') as f:
             header = f.read(12)
         
-        # Check for common audio format signatures
-        if header.startswith(b'ID3') or header[1:4] == b'ID3':
-            return 'mp3'
-        elif header.startswith(b'RIFF') and header[8:12] == b'WAVE':
-            return 'wav'
-        elif header.startswith(b'OggS'):
-            return 'ogg'
-        elif header.startswith(b'fLaC'):
-            return 'flac'
-        elif header.startswith(b'\x00\x00\x00\x20ftypM4A'):
-            return 'm4a'
-        elif header.startswith(b'\x30\x26\xB2\x75'):
-            return 'wma'
-        
-        # Fallback to extension-based detection
-        return get_file_extension(file_path)
+        # Check for common audio format signatures, falling back to the extension
+        return detect_format_from_header(header) or get_file_extension(file_path)
     
     except Exception as e:
         logger.warning(f"Failed to detect audio format for {file_path}: {e}")
         return get_file_extension(file_path)
 
 
+@lru_cache(maxsize=None)
+def soundfile_can_decode(file_format: str) -> bool:
+    """Check whether the installed libsndfile can decode a format."""
+    names = {"wav": "WAV", "flac": "FLAC", "ogg": "OGG", "mp3": "MP3"}
+    return names.get(file_format) in sf.available_formats()
+
+
+def parse_raw_pcm_content_type(content_type: Optional[str]) -> Optional[str]:
+    """
+    Detect a raw PCM upload from its content type.
+    
+    Accepts e.g. "audio/x-pcm-s16le" or "audio/x-pcm-f32le; rate=16000; channels=1".
+    
+    Args:
+        content_type: Content type of the uploaded file
+    
+    Returns:
+        Raw PCM format name ("s16le" or "f32le"), or None for container uploads
+    """
+    if not content_type:
+        return None
+    
+    mime_type, *params = [part.strip() for part in content_type.split(";")]
+    pcm_format = RAW_PCM_CONTENT_TYPES.get(mime_type.lower())
+    if pcm_format is None:
+        return None
+    
+    # Raw PCM has no header, so only the layout Whisper consumes is accepted
+    expected = {"rate": str(WHISPER_SAMPLE_RATE), "channels": "1"}
+    for param in params:
+        name, _, value = param.partition("=")
+        name = name.strip().lower()
+        if name in expected and value.strip() != expected[name]:
+            raise InvalidAudioFormat(
+                message=f"Raw PCM uploads must be {WHISPER_SAMPLE_RATE} Hz mono",
+                file_format=content_type
+            )
+    
+    return pcm_format
+
+
 def create_temp_file(suffix: str = None) -> Tuple[str, str]:
     """Create a temporary file and return path and filename."""
     try:
@@ -101,38 +145,409 @@ def cleanup_temp_file(file_path: str) -> None:
         logger.warning(f"Failed to cleanup temporary file {file_path}: {e}")
 
 
-def get_audio_info(file_path: str) -> Dict[str, Any]:
-    """Get audio file information."""
+async def save_upload_file(
+    upload_file,
+    suffix: Optional[str] = None,
+    max_size: Optional[int] = None,
+    chunk_size: Optional[int] = None
+) -> Tuple[str, int]:
+    """
+    Copy an uploaded file into the upload directory in fixed-size chunks.
+    
+    Starlette has already received the whole multipart body into a spooled
+    temporary file by the time this runs, so the size check here only bounds
+    the copy; oversized bodies are refused while they arrive by the upload
+    size middleware. Only one chunk is held in memory at a time and all
+    blocking file I/O runs in the default executor, so the event loop is
+    never stalled by large uploads.
+    
+    Args:
+        upload_file: FastAPI/Starlette UploadFile to copy
+        suffix: File extension for the stored file
+        max_size: Maximum number of bytes accepted (defaults to configured limit)
+        chunk_size: Bytes read per chunk (defaults to configured chunk size)
+    
+    Returns:
+        Tuple of stored file path and number of bytes written
+    """
+    if max_size is None:
+        max_size = settings.max_file_size_bytes
+    if chunk_size is None:
+        chunk_size = settings.upload_chunk_size_bytes
+    
+    file_path, _ = create_temp_file(suffix)
+    loop = asyncio.get_event_loop()
+    bytes_written = 0
+    
     try:
-        # Use librosa to get audio info
-        duration = librosa.get_duration(path=file_path)
-        sr = librosa.get_samplerate(file_path)
+        out_file = await loop.run_in_executor(None, open, file_path, 'wb')
+        try:
+            while True:
+                chunk = await upload_file.read(chunk_size)
+                if not chunk:
+                    break
+                
+                bytes_written += len(chunk)
+                if bytes_written > max_size:
+                    raise FileTooLarge(
+                        file_size=bytes_written,
+                        max_size=max_size
+                    )
+                
+                await loop.run_in_executor(None, out_file.write, chunk)
+        finally:
+            await loop.run_in_executor(None, out_file.close)
         
-        # Get file size
-        file_size = os.path.getsize(file_path)
+        logger.debug(f"Stored upload ({bytes_written} bytes): {file_path}")
+        return file_path, bytes_written
+    
+    except FileTooLarge:
+        cleanup_temp_file(file_path)
+        raise
+    except Exception as e:
+        cleanup_temp_file(file_path)
+        raise FileSystemError(
+            message="Failed to store uploaded file",
+            operation="save_upload_file",
+            file_path=file_path,
+            original_error=str(e)
+        )
+
+
+class AudioProbe:
+    """
+    Single-pass audio file probe.
+    
+    The file is opened once, on first access, and its format, duration, sample
+    rate and channel count are cached so that validation, preprocessing and
+    response building can share the same probe instead of re-reading the file.
+    """
+    
+    def __init__(self, file_path: str, raw_pcm_format: Optional[str] = None):
+        """
+        Create a probe for an audio file.
+        
+        Args:
+            file_path: Path to audio file
+            raw_pcm_format: Sample format if the file is headerless 16kHz mono PCM
+        """
+        self.file_path = file_path
+        self.raw_pcm_format = raw_pcm_format
+        self._probed = False
+        self._file_size = None
+        self._format = None
+        self._duration = None
+        self._sample_rate = None
+        self._channels = None
+        self._decoder = None
+        self._header = None
+    
+    def probe(self) -> "AudioProbe":
+        """Read stream information from the file if not done yet."""
+        if self._probed:
+            return self
+        
+        try:
+            # Container metadata is enough for the common formats
+            if self.raw_pcm_format is not None:
+                header = self._raw_pcm_header()
+            else:
+                header = parse_audio_header(self.file_path, self.format)
+            
+            if header is not None:
+                self._header = header
+                self._duration = header.duration
+                self._sample_rate = header.sample_rate
+                self._channels = header.channels
+                if header.format == "pcm":
+                    self._decoder = "raw"
+                elif soundfile_can_decode(header.format):
+                    self._decoder = "soundfile"
+                else:
+                    self._decoder = "audioread"
+            else:
+                self._probe_with_decoder()
+            
+            self._probed = True
+            return self
+        
+        except InvalidAudioFormat:
+            raise
+        except Exception as e:
+            raise AudioProcessingError(
+                message="Failed to get audio information",
+                original_error=str(e),
+                processing_step="probe_audio"
+            )
+    
+    def _raw_pcm_header(self) -> AudioHeader:
+        """Describe a headerless PCM file from its size alone."""
+        dtype = np.dtype(RAW_PCM_FORMATS[self.raw_pcm_format])
+        if self.file_size == 0 or self.file_size % dtype.itemsize:
+            raise InvalidAudioFormat(
+                message="Raw PCM upload size is not a whole number of samples",
+                file_format=self.raw_pcm_format
+            )
         
+        samples = self.file_size // dtype.itemsize
+        return AudioHeader(
+            format="pcm",
+            duration=samples / WHISPER_SAMPLE_RATE,
+            sample_rate=WHISPER_SAMPLE_RATE,
+            channels=1,
+            codec="float" if dtype.kind == "f" else "pcm",
+            bits_per_sample=dtype.itemsize * 8,
+            data_offset=0,
+            data_size=self.file_size
+        )
+    
+    def _probe_with_decoder(self) -> None:
+        """Fallback probe for containers without a header parser."""
+        try:
+            # libsndfile reads duration, rate and channels from the header
+            info = sf.info(self.file_path)
+            self._duration = info.duration
+            self._sample_rate = info.samplerate
+            self._channels = info.channels
+            self._decoder = "soundfile"
+        except Exception:
+            # Containers libsndfile cannot parse (m4a, wma) go through audioread
+            import audioread
+            with audioread.audio_open(self.file_path) as f:
+                self._duration = f.duration
+                self._sample_rate = f.samplerate
+                self._channels = f.channels
+            self._decoder = "audioread"
+    
+    @property
+    def file_size(self) -> int:
+        """File size in bytes."""
+        if self._file_size is None:
+            self._file_size = os.path.getsize(self.file_path)
+        return self._file_size
+    
+    @property
+    def format(self) -> Optional[str]:
+        """Audio format detected from the file signature."""
+        if self._format is None:
+            if self.raw_pcm_format is not None:
+                self._format = "pcm"
+            else:
+                self._format = detect_audio_format(self.file_path)
+        return self._format
+    
+    @property
+    def duration(self) -> float:
+        """Audio duration in seconds."""
+        return self.probe()._duration
+    
+    @property
+    def sample_rate(self) -> int:
+        """Native sample rate in Hz."""
+        return self.probe()._sample_rate
+    
+    @property
+    def channels(self) -> int:
+        """Number of audio channels."""
+        return self.probe()._channels
+    
+    @property
+    def header(self) -> Optional[AudioHeader]:
+        """Parsed container header, if the format has a header parser."""
+        return self.probe()._header
+    
+    @property
+    def is_conformant(self) -> bool:
+        """
+        Whether the samples are already in the layout Whisper consumes.
+        
+        True for raw PCM uploads and for 16kHz mono WAV files holding 16-bit
+        PCM or 32-bit float samples, which can be read without decoding,
+        resampling or normalizing.
+        """
+        header = self.header
+        if header is None or header.format not in ("wav", "pcm"):
+            return False
+        
+        return (
+            header.sample_rate == WHISPER_SAMPLE_RATE
+            and header.channels == 1
+            and (header.codec, header.bits_per_sample) in (("pcm", 16), ("float", 32))
+        )
+    
+    @property
+    def decoder(self) -> str:
+        """Decoder able to read the file ('soundfile', 'audioread' or 'raw')."""
+        return self.probe()._decoder
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get probed information as a dictionary."""
         return {
-            "duration": duration,
-            "sample_rate": sr,
-            "file_size": file_size,
-            "file_size_mb": round(file_size / (1024 * 1024), 2)
+            "format": self.format,
+            "duration": self.duration,
+            "sample_rate": self.sample_rate,
+            "channels": self.channels,
+            "file_size": self.file_size,
+            "file_size_mb": round(self.file_size / (1024 * 1024), 2)
         }
+
+
+def get_audio_info(file_path: str) -> Dict[str, Any]:
+    """Get audio file information."""
+    return AudioProbe(file_path).to_dict()
+
+
+def _resample_soxr_hq(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    """High quality soxr resampling (librosa default)."""
+    import librosa
     
-    except Exception as e:
+    return librosa.resample(audio, orig_sr=orig_sr, target_sr=target_sr, res_type="soxr_hq")
+
+
+def _resample_soxr_qq(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    """Quick, lower quality soxr resampling."""
+    import librosa
+    
+    return librosa.resample(audio, orig_sr=orig_sr, target_sr=target_sr, res_type="soxr_qq")
+
+
+def _resample_polyphase(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    """Polyphase FIR resampling with the ratio reduced to lowest terms."""
+    from scipy.signal import resample_poly
+    
+    divisor = gcd(orig_sr, target_sr)
+    resampled = resample_poly(audio, target_sr // divisor, orig_sr // divisor)
+    return resampled.astype(np.float32, copy=False)
+
+
+# Group delay, in output samples, of the integer decimation filter
+_DECIMATION_DELAY = 5
+
+
+@lru_cache(maxsize=16)
+def _decimation_filter(factor: int) -> np.ndarray:
+    """Short anti-aliasing FIR filter for integer decimation."""
+    from scipy.signal import firwin
+    
+    # Odd length so the group delay is a whole number of output samples
+    num_taps = 2 * _DECIMATION_DELAY * factor + 1
+    return firwin(num_taps, 0.9 / factor, window=('kaiser', 6.0)).astype(np.float32)
+
+
+def _resample_integer(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    """Fast decimation for integer ratios (e.g. 48kHz to 16kHz), polyphase otherwise."""
+    if orig_sr <= target_sr or orig_sr % target_sr:
+        return _resample_polyphase(audio, orig_sr, target_sr)
+    
+    from scipy.signal import upfirdn
+    
+    factor = orig_sr // target_sr
+    filtered = upfirdn(_decimation_filter(factor), audio, up=1, down=factor)
+    
+    # Drop the filter delay and trim to the expected output length
+    output_length = -(-len(audio) // factor)
+    return filtered[_DECIMATION_DELAY:_DECIMATION_DELAY + output_length].astype(np.float32, copy=False)
+
+
+# Resampler backends selectable via settings.resampler_backend
+RESAMPLERS: Dict[str, Callable[[np.ndarray, int, int], np.ndarray]] = {
+    "soxr_hq": _resample_soxr_hq,
+    "soxr_qq": _resample_soxr_qq,
+    "polyphase": _resample_polyphase,
+    "integer": _resample_integer,
+}
+
+
+def resample_audio(
+    audio: np.ndarray,
+    orig_sr: int,
+    target_sr: int,
+    backend: Optional[str] = None
+) -> np.ndarray:
+    """
+    Resample mono audio with the selected backend.
+    
+    Args:
+        audio: Mono float32 audio samples
+        orig_sr: Sample rate of the input audio
+        target_sr: Desired sample rate
+        backend: Resampler backend name (defaults to configured backend)
+    
+    Returns:
+        Resampled float32 audio
+    """
+    if orig_sr == target_sr:
+        return audio
+    
+    if backend is None:
+        backend = settings.resampler_backend
+    
+    resampler = RESAMPLERS.get(backend)
+    if resampler is None:
         raise AudioProcessingError(
-            message="Failed to get audio information",
-            original_error=str(e),
-            processing_step="get_audio_info"
+            message=f"Unknown resampler backend: {backend}",
+            processing_step="resample_audio"
         )
+    
+    return resampler(audio, orig_sr, target_sr)
 
 
-def preprocess_audio(file_path: str, target_sr: int = 16000) -> str:
+def read_conformant_audio(file_path: str, probe: AudioProbe) -> np.ndarray:
+    """
+    Read samples of a conformant file straight into a float32 array.
+    
+    Args:
+        file_path: Path to a raw PCM upload or 16kHz mono PCM/float WAV file
+        probe: Probe of the file (must report is_conformant)
+    
+    Returns:
+        Mono float32 array at 16kHz
+    """
+    header = probe.header
+    dtype = np.dtype("<i2" if header.codec == "pcm" else "<f4")
+    samples = np.fromfile(
+        file_path,
+        dtype=dtype,
+        count=header.data_size // dtype.itemsize,
+        offset=header.data_offset
+    )
+    
+    if dtype.kind == "i":
+        return samples.astype(np.float32) / 32768.0
+    return samples.astype(np.float32, copy=False)
+
+
+def _decode_audio(file_path: str, probe: AudioProbe) -> Tuple[np.ndarray, int]:
+    """Decode a probed file to mono float32 at its native sample rate."""
+    if probe.decoder == "raw":
+        return read_conformant_audio(file_path, probe), WHISPER_SAMPLE_RATE
+    
+    if probe.decoder == "soundfile":
+        try:
+            audio, sr = sf.read(file_path, dtype='float32', always_2d=True)
+            audio = audio.mean(axis=1) if probe.channels > 1 else audio[:, 0]
+            return audio, sr
+        except Exception as e:
+            logger.debug(f"libsndfile could not decode {file_path}, using audioread: {e}")
+    
+    # Containers libsndfile cannot read are decoded through audioread
+    import librosa
+    
+    return librosa.load(file_path, sr=None, mono=True)
+
+
+def preprocess_audio(
+    file_path: str,
+    target_sr: int = 16000,
+    probe: Optional[AudioProbe] = None
+) -> str:
     """
     Preprocess audio file for Whisper.
     
     Args:
         file_path: Path to input audio file
         target_sr: Target sample rate (Whisper expects 16kHz)
+        probe: Existing probe for the file, reused to avoid re-probing
     
     Returns:
         Path to preprocessed audio file
@@ -141,19 +556,22 @@ def preprocess_audio(file_path: str, target_sr: int = 16000) -> str:
         logger.info(f"Preprocessing audio file: {file_path}")
         
         # Get audio info
-        audio_info = get_audio_info(file_path)
-        logger.debug(f"Original audio info: {audio_info}")
+        if probe is None:
+            probe = AudioProbe(file_path)
+        logger.debug(f"Original audio info: {probe.to_dict()}")
         
         # Load audio
-        audio, sr = librosa.load(file_path, sr=None)
+        audio, sr = _decode_audio(file_path, probe)
         
         # Resample if necessary
         if sr != target_sr:
             logger.info(f"Resampling from {sr}Hz to {target_sr}Hz")
-            audio = librosa.resample(audio, orig_sr=sr, target_sr=target_sr)
+            audio = resample_audio(audio, sr, target_sr)
             sr = target_sr
         
         # Normalize audio
+        import librosa
+        
         audio = librosa.util.normalize(audio)
         
         # Create output file
@@ -173,12 +591,380 @@ def preprocess_audio(file_path: str, target_sr: int = 16000) -> str:
         )
 
 
-def validate_audio_file(file_path: str) -> Dict[str, Any]:
+def load_audio_array(
+    file_path: str,
+    target_sr: int = 16000,
+    probe: Optional[AudioProbe] = None
+) -> np.ndarray:
+    """
+    Decode an audio file once into the array format Whisper consumes.
+    
+    Args:
+        file_path: Path to input audio file
+        target_sr: Target sample rate (Whisper expects 16kHz)
+        probe: Existing probe for the file, reused to avoid re-probing
+    
+    Returns:
+        Mono float32 array sampled at target_sr, peak-normalized
+    """
+    try:
+        logger.info(f"Decoding audio file to memory: {file_path}")
+        
+        if probe is None:
+            probe = AudioProbe(file_path)
+        
+        # Fast lane: samples are already 16kHz mono, no decode or normalize
+        if probe.is_conformant and target_sr == WHISPER_SAMPLE_RATE and (
+            settings.fast_lane_enabled or probe.raw_pcm_format is not None
+        ):
+            logger.info(f"Reading conformant audio without preprocessing: {file_path}")
+            return read_conformant_audio(file_path, probe)
+        
+        # Decode to mono float32 at the native sample rate
+        audio, sr = _decode_audio(file_path, probe)
+        
+        # Resample if necessary
+        if sr != target_sr:
+            logger.info(f"Resampling from {sr}Hz to {target_sr}Hz")
+            audio = resample_audio(audio, sr, target_sr)
+        
+        # Normalize audio
+        import librosa
+        
+        audio = librosa.util.normalize(audio)
+        
+        return np.ascontiguousarray(audio, dtype=np.float32)
+    
+    except Exception as e:
+        raise AudioProcessingError(
+            message="Failed to decode audio",
+            original_error=str(e),
+            processing_step="load_audio_array"
+        )
+
+
+def can_stream_audio(probe: AudioProbe) -> bool:
+    """
+    Check whether a file can be decoded block by block without artifacts.
+    
+    libsndfile's MP3 decoder produces glitches at block boundaries on
+    sequential reads, so MP3s decoded by soundfile are loaded whole instead.
+    """
+    return probe.decoder != "soundfile" or probe.format != "mp3"
+
+
+def _iter_decoded_blocks(
+    file_path: str,
+    probe: AudioProbe,
+    block_seconds: float
+) -> Iterator[Tuple[np.ndarray, int]]:
+    """
+    Decode a file incrementally into mono float32 blocks at the native rate.
+    
+    The rate is the one the opened decoder produces, which is not always the
+    rate in the container header: Opus always decodes at 48kHz whatever input
+    rate OpusHead records, and HE-AAC headers carry the core rate, not the
+    SBR output rate.
+    
+    Yields:
+        Tuples of (block, sample rate of the block)
+    """
+    if probe.decoder == "raw" or probe.is_conformant:
+        # Map the sample data and convert one block at a time
+        header = probe.header
+        dtype = np.dtype("<i2" if header.codec == "pcm" else "<f4")
+        samples = np.memmap(
+            file_path,
+            dtype=dtype,
+            mode='r',
+            offset=header.data_offset,
+            shape=(header.data_size // dtype.itemsize,)
+        )
+        block_length = int(block_seconds * header.sample_rate)
+        for start in range(0, len(samples), block_length):
+            block = np.asarray(samples[start:start + block_length], dtype=np.float32)
+            yield (block / 32768.0 if dtype.kind == "i" else block), header.sample_rate
+    
+    elif probe.decoder == "soundfile":
+        with sf.SoundFile(file_path) as f:
+            block_length = int(block_seconds * f.samplerate)
+            for block in f.blocks(blocksize=block_length, dtype='float32', always_2d=True):
+                yield (block.mean(axis=1) if f.channels > 1 else block[:, 0]), f.samplerate
+    
+    else:
+        # audioread hands out small interleaved int16 buffers as ffmpeg decodes
+        import audioread
+        with audioread.audio_open(file_path) as f:
+            for buffer in f:
+                block = np.frombuffer(buffer, dtype='<i2').astype(np.float32) / 32768.0
+                if f.channels > 1:
+                    block = block[:len(block) - len(block) % f.channels].reshape(-1, f.channels).mean(axis=1)
+                yield block, f.samplerate
+
+
+def iter_audio_windows(
+    file_path: str,
+    probe: Optional[AudioProbe] = None,
+    window_seconds: Optional[float] = None,
+    target_sr: int = WHISPER_SAMPLE_RATE
+) -> Iterator[np.ndarray]:
+    """
+    Stream a file as fixed-length windows of mono float32 audio at target_sr.
+    
+    Only one decoded block and one window are held in memory at a time, so
+    peak memory does not depend on the length of the recording. Resampling
+    uses a stateful soxr stream so window edges stay seamless; audio is not
+    peak-normalized because that would need the whole recording.
+    
+    Args:
+        file_path: Path to input audio file
+        probe: Existing probe for the file, reused to avoid re-probing
+        window_seconds: Window length (defaults to configured window length)
+        target_sr: Target sample rate (Whisper expects 16kHz)
+    
+    Yields:
+        Windows of window_seconds of audio (the last one may be shorter)
+    """
+    import soxr
+    
+    if probe is None:
+        probe = AudioProbe(file_path)
+    if window_seconds is None:
+        window_seconds = settings.streaming_window_seconds
+    
+    try:
+        window_length = int(window_seconds * target_sr)
+        quality = "QQ" if settings.resampler_backend == "soxr_qq" else "HQ"
+        resampler = None
+        decoded_sr = None
+        
+        pending = []
+        pending_length = 0
+        
+        blocks = _iter_decoded_blocks(file_path, probe, window_seconds)
+        for block, sample_rate in itertools.chain(blocks, [(None, None)]):
+            # Resample from the rate the decoder delivers, known once it is open
+            if decoded_sr is None and block is not None:
+                decoded_sr = sample_rate
+                if decoded_sr != target_sr:
+                    resampler = soxr.ResampleStream(decoded_sr, target_sr, 1, dtype='float32', quality=quality)
+            
+            if resampler is not None:
+                last = block is None
+                block = resampler.resample_chunk(np.zeros(0, np.float32) if last else block, last=last)
+            elif block is None:
+                block = np.zeros(0, np.float32)
+            
+            pending.append(block)
+            pending_length += len(block)
+            
+            # Emit full windows as soon as enough audio is buffered
+            while pending_length >= window_length:
+                buffered = np.concatenate(pending)
+                yield buffered[:window_length]
+                pending = [buffered[window_length:]]
+                pending_length -= window_length
+        
+        if pending_length:
+            yield np.concatenate(pending)
+    
+    except Exception as e:
+        raise AudioProcessingError(
+            message="Failed to stream audio",
+            original_error=str(e),
+            processing_step="iter_audio_windows"
+        )
+
+
+# Voice activity detection: (threshold above noise floor in dB, minimum
+# silence in seconds that is cut out) for each aggressiveness level
+_VAD_LEVELS = {
+    0: (3.0, 2.0),
+    1: (6.0, 1.0),
+    2: (9.0, 0.6),
+    3: (12.0, 0.4),
+}
+VAD_FRAME_SECONDS = 0.03
+VAD_PADDING_SECONDS = 0.2
+# Audio whose loudest frame is below this level (dBFS) is treated as silence
+VAD_SILENCE_DB = -60.0
+
+
+def frame_energy_db(
+    audio: np.ndarray,
+    sample_rate: int = WHISPER_SAMPLE_RATE,
+    frame_seconds: float = VAD_FRAME_SECONDS
+) -> np.ndarray:
+    """
+    Compute per-frame energy in dB relative to full scale.
+    
+    Args:
+        audio: Mono float32 audio samples
+        sample_rate: Sample rate of the audio
+        frame_seconds: Frame length in seconds (trailing partial frame is ignored)
+    
+    Returns:
+        Array with one energy value per frame
+    """
+    frame_length = int(sample_rate * frame_seconds)
+    num_frames = len(audio) // frame_length
+    frames = audio[:num_frames * frame_length].reshape(num_frames, frame_length)
+    return 10 * np.log10(np.mean(frames.astype(np.float32) ** 2, axis=1) + 1e-10)
+
+
+def detect_speech_regions(
+    audio: np.ndarray,
+    sample_rate: int = WHISPER_SAMPLE_RATE,
+    aggressiveness: int = 1
+) -> List[Tuple[int, int]]:
+    """
+    Find speech regions with a vectorized frame-energy voice activity detector.
+    
+    Args:
+        audio: Mono float32 audio samples
+        sample_rate: Sample rate of the audio
+        aggressiveness: 0 (keep most audio) to 3 (cut the most silence)
+    
+    Returns:
+        List of (start, end) sample indices of speech regions, in order
+    """
+    margin_db, min_silence = _VAD_LEVELS[aggressiveness]
+    frame_length = int(sample_rate * VAD_FRAME_SECONDS)
+    energy_db = frame_energy_db(audio, sample_rate)
+    num_frames = len(energy_db)
+    if num_frames == 0:
+        return [(0, len(audio))] if len(audio) else []
+    
+    # Speech is anything clearly above the noise floor and not far below the peak
+    noise_floor = np.percentile(energy_db, 10)
+    threshold = max(noise_floor + margin_db, energy_db.max() - 45.0)
+    speech = energy_db > threshold
+    if not speech.any():
+        # Nothing stands out from the floor. Either the file is silent, or it
+        # has too few quiet frames to measure the floor from (a steady tone,
+        # speech over steady noise), in which case none of it can be cut.
+        if energy_db.max() < VAD_SILENCE_DB:
+            return []
+        return [(0, len(audio))]
+    
+    # Pad speech frames so word onsets and tails are kept
+    pad = int(round(VAD_PADDING_SECONDS / VAD_FRAME_SECONDS))
+    speech = np.convolve(speech, np.ones(2 * pad + 1), mode='same') > 0
+    
+    # Run boundaries, then close gaps shorter than the minimum silence
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], speech.astype(np.int8), [0]))))
+    starts, ends = edges[0::2], edges[1::2]
+    keep = (starts[1:] - ends[:-1]) * VAD_FRAME_SECONDS >= min_silence
+    starts = np.concatenate((starts[:1], starts[1:][keep]))
+    ends = np.concatenate((ends[:-1][keep], ends[-1:]))
+    
+    regions = [(int(start) * frame_length, int(end) * frame_length) for start, end in zip(starts, ends)]
+    
+    # The trailing partial frame belongs to a region that reaches the last frame
+    if ends[-1] == num_frames:
+        regions[-1] = (regions[-1][0], len(audio))
+    
+    return regions
+
+
+class SpeechTimeline:
+    """
+    Maps timestamps in speech-only audio back to the original timeline.
+    
+    Built from the speech regions that were concatenated before inference.
+    """
+    
+    def __init__(self, regions: List[Tuple[int, int]], sample_rate: int = WHISPER_SAMPLE_RATE):
+        """
+        Create a timeline from speech regions.
+        
+        Args:
+            regions: (start, end) sample indices of the kept regions
+            sample_rate: Sample rate of the audio
+        """
+        lengths = np.array([end - start for start, end in regions], dtype=np.float64)
+        self._original_starts = np.array([start for start, _ in regions], dtype=np.float64) / sample_rate
+        self._compact_starts = np.concatenate(([0.0], np.cumsum(lengths)[:-1])) / sample_rate
+    
+    def to_original(self, t: float, is_end: bool = False) -> float:
+        """
+        Map a time in the speech-only audio to the original audio.
+        
+        Args:
+            t: Time in seconds in the speech-only audio
+            is_end: Map a time on a region boundary to the end of the earlier region
+        """
+        if len(self._original_starts) == 0:
+            return t
+        
+        side = 'left' if is_end else 'right'
+        index = max(int(np.searchsorted(self._compact_starts, t, side=side)) - 1, 0)
+        return float(self._original_starts[index] + (t - self._compact_starts[index]))
+    
+    def map_segments(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return copies of Whisper segments with start/end on the original timeline."""
+        mapped = []
+        for segment in segments:
+            segment = dict(segment)
+            segment["start"] = round(self.to_original(segment.get("start", 0.0)), 3)
+            segment["end"] = round(self.to_original(segment.get("end", 0.0), is_end=True), 3)
+            mapped.append(segment)
+        return mapped
+
+
+def skip_silence(
+    audio: np.ndarray,
+    sample_rate: int = WHISPER_SAMPLE_RATE,
+    aggressiveness: Optional[int] = None
+) -> Tuple[np.ndarray, SpeechTimeline, float]:
+    """
+    Drop non-speech audio before inference.
+    
+    Args:
+        audio: Mono float32 audio samples
+        sample_rate: Sample rate of the audio
+        aggressiveness: VAD aggressiveness (defaults to configured level)
+    
+    Returns:
+        Tuple of speech-only audio, timeline for mapping timestamps back,
+        and the fraction of the original audio that was skipped
+    """
+    if aggressiveness is None:
+        aggressiveness = settings.vad_aggressiveness
+    
+    try:
+        regions = detect_speech_regions(audio, sample_rate, aggressiveness)
+        
+        if regions:
+            speech = np.concatenate([audio[start:end] for start, end in regions])
+        else:
+            speech = audio[:0]
+        
+        skipped_ratio = 1.0 - len(speech) / len(audio) if len(audio) else 0.0
+        logger.info(
+            f"VAD kept {len(regions)} speech regions, "
+            f"skipped {skipped_ratio:.1%} of {len(audio) / sample_rate:.1f}s"
+        )
+        return speech, SpeechTimeline(regions, sample_rate), round(skipped_ratio, 4)
+    
+    except Exception as e:
+        raise AudioProcessingError(
+            message="Voice activity detection failed",
+            original_error=str(e),
+            processing_step="skip_silence"
+        )
+
+
+def validate_audio_file(
+    file_path: str,
+    probe: Optional[AudioProbe] = None
+) -> Dict[str, Any]:
     """
     Comprehensive audio file validation.
     
     Args:
         file_path: Path to audio file
+        probe: Existing probe for the file, reused to avoid re-probing
     
     Returns:
         Dictionary with validation results and file info
@@ -191,8 +977,11 @@ def validate_audio_file(file_path: str) -> Dict[str, Any]:
                 file_path=file_path
             )
         
+        if probe is None:
+            probe = AudioProbe(file_path)
+        
         # Get file size
-        file_size = os.path.getsize(file_path)
+        file_size = probe.file_size
         
         # Validate file size
         if not validate_file_size(file_size):
@@ -202,25 +991,26 @@ def validate_audio_file(file_path: str) -> Dict[str, Any]:
             )
         
         # Detect format
-        detected_format = detect_audio_format(file_path)
+        detected_format = probe.format
         
-        # Validate format
-        if not validate_file_format(file_path):
+        # Validate format (raw PCM uploads have no container to check)
+        if probe.raw_pcm_format is None and not validate_file_format(file_path):
             raise InvalidAudioFormat(
                 file_format=detected_format,
                 supported_formats=settings.supported_formats
             )
         
-        # Try to get audio info (this will fail if file is corrupted)
-        audio_info = get_audio_info(file_path)
+        # Probe audio info (this will fail if file is corrupted)
+        probe.probe()
         
         return {
             "valid": True,
             "format": detected_format,
             "file_size": file_size,
             "file_size_mb": round(file_size / (1024 * 1024), 2),
-            "duration": audio_info["duration"],
-            "sample_rate": audio_info["sample_rate"]
+            "duration": probe.duration,
+            "sample_rate": probe.sample_rate,
+            "channels": probe.channels
         }
     
     except (InvalidAudioFormat, FileTooLarge, FileSystemError):
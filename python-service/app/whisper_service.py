@@ -7,25 +7,42 @@ import logging
 import time
 import threading
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, Iterator, List, Tuple, Union
 from concurrent.futures import ThreadPoolExecutor
-import whisper
-import torch
+import numpy as np
 
 from .config import settings
 from .models import (
     TranscriptionResponse,
     TranscriptionSegment,
-    ModelInfoResponse
+    ModelInfoResponse,
+    ModelPoolResponse,
+    PooledModelInfo,
+    ThreadLayoutInfo
 )
 from .exceptions import (
+    InvalidAudioFormat,
+    FileTooLarge,
     ModelNotLoaded,
     ModelLoadFailed,
+    TranscriptionCancelled,
     TranscriptionFailed,
+    TranscriptionTimeout,
     AudioProcessingError
 )
+from .cancellation import CancellationToken, bind_token, check_cancelled
+from .cpu_topology import configure_worker_threads, plan_thread_layout
+from .model_pool import ModelHandle, ModelPool
+from .backends import InferenceBackend, get_backend
+from .longform import create_worker_pool, default_worker_count, plan_chunks, stitch_results, transcribe_chunk
 from .utils import (
+    WHISPER_SAMPLE_RATE,
+    AudioProbe,
+    can_stream_audio,
+    iter_audio_windows,
+    load_audio_array,
     preprocess_audio,
+    skip_silence,
     validate_audio_file,
     get_memory_usage,
     log_performance_metrics,
@@ -34,6 +51,12 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+# Characters of previous text passed as the prompt for the next streamed window
+STREAMING_PROMPT_CHARS = 200
+
+# Name of the long-form pool's reservation in the model pool's memory budget
+LONGFORM_RESERVATION = "longform-pool"
+
 
 class WhisperService:
     """
@@ -60,13 +83,31 @@ class WhisperService:
             return
         
         self._initialized = True
-        self._model = None
+        self._pool = ModelPool(settings.model_pool_memory_budget_mb)
         self._model_size = None
         self._model_load_time = None
-        self._is_loading = False
+        # In-progress loads by model size, shared by every caller waiting on them
+        self._model_loads = {}
+        self._startup_load = None
         self._active_transcriptions = 0
         self._start_time = time.time()
-        self._executor = ThreadPoolExecutor(max_workers=settings.max_concurrent_transcriptions)
+        # Audio seen by VAD and the part of it skipped as silence, since startup
+        self._vad_audio_seconds = 0.0
+        self._vad_skipped_seconds = 0.0
+        
+        # Split the CPUs between every transcription thread of every server process
+        self._thread_layout = plan_thread_layout(
+            settings.max_concurrent_transcriptions * settings.server_workers,
+            settings.torch_intra_op_threads,
+            settings.torch_inter_op_threads
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.max_concurrent_transcriptions,
+            initializer=configure_worker_threads,
+            initargs=(self._thread_layout,)
+        )
+        self._longform_pool = None
+        self._longform_pool_key = None
         
         # Model descriptions
         self._model_descriptions = {
@@ -93,63 +134,124 @@ class WhisperService:
         
         logger.info("WhisperService initialized")
     
-    async def load_model(self, model_size: str = None) -> dict:
+    async def load_model(
+        self,
+        model_size: str = None,
+        make_default: bool = True,
+        wait_timeout: Optional[float] = None
+    ) -> dict:
         """
-        Load a Whisper model.
+        Load a Whisper model into the resident model pool.
         
         Args:
             model_size: Model size to load (defaults to configured size)
+            make_default: Use this model for requests that do not name a size
+            wait_timeout: Seconds to wait for the load (None uses
+                MODEL_LOAD_WAIT_TIMEOUT_SECONDS, 0 waits for as long as it takes)
         
         Returns:
             ModelLoadResponse with load information
         """
         if model_size is None:
             model_size = settings.model_size
+        if wait_timeout is None:
+            wait_timeout = settings.model_load_wait_timeout_seconds
         
-        # Check if model is already loaded
-        if self._model is not None and self._model_size == model_size and not self._is_loading:
+        # Check if model is already resident
+        if model_size in self._pool:
+            if make_default:
+                self._set_default_model(model_size)
             return {
                 "success": True,
                 "model_size": model_size,
                 "load_time_seconds": 0.0,
+                "warmup_time_seconds": 0.0,
                 "memory_usage_mb": get_memory_usage(),
                 "message": f"Model {model_size} already loaded"
             }
         
-        # Prevent concurrent loading
-        if self._is_loading:
+        # Join an in-progress load of this size, or start one
+        load = self._model_loads.get(model_size)
+        if load is None:
+            load = asyncio.ensure_future(self._load_into_pool(model_size))
+            self._model_loads[model_size] = load
+            load.add_done_callback(lambda task: self._finish_load(model_size, task))
+        else:
+            logger.info(f"Waiting for in-progress load of model {model_size}")
+        
+        try:
+            # Shield the shared load so a caller giving up does not cancel it for others
+            load_time, warmup_time = await asyncio.wait_for(
+                asyncio.shield(load),
+                timeout=wait_timeout or None
+            )
+        except asyncio.TimeoutError:
             raise ModelLoadFailed(
-                message="Model is already being loaded",
+                message=f"Timed out waiting for model {model_size} to load",
                 model_size=model_size
             )
         
-        self._is_loading = True
+        if make_default or self._model_size is None:
+            self._set_default_model(model_size)
+        
+        return {
+            "success": True,
+            "model_size": model_size,
+            "load_time_seconds": load_time,
+            "warmup_time_seconds": warmup_time,
+            "memory_usage_mb": get_memory_usage(),
+            "message": f"Model {model_size} loaded successfully"
+        }
+    
+    async def _load_into_pool(self, model_size: str) -> Tuple[float, float]:
+        """
+        Load a model, warm it up and add it to the pool (runs once per concurrent burst).
+        
+        Args:
+            model_size: Model size to load
+        
+        Returns:
+            Tuple of total load time and warm-up time in seconds
+        """
         start_time = time.time()
         
         try:
-            logger.info(f"Loading Whisper model: {model_size}")
+            backend = get_backend(settings.backend_for(model_size))
+            logger.info(f"Loading Whisper model: {model_size} ({backend.name})")
             
             # Load model in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
-            self._model = await loop.run_in_executor(
+            model = await loop.run_in_executor(
                 self._executor,
                 self._load_model_sync,
+                backend,
                 model_size
             )
             
-            self._model_size = model_size
-            self._model_load_time = time.time()
-            load_time = time.time() - start_time
+            # Warm up before the model is visible to requests
+            warmup_time = 0.0
+            if settings.model_warmup_enabled:
+                warmup_time = await loop.run_in_executor(
+                    self._executor,
+                    self._warmup_model_sync,
+                    backend,
+                    model
+                )
             
-            logger.info(f"Model {model_size} loaded successfully in {load_time:.2f}s")
+            self._pool.add(
+                model_size,
+                model,
+                warmup_time,
+                backend=backend.name,
+                memory_mb=backend.estimate_memory_mb(model)
+            )
+            load_time = time.time() - start_time
             
-            return {
-                "success": True,
-                "model_size": model_size,
-                "load_time_seconds": round(load_time, 3),
-                "memory_usage_mb": get_memory_usage(),
-                "message": f"Model {model_size} loaded successfully"
-            }
+            logger.info(
+                f"Model {model_size} loaded successfully in {load_time:.2f}s "
+                f"(warm-up {warmup_time:.2f}s)"
+            )
+            return round(load_time, 3), warmup_time
         
         except Exception as e:
             logger.error(f"Failed to load model {model_size}: {e}")
@@ -158,19 +260,174 @@ class WhisperService:
                 model_size=model_size,
                 original_error=str(e)
             )
+    
+    def _finish_load(self, model_size: str, load: asyncio.Future) -> None:
+        """Forget a finished load so a failed one can be retried."""
+        self._model_loads.pop(model_size, None)
+        if not load.cancelled():
+            # Mark the error as retrieved even if every waiter timed out
+            load.exception()
+    
+    def start_background_load(self, model_size: str = None) -> None:
+        """
+        Start loading the default model without waiting for it.
         
-        finally:
-            self._is_loading = False
+        Requests that arrive while it loads wait up to the startup queue
+        timeout, then get ModelNotLoaded with a Retry-After hint. The load
+        itself is not bounded by MODEL_LOAD_WAIT_TIMEOUT_SECONDS: a first
+        download may take longer, and the model must still become the default.
+        
+        Args:
+            model_size: Model size to load (defaults to configured size)
+        """
+        model_size = model_size or settings.model_size
+        logger.info(f"Loading default model in the background: {model_size}")
+        
+        self._startup_load = asyncio.ensure_future(self.load_model(model_size, wait_timeout=0))
+        self._startup_load.add_done_callback(self._finish_startup_load)
+    
+    def preload_model(self, model_size: str = None) -> bool:
+        """
+        Load and warm up the default model synchronously, before workers fork.
+        
+        Used by the production server in its parent process: forked workers
+        inherit the weights copy-on-write and find the model already resident.
+        torch runs single-threaded here, because OpenMP thread pools started
+        before a fork do not survive it; each worker's executor threads set
+        their own thread counts. CUDA contexts and CTranslate2 models do not
+        survive a fork either, so GPU hosts and backends that are not fork
+        safe skip the preload and each worker loads its own model.
+        
+        Args:
+            model_size: Model size to load (defaults to configured size)
+        
+        Returns:
+            True if the model was preloaded
+        """
+        import torch
+        
+        model_size = model_size or settings.model_size
+        device = self._get_device()
+        if device != "cpu":
+            logger.info(f"Skipping preload on {device}; workers load the model after forking")
+            return False
+        
+        backend = get_backend(settings.backend_for(model_size))
+        if not backend.fork_safe:
+            logger.info(f"Skipping preload for the {backend.name} backend; workers load the model after forking")
+            return False
+        
+        start_time = time.time()
+        try:
+            torch.set_num_threads(1)
+            model = self._load_model_sync(backend, model_size)
+            
+            warmup_time = 0.0
+            if settings.model_warmup_enabled:
+                warmup_time = self._warmup_model_sync(backend, model)
+            
+            self._pool.add(
+                model_size,
+                model,
+                warmup_time,
+                backend=backend.name,
+                memory_mb=backend.estimate_memory_mb(model)
+            )
+            self._set_default_model(model_size)
+        except Exception as e:
+            # Workers fall back to loading the model themselves
+            logger.error(f"Failed to preload model {model_size}: {e}")
+            return False
+        
+        logger.info(f"Preloaded model {model_size} in {time.time() - start_time:.2f}s")
+        return True
+    
+    def _finish_startup_load(self, load: asyncio.Future) -> None:
+        """Log the outcome of the background startup load."""
+        if load.cancelled():
+            return
+        
+        error = load.exception()
+        if error is not None:
+            logger.error(f"Background load of the default model failed: {error}")
+        else:
+            result = load.result()
+            logger.info(
+                f"Default model {result['model_size']} ready "
+                f"(load {result['load_time_seconds']:.2f}s, warm-up {result['warmup_time_seconds']:.2f}s)"
+            )
     
-    def _load_model_sync(self, model_size: str):
+    async def _wait_for_startup_load(self) -> None:
+        """Queue briefly behind the startup load, or fail fast with a Retry-After hint."""
+        startup = self._startup_load
+        if startup is None or startup.done():
+            return
+        
+        try:
+            await asyncio.wait_for(asyncio.shield(startup), timeout=settings.startup_queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            raise ModelNotLoaded(
+                message="Model is still loading, retry shortly",
+                model_size=settings.model_size,
+                retry_after_seconds=settings.model_loading_retry_after_seconds
+            )
+        except Exception:
+            # The failure was logged by the startup callback; the lookup below reports it
+            pass
+    
+    def _set_default_model(self, model_size: str) -> None:
+        """Make a resident model the default for requests that do not name a size."""
+        if model_size != self._model_size:
+            # The default model stays resident however long it sits idle
+            self._pool.pin(model_size)
+            self._model_size = model_size
+            self._model_load_time = time.time()
+    
+    async def _acquire_model(self, model_size: Optional[str]) -> ModelHandle:
+        """
+        Take a handle on a pooled model, loading it first if it is not resident.
+        
+        The caller must pass the handle to self._pool.release() when done; until
+        then the model stays resident even if the pool is over budget.
+        
+        Args:
+            model_size: Model size to use (defaults to the default model)
+        
+        Returns:
+            Immutable handle on the loaded model
+        """
+        await self._wait_for_startup_load()
+        
+        model_size = model_size or self._model_size
+        if model_size is None:
+            raise ModelNotLoaded("No model is currently loaded")
+        
+        handle = self._pool.acquire(model_size)
+        if handle is None:
+            await self.load_model(model_size, make_default=False)
+            handle = self._pool.acquire(model_size)
+        if handle is None:
+            raise ModelNotLoaded(f"Model {model_size} is not loaded", model_size=model_size)
+        
+        return handle
+    
+    def _load_model_sync(self, backend: InferenceBackend, model_size: str):
         """Synchronous model loading (runs in thread pool)."""
         try:
             # Check if CUDA is available
-            device = "cuda" if torch.cuda.is_available() else "cpu"
+            device = self._get_device()
             logger.info(f"Loading model on device: {device}")
             
-            # Load the model
-            model = whisper.load_model(model_size, device=device)
+            # Load the model with the backend configured for this size
+            model = backend.load(model_size, device, self._thread_layout.intra_op_threads)
+            
+            # Concurrent requests share encoder passes on this model
+            if settings.encoder_batching_enabled:
+                backend.enable_batching(
+                    model,
+                    settings.encoder_batch_max_size,
+                    settings.encoder_batch_max_wait_ms / 1000
+                )
             
             # Log memory usage
             memory_usage = get_memory_usage()
@@ -182,13 +439,50 @@ class WhisperService:
             logger.error(f"Error loading model {model_size}: {e}")
             raise
     
+    def _warmup_model_sync(self, backend: InferenceBackend, model) -> float:
+        """
+        Run synthetic audio through a freshly loaded model (runs in thread pool).
+        
+        The first inference pays for allocator growth, kernel selection and
+        mel filterbank setup; doing it here keeps that cost off real requests.
+        
+        Args:
+            backend: Backend the model was loaded with
+            model: Loaded model
+        
+        Returns:
+            Warm-up time in seconds
+        """
+        start_time = time.time()
+        rng = np.random.default_rng(0)
+        
+        try:
+            for seconds in settings.model_warmup_seconds:
+                # Quiet noise keeps decoding short while exercising the full pipeline
+                audio = (0.01 * rng.standard_normal(int(seconds * WHISPER_SAMPLE_RATE))).astype(np.float32)
+                backend.transcribe(model, audio, self._build_transcribe_options(None, 0.0, "transcribe"))
+        except Exception as e:
+            logger.warning(f"Model warm-up failed, continuing without it: {e}")
+        
+        return round(time.time() - start_time, 3)
+    
+    def _get_device(self) -> str:
+        """Get the device models are loaded on."""
+        import torch
+        
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    
     async def transcribe_audio(
         self,
         file_path: str,
         model_size: Optional[str] = None,
         language: Optional[str] = None,
         temperature: float = 0.0,
-        task: str = "transcribe"
+        task: str = "transcribe",
+        raw_pcm_format: Optional[str] = None,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        timeout_seconds: Optional[float] = None,
+        probe: Optional[AudioProbe] = None
     ) -> TranscriptionResponse:
         """
         Transcribe audio file using Whisper.
@@ -199,16 +493,27 @@ class WhisperService:
             language: Language hint (ISO 639-1 code)
             temperature: Temperature for sampling
             task: Task type ('transcribe' or 'translate')
+            raw_pcm_format: Sample format if the file is headerless 16kHz mono PCM
+            progress_callback: Called with the fraction of audio transcribed so far
+                (reported per window or chunk for long recordings)
+            timeout_seconds: Deadline for decoding and inference (None uses the
+                configured request timeout, 0 disables it)
+            probe: Existing probe for the file, reused so its headers are parsed once
         
         Returns:
             TranscriptionResponse with transcription results
+        
+        Raises:
+            TranscriptionTimeout: If the deadline passes; decoding stops at the next window
         """
-        if self._model is None:
-            raise ModelNotLoaded("No model is currently loaded")
+        # Bind this request to one model for its whole lifetime, so concurrent
+        # loads and evictions for other sizes cannot swap it out mid-request
+        handle = await self._acquire_model(model_size)
+        model_size = handle.model_size
         
-        if model_size and model_size != self._model_size:
-            # Load different model if requested
-            await self.load_model(model_size)
+        if timeout_seconds is None:
+            timeout_seconds = settings.request_timeout_seconds
+        token = CancellationToken(timeout_seconds)
         
         start_time = time.time()
         self._active_transcriptions += 1
@@ -216,31 +521,110 @@ class WhisperService:
         try:
             logger.info(f"Starting transcription: {file_path}")
             
+            # Probe once and share the result across scheduling, validation and decoding
+            if probe is None:
+                probe = AudioProbe(file_path, raw_pcm_format=raw_pcm_format)
+            
             # Validate audio file
-            file_info = validate_audio_file(file_path)
+            file_info = validate_audio_file(file_path, probe=probe)
             logger.debug(f"File validation passed: {file_info}")
             
-            # Preprocess audio
+            # Decode audio once in memory, or preprocess to an intermediate WAV
             processed_file = None
             try:
-                processed_file = preprocess_audio(file_path)
-                
-                # Run transcription in thread pool
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    self._executor,
-                    self._transcribe_sync,
-                    processed_file,
-                    language,
-                    temperature,
-                    task
-                )
+                skipped_audio_ratio = None
+                audio_seconds = probe.duration
+                if self._use_streaming(probe):
+                    # Very long recordings are decoded and transcribed window by window
+                    result, skipped_audio_ratio = await self._run_cancellable(
+                        token,
+                        self._transcribe_stream_sync,
+                        handle,
+                        iter_audio_windows(file_path, probe),
+                        language,
+                        temperature,
+                        task,
+                        probe.duration,
+                        progress_callback
+                    )
+                else:
+                    needs_array = settings.vad_enabled or probe.raw_pcm_format
+                    if settings.audio_pipeline_mode == "memory" or needs_array:
+                        audio_input = await self._run_cancellable(
+                            token,
+                            load_audio_array,
+                            file_path,
+                            WHISPER_SAMPLE_RATE,
+                            probe
+                        )
+                    elif settings.fast_lane_enabled and probe.is_conformant:
+                        # Already 16kHz mono PCM; hand the file to the model as-is
+                        audio_input = file_path
+                    else:
+                        processed_file = await self._run_cancellable(
+                            token,
+                            preprocess_audio,
+                            file_path,
+                            WHISPER_SAMPLE_RATE,
+                            probe
+                        )
+                        audio_input = processed_file
+                    
+                    # Drop silence so only speech regions reach the model
+                    timeline = None
+                    if settings.vad_enabled:
+                        audio_seconds = len(audio_input) / WHISPER_SAMPLE_RATE
+                        audio_input, timeline, skipped_audio_ratio = await self._run_cancellable(
+                            token,
+                            skip_silence,
+                            audio_input,
+                            WHISPER_SAMPLE_RATE
+                        )
+                    
+                    if timeline is not None and len(audio_input) == 0:
+                        # Nothing but silence; skip inference entirely
+                        result = {"text": "", "segments": [], "language": language}
+                    elif self._use_longform(audio_input, handle) and self._get_longform_pool(handle) is not None:
+                        # Long recordings are split and transcribed in parallel
+                        # Chunks run in other processes; on timeout the unstarted ones are dropped
+                        try:
+                            result = await asyncio.wait_for(
+                                self._transcribe_longform(
+                                    self._longform_pool,
+                                    audio_input,
+                                    language,
+                                    temperature,
+                                    task,
+                                    progress_callback
+                                ),
+                                token.remaining()
+                            )
+                        except asyncio.TimeoutError:
+                            raise TranscriptionTimeout(timeout_seconds=token.timeout_seconds)
+                    else:
+                        # Run transcription in thread pool
+                        result = await self._run_cancellable(
+                            token,
+                            self._transcribe_sync,
+                            handle,
+                            audio_input,
+                            language,
+                            temperature,
+                            task
+                        )
+                    
+                    # Map segment times back to the original audio
+                    if timeline is not None:
+                        result["segments"] = timeline.map_segments(result.get("segments", []))
                 
                 processing_time = time.time() - start_time
+                if skipped_audio_ratio is not None and audio_seconds:
+                    self._vad_audio_seconds += audio_seconds
+                    self._vad_skipped_seconds += audio_seconds * skipped_audio_ratio
                 
                 # Convert result to response model
                 response = self._create_transcription_response(
-                    result, file_info, processing_time
+                    result, file_info, processing_time, model_size, skipped_audio_ratio
                 )
                 
                 # Log performance metrics
@@ -249,8 +633,9 @@ class WhisperService:
                     duration=processing_time,
                     file_size=file_info["file_size"],
                     memory_usage=get_memory_usage(),
-                    model_size=self._model_size,
-                    language=language
+                    model_size=model_size,
+                    language=language,
+                    skipped_audio_ratio=skipped_audio_ratio
                 )
                 
                 logger.info(f"Transcription completed in {processing_time:.2f}s")
@@ -261,6 +646,12 @@ class WhisperService:
                 if processed_file and settings.cleanup_temp_files:
                     cleanup_temp_file(processed_file)
         
+        except (InvalidAudioFormat, FileTooLarge, AudioProcessingError):
+            # Rejected input is reported as-is rather than as a failed transcription
+            raise
+        except (TranscriptionTimeout, TranscriptionCancelled) as e:
+            logger.warning(f"Transcription stopped after {time.time() - start_time:.2f}s: {e.message}")
+            raise
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise TranscriptionFailed(
@@ -271,27 +662,77 @@ class WhisperService:
         
         finally:
             self._active_transcriptions -= 1
+            self._pool.release(handle)
+    
+    async def _run_cancellable(self, token: CancellationToken, func: Callable, *args) -> Any:
+        """
+        Run a blocking step in the executor under a request's cancellation token.
+        
+        If the deadline passes or the caller is cancelled, the token is
+        cancelled and the worker thread is given until its next checkpoint to
+        stop, so the slot it occupies is really free when this returns.
+        
+        Args:
+            token: The request's cancellation token
+            func: Blocking function to run
+            *args: Arguments for func
+        
+        Returns:
+            Whatever func returns
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.run_in_executor(self._executor, self._call_with_token, token, func, *args)
+        
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), token.remaining())
+        except asyncio.TimeoutError:
+            token.cancel("timeout")
+            await self._wait_for_checkpoint(future)
+            raise TranscriptionTimeout(timeout_seconds=token.timeout_seconds)
+        except asyncio.CancelledError:
+            token.cancel("cancelled")
+            await self._wait_for_checkpoint(future)
+            raise
+    
+    @staticmethod
+    def _call_with_token(token: CancellationToken, func: Callable, *args) -> Any:
+        """Run func with the token bound to this worker thread (runs in thread pool)."""
+        with bind_token(token):
+            token.check()
+            return func(*args)
+    
+    @staticmethod
+    async def _wait_for_checkpoint(future: asyncio.Future) -> None:
+        """Wait for a cancelled step's worker thread to stop, discarding its outcome."""
+        await asyncio.wait([future])
+        if not future.cancelled():
+            # Mark the cancellation error as retrieved
+            future.exception()
     
     def _transcribe_sync(
         self,
-        file_path: str,
+        handle: ModelHandle,
+        audio: Union[str, np.ndarray],
         language: Optional[str],
         temperature: float,
         task: str
     ):
-        """Synchronous transcription (runs in thread pool)."""
+        """
+        Synchronous transcription (runs in thread pool).
+        
+        Args:
+            handle: Handle on the pooled model to run
+            audio: Path to a preprocessed file, or a 16kHz mono float32 array
+            language: Language hint (ISO 639-1 code)
+            temperature: Temperature for sampling
+            task: Task type ('transcribe' or 'translate')
+        """
         try:
             # Prepare transcription options
-            options = {
-                "temperature": temperature,
-                "task": task
-            }
-            
-            if language:
-                options["language"] = language
+            options = self._build_transcribe_options(language, temperature, task)
             
             # Run transcription
-            result = self._model.transcribe(file_path, **options)
+            result = get_backend(handle.backend).transcribe(handle.model, audio, options)
             
             return result
         
@@ -299,11 +740,235 @@ class WhisperService:
             logger.error(f"Sync transcription failed: {e}")
             raise
     
+    def _build_transcribe_options(
+        self,
+        language: Optional[str],
+        temperature: float,
+        task: str
+    ) -> Dict[str, Any]:
+        """Build keyword options for model.transcribe."""
+        options = {
+            "temperature": temperature,
+            "task": task
+        }
+        
+        if language:
+            options["language"] = language
+        
+        return options
+    
+    def _use_streaming(self, probe: AudioProbe) -> bool:
+        """Check whether a file is long enough to be decoded as a stream of windows."""
+        return (
+            settings.streaming_decode_enabled
+            and probe.duration is not None
+            and probe.duration >= settings.streaming_min_duration_seconds
+            and can_stream_audio(probe)
+        )
+    
+    def _transcribe_stream_sync(
+        self,
+        handle: ModelHandle,
+        windows: Iterator[np.ndarray],
+        language: Optional[str],
+        temperature: float,
+        task: str,
+        duration: Optional[float] = None,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> Tuple[Dict[str, Any], Optional[float]]:
+        """
+        Transcribe a stream of audio windows one at a time (runs in thread pool).
+        
+        The language detected in the first window is reused for the rest, and
+        the end of each window's text is passed as the prompt for the next so
+        sentences continue across window boundaries.
+        
+        Args:
+            handle: Handle on the pooled model to run
+            windows: Consecutive 16kHz mono float32 windows of the recording
+            language: Language hint (ISO 639-1 code)
+            temperature: Temperature for sampling
+            task: Task type ('transcribe' or 'translate')
+            duration: Recording duration in seconds, for progress reporting
+            progress_callback: Called with the fraction transcribed after each window
+        
+        Returns:
+            Tuple of Whisper-style result on the full timeline and the fraction
+            of audio skipped by VAD (None when VAD is disabled)
+        """
+        backend = get_backend(handle.backend)
+        options = self._build_transcribe_options(language, temperature, task)
+        segments = []
+        texts = []
+        offset = 0.0
+        total_samples = 0
+        skipped_samples = 0
+        
+        for window in windows:
+            check_cancelled()
+            window_samples = len(window)
+            total_samples += window_samples
+            
+            timeline = None
+            if settings.vad_enabled:
+                window, timeline, skipped_ratio = skip_silence(window, WHISPER_SAMPLE_RATE)
+                skipped_samples += round(skipped_ratio * window_samples)
+            
+            if len(window):
+                result = backend.transcribe(handle.model, window, options)
+                window_segments = result.get("segments", [])
+                if timeline is not None:
+                    window_segments = timeline.map_segments(window_segments)
+                
+                for segment in window_segments:
+                    shifted = dict(segment)
+                    shifted.update(
+                        id=len(segments),
+                        start=segment.get("start", 0.0) + offset,
+                        end=segment.get("end", 0.0) + offset
+                    )
+                    segments.append(shifted)
+                
+                text = result.get("text", "").strip()
+                if text:
+                    texts.append(text)
+                    # Carry context into the next window
+                    options["initial_prompt"] = text[-STREAMING_PROMPT_CHARS:]
+                
+                if "language" not in options and result.get("language"):
+                    options["language"] = result["language"]
+            
+            offset += window_samples / WHISPER_SAMPLE_RATE
+            if progress_callback is not None and duration:
+                progress_callback(min(1.0, offset / duration))
+        
+        logger.info(f"Streamed transcription of {offset:.0f}s in {len(segments)} segments")
+        
+        result = {
+            "text": " ".join(texts),
+            "segments": segments,
+            "language": options.get("language")
+        }
+        skipped_audio_ratio = None
+        if settings.vad_enabled:
+            skipped_audio_ratio = round(skipped_samples / total_samples, 4) if total_samples else 0.0
+        
+        return result, skipped_audio_ratio
+    
+    def _use_longform(self, audio: Union[str, np.ndarray], handle: ModelHandle) -> bool:
+        """
+        Check whether audio should go through parallel long-form transcription.
+        
+        Every pool process holds its own copy of the model, so long-form mode
+        is limited to the default model on CPU: one pool is kept rather than
+        one per model size, and GPU memory is not filled with copies.
+        """
+        return (
+            settings.longform_enabled
+            and isinstance(audio, np.ndarray)
+            and len(audio) >= settings.longform_min_duration_seconds * WHISPER_SAMPLE_RATE
+            and handle.model_size == self._model_size
+            and self._get_device() == "cpu"
+        )
+    
+    def _get_longform_pool(self, handle: ModelHandle):
+        """
+        Get the long-form process pool, starting it if the default model changed.
+        
+        The pool's model copies are reserved in the model pool's memory
+        budget; if they do not fit, no pool is started.
+        
+        Returns:
+            The process pool, or None to transcribe in-process instead
+        """
+        pool_key = (handle.backend, handle.model_size)
+        if self._longform_pool is not None and self._longform_pool_key == pool_key:
+            return self._longform_pool
+        
+        self._stop_longform_pool(wait=False)
+        
+        workers = settings.longform_workers or default_worker_count(settings.server_workers)
+        memory_mb = round(workers * handle.memory_mb, 2)
+        if not self._pool.reserve(LONGFORM_RESERVATION, memory_mb):
+            logger.warning(
+                f"Long-form pool of {workers} x model {handle.model_size} ({memory_mb} MB) "
+                f"does not fit the model memory budget; transcribing in-process"
+            )
+            return None
+        
+        self._longform_pool = create_worker_pool(
+            handle.backend,
+            handle.model_size,
+            self._get_device(),
+            workers,
+            settings.server_workers
+        )
+        self._longform_pool_key = pool_key
+        return self._longform_pool
+    
+    def _stop_longform_pool(self, wait: bool) -> None:
+        """Shut down the long-form pool and release its memory reservation."""
+        if self._longform_pool is not None:
+            # With wait=False, in-flight chunks on the old pool still complete
+            self._longform_pool.shutdown(wait=wait)
+            self._longform_pool = None
+            self._longform_pool_key = None
+        self._pool.unreserve(LONGFORM_RESERVATION)
+    
+    async def _transcribe_longform(
+        self,
+        pool: Any,
+        audio: np.ndarray,
+        language: Optional[str],
+        temperature: float,
+        task: str,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Transcribe long audio as overlapping chunks on the process pool.
+        
+        Args:
+            pool: Long-form process pool from _get_longform_pool()
+            audio: 16kHz mono float32 array
+            language: Language hint (ISO 639-1 code)
+            temperature: Temperature for sampling
+            task: Task type ('transcribe' or 'translate')
+            progress_callback: Called with the fraction of chunks finished as each completes
+        
+        Returns:
+            Whisper-style result stitched onto the full timeline
+        """
+        chunks = plan_chunks(
+            audio,
+            WHISPER_SAMPLE_RATE,
+            settings.longform_chunk_seconds,
+            settings.longform_overlap_seconds
+        )
+        options = self._build_transcribe_options(language, temperature, task)
+        
+        logger.info(f"Long-form transcription of {len(audio) / WHISPER_SAMPLE_RATE:.0f}s in {len(chunks)} chunks")
+        
+        loop = asyncio.get_event_loop()
+        futures = [
+            loop.run_in_executor(pool, transcribe_chunk, audio[chunk.start:chunk.end], options)
+            for chunk in chunks
+        ]
+        if progress_callback is not None:
+            for future in futures:
+                future.add_done_callback(
+                    lambda _: progress_callback(sum(f.done() for f in futures) / len(futures))
+                )
+        results = await asyncio.gather(*futures)
+        
+        return stitch_results(results, chunks, WHISPER_SAMPLE_RATE)
+    
     def _create_transcription_response(
         self,
         whisper_result: Dict[str, Any],
         file_info: Dict[str, Any],
-        processing_time: float
+        processing_time: float,
+        model_size: str,
+        skipped_audio_ratio: Optional[float] = None
     ) -> TranscriptionResponse:
         """Create TranscriptionResponse from Whisper result."""
         
@@ -335,18 +1000,23 @@ class WhisperService:
             duration=file_info["duration"],
             segments=segments,
             confidence_score=confidence_score,
-            model_used=self._model_size,
-            processing_time=round(processing_time, 3)
+            model_used=model_size,
+            processing_time=round(processing_time, 3),
+            skipped_audio_ratio=skipped_audio_ratio
         )
     
     def get_model_info(self) -> ModelInfoResponse:
         """Get information about the currently loaded model."""
+        handle = self._pool.peek(self._model_size) if self._model_size else None
         return ModelInfoResponse(
             model_size=self._model_size or "none",
             memory_usage_mb=get_memory_usage(),
             load_time_seconds=0.0 if not self._model_load_time else time.time() - self._model_load_time,
+            warmup_time_seconds=handle.warmup_seconds if handle else None,
+            backend=get_backend(handle.backend).describe(handle.model) if handle else None,
             supported_languages=self._supported_languages,
-            is_loaded=self._model is not None,
+            is_loaded=self.is_model_loaded(),
+            thread_layout=ThreadLayoutInfo(**self._thread_layout.to_dict()),
             last_loaded=datetime.fromtimestamp(self._model_load_time) if self._model_load_time else None
         )
     
@@ -355,23 +1025,48 @@ class WhisperService:
         """Get service uptime in seconds."""
         return time.time() - self._start_time
     
+    def get_vad_metrics(self) -> Dict[str, Any]:
+        """Get the audio VAD has seen since startup and how much of it was skipped."""
+        return {
+            "enabled": settings.vad_enabled,
+            "audio_seconds_total": round(self._vad_audio_seconds, 3),
+            "speech_seconds_total": round(self._vad_audio_seconds - self._vad_skipped_seconds, 3),
+            "skipped_seconds_total": round(self._vad_skipped_seconds, 3)
+        }
+    
     def get_active_transcriptions(self) -> int:
         """Get number of active transcriptions."""
         return self._active_transcriptions
     
     def is_model_loaded(self) -> bool:
-        """Check if a model is currently loaded."""
-        return self._model is not None
+        """Check if the default model is currently loaded."""
+        return self._model_size is not None and self._model_size in self._pool
+    
+    def is_model_loading(self) -> bool:
+        """Check if the background startup load is still running."""
+        return self._startup_load is not None and not self._startup_load.done()
     
     def get_current_model_size(self) -> Optional[str]:
         """Get currently loaded model size."""
         return self._model_size
     
+    def get_pool_info(self) -> ModelPoolResponse:
+        """Get the models resident in the pool."""
+        return ModelPoolResponse(
+            default_model=self._model_size,
+            memory_budget_mb=self._pool.memory_budget_mb,
+            used_memory_mb=self._pool.used_memory_mb,
+            models=[PooledModelInfo(**entry) for entry in self._pool.snapshot()]
+        )
+    
     async def cleanup(self):
         """Cleanup resources and shutdown executor."""
         try:
             logger.info("Cleaning up WhisperService resources")
             
+            if self.is_model_loading():
+                self._startup_load.cancel()
+            
             # Wait for active transcriptions to complete
             while self._active_transcriptions > 0:
                 logger.info(f"Waiting for {self._active_transcriptions} active transcriptions to complete")
@@ -380,11 +1075,11 @@ class WhisperService:
             # Shutdown executor
             self._executor.shutdown(wait=True)
             
-            # Clear model from memory
-            if self._model is not None:
-                del self._model
-                self._model = None
-                self._model_size = None
+            self._stop_longform_pool(wait=True)
+            
+            # Clear models from memory
+            self._pool.clear()
+            self._model_size = None
             
             # Force garbage collection
             import gc
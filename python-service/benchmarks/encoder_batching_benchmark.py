@@ -0,0 +1,87 @@
+"""
+Throughput of concurrent short transcriptions with and without encoder batching.
+
+Runs the same set of clips through one model from several threads at once,
+first with each request encoding alone and then with EncoderBatcher
+installed, and reports clips per second, mean latency and the average
+encoder batch size.
+
+Usage (from the python-service directory):
+    python -m benchmarks.encoder_batching_benchmark --model base --concurrency 8
+    python -m benchmarks.encoder_batching_benchmark --batch 4 --wait-ms 20 clip1.wav clip2.wav
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+
+from app.batching import enable_encoder_batching
+from app.utils import WHISPER_SAMPLE_RATE, load_audio_array
+
+
+def run_round(model, clips: List[np.ndarray], concurrency: int, threads: int) -> Dict[str, float]:
+    """Transcribe every clip with `concurrency` worker threads."""
+    import torch
+    
+    options = {"temperature": 0.0, "fp16": False, "language": "en"}
+    
+    def transcribe(audio: np.ndarray) -> float:
+        torch.set_num_threads(threads)
+        start = time.perf_counter()
+        model.transcribe(audio, **options)
+        return time.perf_counter() - start
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(transcribe, clips))
+    wall = time.perf_counter() - start
+    
+    return {"throughput": len(clips) / wall, "latency": sum(latencies) / len(latencies)}
+
+
+def main() -> None:
+    import whisper
+    
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("audio", nargs="*", help="Audio clips (default: synthetic 10s noise clips)")
+    parser.add_argument("--model", default="base", help="Whisper model size")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent transcriptions")
+    parser.add_argument("--clips", type=int, default=32, help="Clips per round when no audio is given")
+    parser.add_argument("--batch", type=int, default=8, help="Max encoder batch size")
+    parser.add_argument("--wait-ms", type=float, default=10.0, help="Max wait for a batch to fill")
+    parser.add_argument("--threads", type=int, default=1, help="torch threads per worker")
+    args = parser.parse_args()
+    
+    if args.audio:
+        clips = [load_audio_array(path) for path in args.audio]
+    else:
+        rng = np.random.default_rng(0)
+        clips = [
+            (0.01 * rng.standard_normal(10 * WHISPER_SAMPLE_RATE)).astype(np.float32)
+            for _ in range(args.clips)
+        ]
+    
+    model = whisper.load_model(args.model, device="cpu")
+    # Keep one-time setup cost out of the measurements
+    model.transcribe(clips[0], temperature=0.0, fp16=False, language="en")
+    
+    unbatched = run_round(model, clips, args.concurrency, args.threads)
+    batcher = enable_encoder_batching(model, args.batch, args.wait_ms / 1000)
+    batched = run_round(model, clips, args.concurrency, args.threads)
+    
+    print(f"Model {args.model}, {len(clips)} clips, concurrency {args.concurrency}, "
+          f"{args.threads} torch threads per worker\n")
+    print(f"{'variant':<12}{'clips/s':>10}{'latency s':>12}{'avg batch':>11}")
+    print(f"{'unbatched':<12}{unbatched['throughput']:>10.2f}{unbatched['latency']:>12.2f}{1.0:>11.2f}")
+    print(
+        f"{'batched':<12}{batched['throughput']:>10.2f}{batched['latency']:>12.2f}"
+        f"{batcher.stats()['avg_batch_size'] or 0:>11.2f}"
+    )
+    print(f"\nSpeedup: {batched['throughput'] / unbatched['throughput']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Load time and peak memory of pickled vs memory-mapped Whisper checkpoints.
+
+Each load runs in a fresh interpreter so peak RSS reflects that load alone.
+The first mapped load converts the checkpoint (a one-time cost, reported
+separately); later mapped loads only map the converted file. Drop the page
+cache between runs (echo 3 > /proc/sys/vm/drop_caches) to measure cold loads.
+
+Usage (from the python-service directory):
+    python -m benchmarks.model_load_benchmark --model medium
+    python -m benchmarks.model_load_benchmark --model small --repeat 5 --cache-dir /tmp/ckpt
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOAD_SNIPPET = """
+import json, resource, sys, time
+mode, model_size, cache_dir = sys.argv[1:4]
+import torch, whisper
+from app.checkpoints import load_mapped_model
+start = time.perf_counter()
+if mode == "pickle":
+    model = whisper.load_model(model_size, device="cpu")
+else:
+    model = load_mapped_model(model_size, "cpu", cache_dir)
+seconds = time.perf_counter() - start
+print(json.dumps({"seconds": seconds, "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+"""
+
+
+def run_load(mode: str, model_size: str, cache_dir: str) -> Dict[str, float]:
+    """Load a model once in a fresh interpreter and return its timing."""
+    proc = subprocess.run(
+        [sys.executable, "-c", LOAD_SNIPPET, mode, model_size, cache_dir],
+        cwd=SERVICE_DIR,
+        capture_output=True,
+        text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{mode} load failed:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="base", help="Whisper model size")
+    parser.add_argument("--repeat", type=int, default=3, help="Loads per variant (best is reported)")
+    parser.add_argument("--cache-dir", default=None, help="Converted checkpoint directory (default: a fresh temp dir)")
+    args = parser.parse_args()
+    
+    cache_dir = args.cache_dir or tempfile.mkdtemp(prefix="whisperrr-ckpt-")
+    
+    # The first mapped load into an empty cache includes the conversion
+    conversion = run_load("mmap", args.model, cache_dir)
+    
+    results = {
+        mode: [run_load(mode, args.model, cache_dir) for _ in range(args.repeat)]
+        for mode in ("pickle", "mmap")
+    }
+    
+    print(f"Model {args.model}, best of {args.repeat} loads, cache {cache_dir}\n")
+    print(f"{'variant':<16}{'load s':>9}{'peak RSS MB':>13}")
+    print(f"{'mmap (convert)':<16}{conversion['seconds']:>9.2f}{conversion['peak_rss_mb']:>13.0f}")
+    for mode, runs in results.items():
+        print(
+            f"{mode:<16}{min(r['seconds'] for r in runs):>9.2f}"
+            f"{min(r['peak_rss_mb'] for r in runs):>13.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
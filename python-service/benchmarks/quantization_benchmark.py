@@ -0,0 +1,199 @@
+"""
+Accuracy and speed comparison of fp32 and dynamic int8 CPU inference.
+
+Loads a Whisper model unquantized and quantized, transcribes the same audio
+files with both, and reports load time, estimated model memory, real-time
+factor and word error rate. WER is measured against reference transcripts
+when given (a .txt file next to each audio file with the same stem), and
+always against the fp32 output so the accuracy cost of quantization is
+visible even without references.
+
+It also compares a fresh quantization with a load from the int8 cache. Each
+of those loads runs in a fresh interpreter so peak RSS reflects that load
+alone.
+
+Usage (from the python-service directory):
+    python -m benchmarks.quantization_benchmark samples/*.wav
+    python -m benchmarks.quantization_benchmark --model small --threads 4 talk.flac
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.model_pool import estimate_model_memory_mb
+from app.quantization import quantize_dynamic_int8
+from app.utils import WHISPER_SAMPLE_RATE, load_audio_array
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOAD_SNIPPET = """
+import json, resource, sys, time
+mode, model_size, cache_dir = sys.argv[1:4]
+import torch, whisper
+from app.quantization import load_quantized_model, quantize_dynamic_int8
+start = time.perf_counter()
+if mode == "quantize":
+    model = quantize_dynamic_int8(whisper.load_model(model_size, device="cpu"))
+else:
+    model = load_quantized_model(model_size, cache_dir)
+seconds = time.perf_counter() - start
+print(json.dumps({"seconds": seconds, "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+"""
+
+
+def normalize_words(text: str) -> List[str]:
+    """Lowercase and strip punctuation for WER."""
+    return re.sub(r"[^\w\s']", " ", text.lower()).split()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Word-level Levenshtein distance divided by the reference length."""
+    ref, hyp = normalize_words(reference), normalize_words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            ))
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def read_reference(audio_path: str) -> Optional[str]:
+    """Read the reference transcript stored next to an audio file, if any."""
+    path = os.path.splitext(audio_path)[0] + ".txt"
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def run_variant(model, clips: Dict[str, np.ndarray], language: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Transcribe every clip once (after one warm-up) and time each."""
+    options = {"temperature": 0.0, "fp16": False}
+    if language:
+        options["language"] = language
+    
+    # Keep one-time setup cost out of the measurements
+    model.transcribe(next(iter(clips.values()))[:WHISPER_SAMPLE_RATE * 5], **options)
+    
+    results = {}
+    for name, audio in clips.items():
+        start = time.perf_counter()
+        result = model.transcribe(audio, **options)
+        results[name] = {"text": result.get("text", ""), "seconds": time.perf_counter() - start}
+    return results
+
+
+def run_load(mode: str, model_size: str, cache_dir: str) -> Dict[str, float]:
+    """Load an int8 model once in a fresh interpreter and return its timing."""
+    proc = subprocess.run(
+        [sys.executable, "-c", LOAD_SNIPPET, mode, model_size, cache_dir],
+        cwd=SERVICE_DIR,
+        capture_output=True,
+        text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{mode} load failed:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def compare_loads(model_size: str, repeat: int) -> None:
+    """Print load time and peak RSS of a fresh quantization and of cached loads."""
+    cache_dir = tempfile.mkdtemp(prefix="whisperrr-int8-")
+    
+    # The first load into an empty cache quantizes and writes the cache
+    first = run_load("cached", model_size, cache_dir)
+    results = {
+        "quantize": [run_load("quantize", model_size, cache_dir) for _ in range(repeat)],
+        "cached": [run_load("cached", model_size, cache_dir) for _ in range(repeat)]
+    }
+    
+    print(f"\nint8 loads, best of {repeat}, cache {cache_dir}\n")
+    print(f"{'variant':<16}{'load s':>9}{'peak RSS MB':>13}")
+    print(f"{'cache (write)':<16}{first['seconds']:>9.2f}{first['peak_rss_mb']:>13.0f}")
+    for mode, runs in results.items():
+        print(
+            f"{mode:<16}{min(r['seconds'] for r in runs):>9.2f}"
+            f"{min(r['peak_rss_mb'] for r in runs):>13.0f}"
+        )
+
+
+def main() -> None:
+    import torch
+    import whisper
+    
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("audio", nargs="+", help="Audio files to transcribe")
+    parser.add_argument("--model", default="base", help="Whisper model size")
+    parser.add_argument("--language", default=None, help="Language hint (skips detection)")
+    parser.add_argument("--threads", type=int, default=None, help="torch intra-op threads")
+    parser.add_argument("--repeat", type=int, default=3, help="int8 loads per variant (best is reported)")
+    args = parser.parse_args()
+    
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    
+    clips = {path: load_audio_array(path) for path in args.audio}
+    audio_seconds = sum(len(audio) for audio in clips.values()) / WHISPER_SAMPLE_RATE
+    references = {path: read_reference(path) for path in args.audio}
+    
+    variants = {}
+    outputs = {}
+    for name in ("fp32", "int8"):
+        start = time.perf_counter()
+        model = whisper.load_model(args.model, device="cpu")
+        if name == "int8":
+            model = quantize_dynamic_int8(model)
+        load_seconds = time.perf_counter() - start
+        
+        outputs[name] = run_variant(model, clips, args.language)
+        variants[name] = {
+            "load": load_seconds,
+            "memory": estimate_model_memory_mb(model),
+            "seconds": sum(r["seconds"] for r in outputs[name].values())
+        }
+        del model
+    
+    print(f"Model {args.model}, {len(clips)} files, {audio_seconds:.0f}s of audio, "
+          f"{torch.get_num_threads()} threads\n")
+    print(f"{'variant':<8}{'load s':>9}{'memory MB':>11}{'RTF':>8}{'speedup':>9}{'WER ref':>9}{'WER fp32':>10}")
+    
+    for name, stats in variants.items():
+        scored = [path for path, ref in references.items() if ref is not None]
+        wer_ref = (
+            sum(word_error_rate(references[p], outputs[name][p]["text"]) for p in scored) / len(scored)
+            if scored else None
+        )
+        wer_fp32 = sum(
+            word_error_rate(outputs["fp32"][p]["text"], outputs[name][p]["text"]) for p in clips
+        ) / len(clips)
+        
+        print(
+            f"{name:<8}{stats['load']:>9.2f}{stats['memory']:>11.1f}"
+            f"{stats['seconds'] / audio_seconds:>8.3f}"
+            f"{variants['fp32']['seconds'] / stats['seconds']:>8.2f}x"
+            f"{(f'{wer_ref:.3f}' if wer_ref is not None else '-'):>9}"
+            f"{wer_fp32:>10.3f}"
+        )
+    
+    compare_loads(args.model, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
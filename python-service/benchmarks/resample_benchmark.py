@@ -0,0 +1,63 @@
+"""
+Microbenchmark for the resampler backends in app.utils.
+
+Reports how many seconds of audio each backend resamples to 16kHz per
+CPU-second, so a backend can be picked per deployment via RESAMPLER_BACKEND.
+
+Usage (from the python-service directory):
+    python -m benchmarks.resample_benchmark
+    python -m benchmarks.resample_benchmark --seconds 120 --rates 44100 48000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from app.utils import RESAMPLERS, WHISPER_SAMPLE_RATE, resample_audio
+
+
+def make_test_signal(seconds: float, sample_rate: int) -> np.ndarray:
+    """Generate a speech-like test signal (harmonic sweep plus noise)."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    f0 = 120 + 40 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / sample_rate
+    signal = sum(np.sin(k * phase) / k for k in range(1, 8))
+    signal += 0.05 * rng.standard_normal(len(t))
+    return (signal / np.max(np.abs(signal))).astype(np.float32)
+
+
+def benchmark_backend(backend: str, audio: np.ndarray, orig_sr: int, repeat: int) -> float:
+    """Return seconds of audio resampled per CPU-second (best of repeat runs)."""
+    audio_seconds = len(audio) / orig_sr
+    best = float("inf")
+    
+    for _ in range(repeat):
+        start = time.process_time()
+        resample_audio(audio, orig_sr, WHISPER_SAMPLE_RATE, backend=backend)
+        best = min(best, time.process_time() - start)
+    
+    return audio_seconds / max(best, 1e-9)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=60.0, help="Length of the test signal")
+    parser.add_argument("--rates", type=int, nargs="+", default=[22050, 44100, 48000], help="Input sample rates")
+    parser.add_argument("--backends", nargs="+", default=sorted(RESAMPLERS), help="Backends to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per backend (best is reported)")
+    args = parser.parse_args()
+    
+    print(f"Resampling {args.seconds:.0f}s of audio to {WHISPER_SAMPLE_RATE}Hz "
+          f"(audio seconds per CPU-second, higher is better)\n")
+    print(f"{'backend':<12}" + "".join(f"{rate:>12}" for rate in args.rates))
+    
+    signals = {rate: make_test_signal(args.seconds, rate) for rate in args.rates}
+    for backend in args.backends:
+        row = [benchmark_backend(backend, signals[rate], rate, args.repeat) for rate in args.rates]
+        print(f"{backend:<12}" + "".join(f"{value:>12.0f}" for value in row))
+
+
+if __name__ == "__main__":
+    main()
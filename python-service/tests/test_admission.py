@@ -0,0 +1,79 @@
+"""
+Tests for the wait estimates the admission controller reports to clients.
+"""
+
+import asyncio
+
+import pytest
+
+from app.admission import AdmissionController, INITIAL_SERVICE_SECONDS
+from app.exceptions import ServiceOverloaded, TranscriptionCancelled, TranscriptionTimeout
+
+
+def test_queued_request_gets_its_expected_wait():
+    async def scenario():
+        controller = AdmissionController(max_concurrent=1, queue_depth=1)
+        
+        async with controller.admit(duration_seconds=30) as first:
+            waiter = asyncio.ensure_future(_admission(controller, 30))
+            await asyncio.sleep(0)
+        second = await waiter
+        return first, second
+    
+    first, second = asyncio.run(scenario())
+    
+    assert first.expected_wait_seconds == 0.0
+    assert second.expected_wait_seconds == pytest.approx(INITIAL_SERVICE_SECONDS, rel=0.1)
+
+
+def test_rejection_carries_estimated_wait():
+    async def scenario():
+        controller = AdmissionController(max_concurrent=1, queue_depth=0)
+        
+        async with controller.admit(duration_seconds=30):
+            with pytest.raises(ServiceOverloaded) as rejected:
+                async with controller.admit(duration_seconds=30):
+                    pass
+        return rejected.value
+    
+    error = asyncio.run(scenario())
+    
+    assert error.details["estimated_wait_seconds"] == pytest.approx(INITIAL_SERVICE_SECONDS, rel=0.1)
+    assert error.details["retry_after_seconds"] >= 1
+
+
+def test_release_counts_each_outcome_once():
+    async def scenario():
+        controller = AdmissionController(max_concurrent=2, queue_depth=2)
+        
+        async with controller.admit(duration_seconds=30):
+            pass
+        for error in (TranscriptionTimeout(timeout_seconds=1), RuntimeError("boom"), TranscriptionCancelled()):
+            with pytest.raises(type(error)):
+                async with controller.admit(duration_seconds=30):
+                    raise error
+        
+        # A request cancelled while holding its slot
+        held = asyncio.ensure_future(_hold(controller))
+        await asyncio.sleep(0)
+        held.cancel()
+        await asyncio.wait([held])
+        return controller.metrics()
+    
+    metrics = asyncio.run(scenario())
+    
+    assert metrics["admitted_total"] == 5
+    assert (metrics["completed_total"], metrics["failed_total"], metrics["cancelled_total"]) == (1, 2, 2)
+    assert metrics["running"] == 0
+
+
+async def _hold(controller: AdmissionController):
+    """Hold a slot until cancelled."""
+    async with controller.admit(duration_seconds=30):
+        await asyncio.Event().wait()
+
+
+async def _admission(controller: AdmissionController, duration: float):
+    """Wait for a slot and return the admission record."""
+    async with controller.admit(duration_seconds=duration) as admission:
+        return admission
@@ -0,0 +1,217 @@
+"""
+Tests for the header-only audio duration parsers.
+"""
+
+import struct
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from app.audio_headers import parse_audio_header
+from app.exceptions import InvalidAudioFormat
+
+SAMPLE_RATE = 16000
+SECONDS = 10
+
+
+def chunk(chunk_id: bytes, body: bytes) -> bytes:
+    """A RIFF chunk, padded to an even length."""
+    return struct.pack('<4sI', chunk_id, len(body)) + body + b'\0' * (len(body) & 1)
+
+
+def make_wav(chunks) -> bytes:
+    """A RIFF/WAVE file holding the given chunks in order."""
+    body = b'WAVE' + b''.join(chunks)
+    return struct.pack('<4sI', b'RIFF', len(body)) + body
+
+
+def wav_fmt(channels: int = 1, sample_rate: int = SAMPLE_RATE, bits: int = 16) -> bytes:
+    """A PCM fmt chunk."""
+    block_align = channels * bits // 8
+    return chunk(b'fmt ', struct.pack(
+        '<HHIIHH', 1, channels, sample_rate, sample_rate * block_align, block_align, bits
+    ))
+
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, mono: 417-byte frames of 1152 samples
+MP3_FRAME_HEADER = b'\xff\xfb\x90\xc0'
+MP3_FRAME_BYTES = 417
+MP3_FRAME_SECONDS = 1152 / 44100
+
+
+def make_mp3(frames: int, xing: bool = False) -> bytes:
+    """A stream of silent frames, the first carrying a Xing header if asked."""
+    first = bytearray(MP3_FRAME_HEADER + bytes(MP3_FRAME_BYTES - 4))
+    if xing:
+        # Mono MPEG-1 side information is 17 bytes
+        first[21:37] = b'Xing' + struct.pack('>III', 0x03, frames, frames * MP3_FRAME_BYTES)
+    frame = MP3_FRAME_HEADER + bytes(MP3_FRAME_BYTES - 4)
+    return bytes(first) + frame * (frames - 1)
+
+
+def box(box_type: bytes, *children: bytes) -> bytes:
+    """An MP4 box wrapping the given payload."""
+    payload = b''.join(children)
+    return struct.pack('>I4s', 8 + len(payload), box_type) + payload
+
+
+def make_m4a(seconds: float, sample_rate: int = 44100, channels: int = 2) -> bytes:
+    """A minimal M4A: ftyp, a moov with one AAC sound track, and an mdat."""
+    timescale = 1000
+    mvhd = box(b'mvhd', struct.pack('>4xIIII', 0, 0, timescale, int(seconds * timescale)), bytes(80))
+    hdlr = box(b'hdlr', struct.pack('>4x4x4s', b'soun'), bytes(12), b'\0')
+    mp4a = box(b'mp4a', bytes(6), struct.pack('>H8xHH4xI', 1, channels, 16, sample_rate << 16))
+    stsd = box(b'stsd', struct.pack('>4xI', 1), mp4a)
+    trak = box(b'trak', box(b'mdia', hdlr, box(b'minf', box(b'stbl', stsd))))
+    return box(b'ftyp', b'M4A ', bytes(4)) + box(b'moov', mvhd, trak) + box(b'mdat', bytes(4096))
+
+
+def write_audio(path, audio: np.ndarray, **kwargs) -> bytes:
+    """Encode audio with libsndfile and return the file contents."""
+    sf.write(str(path), audio, SAMPLE_RATE, **kwargs)
+    return path.read_bytes()
+
+
+def clear_end_of_stream(data: bytes) -> bytes:
+    """Drop the end-of-stream flag from the last Ogg page."""
+    data = bytearray(data)
+    last_page = data.rfind(b'OggS')
+    data[last_page + 5] &= ~0x04
+    return bytes(data)
+
+
+@pytest.fixture(params=["noise", "tone", "silence"])
+def audio(request) -> np.ndarray:
+    """Mono audio that compresses poorly, well and almost completely."""
+    t = np.arange(SAMPLE_RATE * SECONDS) / SAMPLE_RATE
+    if request.param == "noise":
+        return np.random.default_rng(0).uniform(-1, 1, len(t))
+    if request.param == "tone":
+        return 0.3 * np.sin(2 * np.pi * 440 * t)
+    return np.zeros(len(t))
+
+
+def test_complete_flac_reports_its_duration(tmp_path, audio):
+    write_audio(tmp_path / "audio.flac", audio)
+    
+    header = parse_audio_header(str(tmp_path / "audio.flac"))
+    
+    assert header.duration == pytest.approx(SECONDS)
+
+
+@pytest.mark.parametrize("fraction", [0.5, 0.99])
+def test_truncated_flac_is_rejected(tmp_path, audio, fraction):
+    data = write_audio(tmp_path / "audio.flac", audio)
+    (tmp_path / "truncated.flac").write_bytes(data[:int(len(data) * fraction)])
+    
+    with pytest.raises(InvalidAudioFormat):
+        parse_audio_header(str(tmp_path / "truncated.flac"))
+
+
+def test_ogg_without_end_of_stream_page_uses_last_granule(tmp_path, audio):
+    data = write_audio(tmp_path / "audio.ogg", audio, format="OGG", subtype="VORBIS")
+    (tmp_path / "open.ogg").write_bytes(clear_end_of_stream(data))
+    
+    header = parse_audio_header(str(tmp_path / "open.ogg"))
+    
+    assert header.duration == pytest.approx(SECONDS)
+
+
+def test_wav_reports_its_duration(tmp_path):
+    path = tmp_path / "audio.wav"
+    path.write_bytes(make_wav([wav_fmt(channels=2), chunk(b'data', bytes(4 * SAMPLE_RATE * 2))]))
+    
+    header = parse_audio_header(str(path))
+    
+    assert header.duration == pytest.approx(2.0)
+    assert (header.channels, header.codec, header.bits_per_sample) == (2, "pcm", 16)
+
+
+def test_wav_fmt_chunk_after_data_is_found(tmp_path):
+    data = bytes(2 * SAMPLE_RATE * 3)
+    info = chunk(b'LIST', b'INFOjunk!')
+    path = tmp_path / "audio.wav"
+    path.write_bytes(make_wav([info, chunk(b'data', data), wav_fmt()]))
+    
+    header = parse_audio_header(str(path))
+    
+    assert header.duration == pytest.approx(3.0)
+    # RIFF header, the LIST chunk, then the data chunk header
+    assert header.data_offset == 12 + len(info) + 8
+    assert header.data_size == len(data)
+
+
+@pytest.mark.parametrize("chunks", [
+    [wav_fmt()],
+    [chunk(b'data', bytes(SAMPLE_RATE))],
+    [chunk(b'junk', bytes(100))]
+], ids=["no-data", "no-fmt", "junk"])
+def test_wav_without_fmt_or_data_is_rejected(tmp_path, chunks):
+    path = tmp_path / "audio.wav"
+    path.write_bytes(make_wav(chunks))
+    
+    with pytest.raises(InvalidAudioFormat):
+        parse_audio_header(str(path))
+
+
+def test_truncated_wav_is_rejected(tmp_path):
+    data = make_wav([wav_fmt(), chunk(b'data', bytes(2 * SAMPLE_RATE))])
+    path = tmp_path / "truncated.wav"
+    path.write_bytes(data[:len(data) // 2])
+    
+    with pytest.raises(InvalidAudioFormat):
+        parse_audio_header(str(path))
+
+
+@pytest.mark.parametrize("xing", [False, True], ids=["cbr", "xing"])
+def test_mp3_reports_its_duration(tmp_path, xing):
+    path = tmp_path / "audio.mp3"
+    path.write_bytes(make_mp3(400, xing=xing))
+    
+    header = parse_audio_header(str(path))
+    
+    # Without a Xing header the duration is estimated from the bitrate
+    assert header.duration == pytest.approx(400 * MP3_FRAME_SECONDS, rel=0 if xing else 0.01)
+    assert (header.sample_rate, header.channels, header.codec) == (44100, 1, "mp3")
+
+
+def test_truncated_mp3_with_xing_header_is_rejected(tmp_path):
+    data = make_mp3(400, xing=True)
+    path = tmp_path / "truncated.mp3"
+    path.write_bytes(data[:len(data) // 2])
+    
+    with pytest.raises(InvalidAudioFormat):
+        parse_audio_header(str(path))
+
+
+def test_junk_named_mp3_is_rejected(tmp_path):
+    path = tmp_path / "junk.mp3"
+    path.write_bytes(b"definitely not audio " * 500)
+    
+    with pytest.raises(InvalidAudioFormat):
+        parse_audio_header(str(path), file_format="mp3")
+
+
+def test_m4a_reports_its_duration(tmp_path):
+    path = tmp_path / "audio.m4a"
+    path.write_bytes(make_m4a(12.5, sample_rate=22050, channels=1))
+    
+    header = parse_audio_header(str(path))
+    
+    assert header.duration == pytest.approx(12.5)
+    assert (header.sample_rate, header.channels, header.codec) == (22050, 1, "mp4a")
+
+
+@pytest.mark.parametrize("damage", ["truncated", "junk"])
+def test_damaged_m4a_is_rejected(tmp_path, damage):
+    data = make_m4a(12.5)
+    if damage == "truncated":
+        data = data[:-100]
+    else:
+        data = data[:16] + b'\xff' * 64
+    path = tmp_path / "audio.m4a"
+    path.write_bytes(data)
+    
+    with pytest.raises(InvalidAudioFormat):
+        parse_audio_header(str(path))
@@ -0,0 +1,115 @@
+"""
+Tests for request cancellation when the client goes away.
+"""
+
+import asyncio
+import io
+import threading
+import time
+import types
+import wave
+
+import numpy as np
+
+from app import cancellation
+from app.config import settings
+from app.main import app
+from app.whisper_service import whisper_service
+
+
+def make_wav(seconds: float = 1.0) -> bytes:
+    """16kHz mono PCM WAV of low-level noise."""
+    samples = (np.random.default_rng(0).standard_normal(int(16000 * seconds)) * 300).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def multipart_body(field: str, filename: str, data: bytes, boundary: str = "whisperrr-test"):
+    """Encode one file field as multipart/form-data."""
+    body = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+        f"Content-Type: audio/wav\r\n\r\n"
+    ).encode() + data + f"\r\n--{boundary}--\r\n".encode()
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+def test_client_disconnect_cancels_transcription(monkeypatch):
+    started = threading.Event()
+    stopped = threading.Event()
+    tokens = []
+    
+    def blocking_transcribe(handle, audio, language, temperature, task):
+        # Stands in for decoding: loops over windows, checking for cancellation
+        tokens.append(cancellation._local.token)
+        started.set()
+        try:
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                cancellation.check_cancelled()
+                time.sleep(0.01)
+        finally:
+            stopped.set()
+    
+    async def acquire_model(model_size):
+        return types.SimpleNamespace(model_size="base")
+    
+    monkeypatch.setattr(whisper_service, "_acquire_model", acquire_model)
+    monkeypatch.setattr(whisper_service, "_pool", types.SimpleNamespace(release=lambda handle: None))
+    monkeypatch.setattr(whisper_service, "_transcribe_sync", blocking_transcribe)
+    monkeypatch.setattr(settings, "disconnect_poll_interval_seconds", 0.05)
+    
+    body, content_type = multipart_body("file", "clip.wav", make_wav())
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/transcribe",
+        "raw_path": b"/transcribe",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"content-type", content_type.encode()),
+            (b"content-length", str(len(body)).encode())
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80)
+    }
+    
+    async def run():
+        disconnected = asyncio.Event()
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        sent = []
+        
+        async def receive():
+            if messages:
+                return messages.pop(0)
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+        
+        async def send(message):
+            sent.append(message)
+        
+        request = asyncio.ensure_future(app(scope, receive, send))
+        while not started.is_set():
+            assert not request.done(), sent
+            await asyncio.sleep(0.01)
+        
+        # The client drops the connection while decoding is in progress
+        disconnected.set()
+        await asyncio.wait_for(request, timeout=5)
+        return sent
+    
+    sent = asyncio.run(run())
+    
+    assert stopped.wait(timeout=1)
+    assert tokens[0].cancelled
+    assert tokens[0].reason == "cancelled"
+    assert sent[0]["status"] == 499
@@ -0,0 +1,70 @@
+"""
+Import-time budget for the service modules.
+
+Each module is imported in a fresh interpreter under `python -X importtime`.
+Its cumulative import time must stay within budget, and heavy dependencies
+(whisper, torch, librosa, scipy) must only be imported on first real use.
+"""
+
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+import pytest
+
+# Cumulative import time allowed per module, in seconds
+BUDGETS = {
+    "app.config": 0.5,
+    "app.models": 0.5,
+    "app.main": 1.5
+}
+
+# Dependencies that must stay out of sys.modules after importing the app
+HEAVY_MODULES = ("whisper", "torch", "librosa", "scipy")
+
+# Imports per module; the fastest is compared with the budget
+REPEAT = 3
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_import(module: str) -> Tuple[float, List[str]]:
+    """
+    Import a module in a fresh interpreter.
+    
+    Returns:
+        Tuple of cumulative import time in seconds and the heavy modules it loaded
+    """
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SERVICE_DIR,
+        capture_output=True,
+        text=True
+    )
+    assert proc.returncode == 0, f"Importing {module} failed:\n{proc.stderr[-2000:]}"
+    
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            cumulative_us = int(fields[1])
+    
+    heavy = [name for name in proc.stdout.strip().split(",") if name]
+    return cumulative_us / 1e6, heavy
+
+
+@pytest.mark.parametrize("module,budget", BUDGETS.items())
+def test_import_stays_light_and_within_budget(module, budget):
+    runs = [measure_import(module) for _ in range(REPEAT)]
+    
+    assert runs[0][1] == [], f"{module} imported {', '.join(runs[0][1])} at import time"
+    seconds = min(run[0] for run in runs)
+    assert seconds <= budget, f"{module} took {seconds:.3f}s (budget {budget:.3f}s)"
@@ -0,0 +1,121 @@
+"""
+Tests for asynchronous jobs with a stub transcription.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app import jobs
+from app.admission import AdmissionController
+from app.jobs import CANCELLED, COMPLETED, QUEUED, RUNNING, JobManager
+from app.whisper_service import whisper_service
+
+
+@pytest.fixture
+def release():
+    """Transcriptions block until this is set (created on the test's event loop)."""
+    return {}
+
+
+@pytest.fixture
+def stub(monkeypatch, release):
+    """One transcription slot and a transcription that waits to be released."""
+    async def transcribe_audio(file_path, progress_callback=None, timeout_seconds=None, **params):
+        await release["event"].wait()
+        return {"text": "done"}
+    
+    monkeypatch.setattr(jobs, "admission_controller", AdmissionController(max_concurrent=1, queue_depth=0))
+    monkeypatch.setattr(whisper_service, "transcribe_audio", transcribe_audio)
+
+
+def submit(manager: JobManager, tmp_path, name: str):
+    """Queue a job for a stored (empty) upload."""
+    path = tmp_path / name
+    path.write_bytes(b"")
+    return manager.submit(str(path), name, 0, {}, duration=10.0)
+
+
+async def settle():
+    """Let the workers and job tasks run up to their next wait."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_job_waiting_for_a_slot_stays_queued(stub, release, tmp_path):
+    async def scenario():
+        release["event"] = asyncio.Event()
+        manager = JobManager(workers=2, queue_depth=10, max_jobs=10, ttl_seconds=60)
+        manager.start()
+        
+        first = submit(manager, tmp_path, "first.wav")
+        second = submit(manager, tmp_path, "second.wav")
+        await settle()
+        states = (first.status, second.status, second.started_at, manager.queue_position(second))
+        
+        release["event"].set()
+        await asyncio.wait([first.task, second.task])
+        await manager.stop()
+        return states, first, second
+    
+    (first_status, second_status, second_started, position), first, second = asyncio.run(scenario())
+    
+    # Both jobs have a worker, but only one holds the slot
+    assert first_status == RUNNING
+    assert second_status == QUEUED
+    assert second_started is None
+    assert position == 1
+    assert first.status == second.status == COMPLETED
+    assert second.started_at is not None
+
+
+def test_cancelling_queued_and_running_jobs(stub, release, tmp_path):
+    async def scenario():
+        release["event"] = asyncio.Event()
+        manager = JobManager(workers=2, queue_depth=10, max_jobs=10, ttl_seconds=60)
+        manager.start()
+        
+        running = submit(manager, tmp_path, "running.wav")
+        waiting = submit(manager, tmp_path, "waiting.wav")
+        unpicked = submit(manager, tmp_path, "unpicked.wav")
+        await settle()
+        assert (running.status, waiting.status, unpicked.task) == (RUNNING, QUEUED, None)
+        
+        for job in (unpicked, waiting, running):
+            await manager.cancel(job.id)
+        slots = jobs.admission_controller.metrics()
+        await manager.stop()
+        return (running, waiting, unpicked), slots
+    
+    cancelled, slots = asyncio.run(scenario())
+    
+    for job in cancelled:
+        assert job.status == CANCELLED
+        assert job.finished_at is not None
+        assert not (tmp_path / job.filename).exists()
+    assert cancelled[0].started_at is not None
+    assert cancelled[1].started_at is None
+    # Nothing is left holding or waiting for the slot
+    assert (slots["running"], slots["queue_depth"]) == (0, 0)
+
+
+def test_finished_jobs_expire_after_the_ttl(stub, release, tmp_path):
+    async def scenario():
+        release["event"] = asyncio.Event()
+        release["event"].set()
+        manager = JobManager(workers=1, queue_depth=10, max_jobs=10, ttl_seconds=60)
+        manager.start()
+        
+        job = submit(manager, tmp_path, "clip.wav")
+        await settle()
+        await asyncio.wait([job.task])
+        await manager.stop()
+        return manager, job
+    
+    manager, job = asyncio.run(scenario())
+    assert manager.get(job.id) is job
+    
+    job.finished_at = time.time() - 61
+    with pytest.raises(jobs.JobNotFound):
+        manager.get(job.id)
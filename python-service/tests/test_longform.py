@@ -0,0 +1,61 @@
+"""
+Tests for planning and stitching long-form chunks.
+"""
+
+from app import longform
+from app.longform import Chunk, default_worker_count, stitch_results
+
+RATE = 16000
+
+
+def seconds(*values: float) -> Chunk:
+    """A chunk from times in seconds."""
+    return Chunk(*(int(value * RATE) for value in values))
+
+
+def segment(start: float, end: float, text: str) -> dict:
+    """A Whisper segment with times relative to its chunk."""
+    return {"start": start, "end": end, "text": f" {text}"}
+
+
+def test_stitching_drops_overlap_duplicates():
+    # The first chunk owns 0-10s, the second 10-20s; they share 8-12s
+    chunks = [seconds(0, 12, 0, 10), seconds(8, 20, 10, 20)]
+    results = [
+        {"language": "en", "segments": [
+            segment(0.0, 6.0, "Long recordings are cut"),
+            segment(6.0, 9.8, "at silence, then we split audio at"),
+            # Centred past the cut, so the second chunk owns it
+            segment(9.8, 11.5, "silence and stitch")
+        ]},
+        {"language": "en", "segments": [
+            # Centred before the cut, so the first chunk owns it
+            segment(0.0, 1.5, "then we split"),
+            segment(1.0, 3.0, "split audio at silence and stitch"),
+            segment(3.0, 12.0, "the text back together.")
+        ]}
+    ]
+    
+    result = stitch_results(results, chunks, RATE)
+    
+    assert [s["text"] for s in result["segments"]] == [
+        "Long recordings are cut",
+        "at silence, then we split audio at",
+        "silence and stitch",
+        "the text back together."
+    ]
+    assert result["text"] == (
+        "Long recordings are cut at silence, then we split audio at silence and stitch the text back together."
+    )
+    # Times are on the full timeline and never run backwards across the cut
+    assert [(s["start"], s["end"]) for s in result["segments"]] == [(0.0, 6.0), (6.0, 9.8), (9.8, 11.0), (11.0, 20.0)]
+    assert [s["id"] for s in result["segments"]] == [0, 1, 2, 3]
+    assert result["language"] == "en"
+
+
+def test_default_worker_count_shares_cpus_between_server_workers(monkeypatch):
+    monkeypatch.setattr(longform, "available_cpus", lambda: (16, "test"))
+    
+    assert default_worker_count(1) == longform.DEFAULT_MAX_WORKERS
+    assert default_worker_count(8) == 2
+    assert default_worker_count(32) == 1
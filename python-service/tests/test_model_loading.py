@@ -0,0 +1,81 @@
+"""
+Tests for loading models into the pool with a stub backend.
+"""
+
+import asyncio
+import time
+import types
+
+import pytest
+
+from app.config import settings
+from app.model_pool import ModelPool
+from app.whisper_service import whisper_service
+
+
+@pytest.fixture
+def loads():
+    """Model sizes the stub loader was asked for."""
+    return []
+
+
+@pytest.fixture
+def service(monkeypatch, loads):
+    """The whisper service with an empty pool and a slow stub model loader."""
+    def load_model_sync(backend, model_size):
+        loads.append(model_size)
+        time.sleep(0.3)
+        return types.SimpleNamespace(model_size=model_size)
+    
+    monkeypatch.setattr(whisper_service, "_pool", ModelPool(1024))
+    monkeypatch.setattr(whisper_service, "_model_size", None)
+    monkeypatch.setattr(whisper_service, "_model_loads", {})
+    monkeypatch.setattr(whisper_service, "_startup_load", None)
+    monkeypatch.setattr(whisper_service, "_load_model_sync", load_model_sync)
+    monkeypatch.setattr(settings, "model_warmup_enabled", False)
+    return whisper_service
+
+
+def test_startup_load_outlasting_the_wait_timeout_sets_the_default(service, monkeypatch):
+    monkeypatch.setattr(settings, "model_load_wait_timeout_seconds", 0.05)
+    
+    async def scenario():
+        service.start_background_load("base")
+        await asyncio.wait([service._startup_load])
+        return service._startup_load
+    
+    startup = asyncio.run(scenario())
+    
+    assert startup.exception() is None
+    assert service._model_size == "base"
+    assert "base" in service._pool
+
+
+def test_concurrent_loads_of_one_size_share_a_single_load(service, loads):
+    async def scenario():
+        return await asyncio.gather(
+            service.load_model("small", make_default=False),
+            service.load_model("small", make_default=False)
+        )
+    
+    results = asyncio.run(scenario())
+    
+    assert loads == ["small"]
+    assert all(result["success"] for result in results)
+    assert service._model_loads == {}
+
+
+def test_cancelled_waiter_leaves_the_shared_load_running(service, loads):
+    async def scenario():
+        impatient = asyncio.ensure_future(service.load_model("small", make_default=False))
+        patient = asyncio.ensure_future(service.load_model("small", make_default=False))
+        await asyncio.sleep(0.05)
+        impatient.cancel()
+        return await patient, impatient
+    
+    result, impatient = asyncio.run(scenario())
+    
+    assert impatient.cancelled()
+    assert result["success"]
+    assert loads == ["small"]
+    assert "small" in service._pool
@@ -0,0 +1,84 @@
+"""
+Tests for the memory-budgeted LRU model pool.
+"""
+
+from app.model_pool import ModelPool
+
+
+def make_pool(budget_mb: float = 1000, **models: float) -> ModelPool:
+    """A pool holding stub models of the given sizes in MB, added in order."""
+    pool = ModelPool(budget_mb)
+    for model_size, memory_mb in models.items():
+        pool.add(model_size, object(), memory_mb=memory_mb)
+    return pool
+
+
+def resident(pool: ModelPool) -> set:
+    """Sizes of the resident models."""
+    return {entry["model_size"] for entry in pool.snapshot()}
+
+
+def test_least_recently_used_model_is_evicted_over_budget():
+    pool = make_pool(tiny=300, base=300)
+    pool.release(pool.acquire("tiny"))
+    
+    evicted = pool.add("small", object(), memory_mb=500)
+    
+    assert evicted == ["base"]
+    assert resident(pool) == {"tiny", "small"}
+
+
+def test_pinned_model_is_never_evicted():
+    pool = make_pool(tiny=300, base=300)
+    pool.pin("tiny")
+    
+    evicted = pool.add("small", object(), memory_mb=500)
+    
+    assert evicted == ["base"]
+    assert "tiny" in pool
+
+
+def test_model_added_last_stays_even_over_budget():
+    pool = make_pool(budget_mb=100)
+    
+    assert pool.add("large", object(), memory_mb=3000) == []
+    assert "large" in pool
+
+
+def test_reservations_count_against_the_budget():
+    pool = make_pool(tiny=300, base=300)
+    pool.pin("base")
+    
+    assert pool.reserve("longform-pool", 600)
+    assert resident(pool) == {"base"}
+    assert pool.used_memory_mb == 900
+    
+    # Nothing idle is left to evict, so a second reservation cannot fit
+    assert not pool.reserve("other", 200)
+    assert resident(pool) == {"base"}
+    
+    pool.unreserve("longform-pool")
+    assert pool.used_memory_mb == 300
+
+
+def test_model_in_use_is_evicted_only_after_release():
+    pool = make_pool(tiny=300, base=300)
+    handle = pool.acquire("tiny")
+    
+    # Still over budget after evicting base, but tiny is in use
+    assert pool.add("small", object(), memory_mb=800) == ["base"]
+    assert "tiny" in pool
+    
+    # Releasing the last reference evicts it once the pool is over budget
+    assert pool.release(handle) == ["tiny"]
+    assert resident(pool) == {"small"}
+
+
+def test_reservation_skips_models_in_use():
+    pool = make_pool(tiny=300, base=300)
+    handle = pool.acquire("tiny")
+    
+    assert not pool.reserve("longform-pool", 800)
+    assert pool.reserve("longform-pool", 600)
+    assert resident(pool) == {"tiny"}
+    pool.release(handle)
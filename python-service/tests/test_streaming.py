@@ -0,0 +1,55 @@
+"""
+Tests for streaming audio as fixed-length windows.
+"""
+
+import struct
+
+import numpy as np
+import soundfile as sf
+
+from app.utils import WHISPER_SAMPLE_RATE, AudioProbe, iter_audio_windows
+
+SECONDS = 3
+TONE_HZ = 440
+
+
+def ogg_crc(page: bytes) -> int:
+    """CRC-32 of an Ogg page (polynomial 0x04C11DB7, not reflected)."""
+    crc = 0
+    for byte in page:
+        crc ^= byte << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7) & 0xFFFFFFFF if crc & 0x80000000 else (crc << 1) & 0xFFFFFFFF
+    return crc
+
+
+def set_opus_input_rate(data: bytes, sample_rate: int) -> bytes:
+    """Rewrite the input rate recorded in OpusHead and re-checksum its page."""
+    data = bytearray(data)
+    head = data.find(b'OpusHead')
+    data[head + 12:head + 16] = struct.pack('<I', sample_rate)
+    
+    segments = data[26]
+    page_length = 27 + segments + sum(data[27:27 + segments])
+    # The checksum is computed with its own field zeroed
+    data[22:26] = bytes(4)
+    data[22:26] = struct.pack('<I', ogg_crc(data[:page_length]))
+    return bytes(data)
+
+
+def test_opus_is_resampled_from_the_decoder_rate(tmp_path):
+    # Opus decodes at 48kHz even when OpusHead records another input rate
+    t = np.arange(48000 * SECONDS) / 48000
+    sf.write(str(tmp_path / "tone.ogg"), 0.3 * np.sin(2 * np.pi * TONE_HZ * t), 48000, format="OGG", subtype="OPUS")
+    path = tmp_path / "tone44k.ogg"
+    path.write_bytes(set_opus_input_rate((tmp_path / "tone.ogg").read_bytes(), 44100))
+    
+    probe = AudioProbe(str(path))
+    assert probe.sample_rate == 44100
+    
+    audio = np.concatenate(list(iter_audio_windows(str(path), probe, window_seconds=1.0)))
+    
+    assert abs(len(audio) - SECONDS * WHISPER_SAMPLE_RATE) < WHISPER_SAMPLE_RATE * 0.05
+    spectrum = np.abs(np.fft.rfft(audio))
+    peak_hz = np.argmax(spectrum) * WHISPER_SAMPLE_RATE / len(audio)
+    assert abs(peak_hz - TONE_HZ) < 5
@@ -0,0 +1,88 @@
+"""
+Tests for the /transcribe endpoint with a stub model.
+"""
+
+import io
+import types
+import wave
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app import utils
+from app.config import settings
+from app.main import app
+from app.whisper_service import whisper_service
+
+
+def make_wav(seconds: float = 1.0, samples: np.ndarray = None) -> bytes:
+    """16kHz mono PCM WAV of the given samples, or of low-level noise."""
+    if samples is None:
+        samples = (np.random.default_rng(0).standard_normal(int(16000 * seconds)) * 300).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def test_upload_headers_are_parsed_once(monkeypatch):
+    parsed = []
+    parse_audio_header = utils.parse_audio_header
+    
+    def counting_parse(file_path, file_format=None):
+        parsed.append(file_path)
+        return parse_audio_header(file_path, file_format)
+    
+    async def acquire_model(model_size):
+        return types.SimpleNamespace(model_size="base")
+    
+    def transcribe(handle, audio, language, temperature, task):
+        return {"text": "hello", "segments": [], "language": "en"}
+    
+    monkeypatch.setattr(utils, "parse_audio_header", counting_parse)
+    monkeypatch.setattr(whisper_service, "_acquire_model", acquire_model)
+    monkeypatch.setattr(whisper_service, "_pool", types.SimpleNamespace(release=lambda handle: None))
+    monkeypatch.setattr(whisper_service, "_transcribe_sync", transcribe)
+    
+    response = TestClient(app).post("/transcribe", files={"file": ("clip.wav", make_wav(), "audio/wav")})
+    
+    assert response.status_code == 200, response.text
+    assert response.json()["text"] == "hello"
+    assert len(parsed) == 1
+    assert response.headers["X-Queue-Wait-Seconds"] == "0.0"
+
+
+def test_metrics_report_silence_skipped_by_vad(monkeypatch):
+    async def acquire_model(model_size):
+        return types.SimpleNamespace(model_size="base")
+    
+    def transcribe(handle, audio, language, temperature, task):
+        return {"text": "hello", "segments": [], "language": "en"}
+    
+    monkeypatch.setattr(settings, "vad_enabled", True)
+    monkeypatch.setattr(whisper_service, "_acquire_model", acquire_model)
+    monkeypatch.setattr(whisper_service, "_pool", types.SimpleNamespace(release=lambda handle: None))
+    monkeypatch.setattr(whisper_service, "_transcribe_sync", transcribe)
+    monkeypatch.setattr(whisper_service, "_vad_audio_seconds", 0.0)
+    monkeypatch.setattr(whisper_service, "_vad_skipped_seconds", 0.0)
+    
+    # Two seconds of speech-like noise between four seconds of silence
+    rng = np.random.default_rng(0)
+    samples = np.zeros(16000 * 6, dtype="<i2")
+    samples[16000 * 2:16000 * 4] = (rng.standard_normal(16000 * 2) * 8000).astype("<i2")
+    client = TestClient(app)
+    
+    response = client.post("/transcribe", files={"file": ("clip.wav", make_wav(samples=samples), "audio/wav")})
+    assert response.status_code == 200, response.text
+    
+    vad = client.get("/metrics").json()["vad"]
+    skipped = response.json()["skipped_audio_ratio"]
+    assert vad["enabled"]
+    assert vad["audio_seconds_total"] == pytest.approx(6.0)
+    assert vad["skipped_seconds_total"] == pytest.approx(6.0 * skipped, abs=0.01)
+    assert vad["speech_seconds_total"] == pytest.approx(6.0 * (1 - skipped), abs=0.01)
+    assert 2.0 <= vad["speech_seconds_total"] < 6.0
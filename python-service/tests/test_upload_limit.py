@@ -0,0 +1,88 @@
+"""
+Tests for refusing oversized uploads while their body arrives.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.config import settings
+from app.main import MULTIPART_OVERHEAD_BYTES, app
+
+BOUNDARY = "whisperrr-test"
+CHUNK = 64 * 1024
+
+
+def upload_scope(path: str, content_length=None):
+    """ASGI scope of a multipart POST, with or without a Content-Length."""
+    headers = [(b"content-type", f"multipart/form-data; boundary={BOUNDARY}".encode())]
+    if content_length is not None:
+        headers.append((b"content-length", str(content_length).encode()))
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80)
+    }
+
+
+def run_upload(scope, chunks: int):
+    """Send a multipart file of the given number of chunks; return responses and chunks read."""
+    head = (
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="clip.wav"\r\n'
+        f"Content-Type: audio/wav\r\n\r\n"
+    ).encode()
+    body = [head] + [b"\0" * CHUNK] * chunks + [f"\r\n--{BOUNDARY}--\r\n".encode()]
+    read = 0
+    
+    async def receive():
+        nonlocal read
+        if read < len(body):
+            read += 1
+            return {"type": "http.request", "body": body[read - 1], "more_body": read < len(body)}
+        return {"type": "http.disconnect"}
+    
+    async def run():
+        sent = []
+        
+        async def send(message):
+            sent.append(message)
+        
+        await app(scope, receive, send)
+        return sent
+    
+    return asyncio.run(run()), read
+
+
+@pytest.fixture
+def small_limit(monkeypatch):
+    """A 1MB upload limit."""
+    monkeypatch.setattr(settings, "max_file_size_mb", 1)
+    return settings.max_file_size_bytes + MULTIPART_OVERHEAD_BYTES
+
+
+@pytest.mark.parametrize("path", ["/transcribe", "/jobs"])
+def test_declared_oversized_upload_is_refused_unread(small_limit, path):
+    sent, read = run_upload(upload_scope(path, content_length=small_limit + 1), chunks=64)
+    
+    assert sent[0]["status"] == 413
+    assert json.loads(sent[1]["body"])["error_type"] == "FILE_TOO_LARGE"
+    assert read == 0
+
+
+def test_undeclared_oversized_upload_is_cut_off(small_limit):
+    chunks = 64
+    sent, read = run_upload(upload_scope("/transcribe"), chunks=chunks)
+    
+    assert [message["status"] for message in sent if message["type"] == "http.response.start"] == [413]
+    assert read < chunks
@@ -0,0 +1,63 @@
+"""
+Tests for the frame-energy voice activity detector.
+"""
+
+import numpy as np
+import pytest
+
+from app.utils import WHISPER_SAMPLE_RATE, detect_speech_regions
+
+SECONDS = 10
+
+
+def seconds(duration: float) -> np.ndarray:
+    """Sample times for the given duration at 16kHz."""
+    return np.arange(int(duration * WHISPER_SAMPLE_RATE)) / WHISPER_SAMPLE_RATE
+
+
+def speech_like(rng: np.random.Generator, duration: float) -> np.ndarray:
+    """Noise modulated at a syllable rate, standing in for speech."""
+    t = seconds(duration)
+    return rng.standard_normal(len(t)) * 0.5 * (1 + np.sin(2 * np.pi * 4 * t))
+
+
+def kept_fraction(regions, total: int) -> float:
+    """Fraction of the samples covered by speech regions."""
+    return sum(end - start for start, end in regions) / total
+
+
+@pytest.mark.parametrize("aggressiveness", [0, 1, 2, 3])
+def test_steady_tone_is_kept(aggressiveness):
+    tone = (0.3 * np.sin(2 * np.pi * 440 * seconds(SECONDS))).astype(np.float32)
+    
+    assert detect_speech_regions(tone, aggressiveness=aggressiveness) == [(0, len(tone))]
+
+
+@pytest.mark.parametrize("aggressiveness", [0, 1, 2, 3])
+def test_speech_over_steady_noise_is_kept(aggressiveness):
+    rng = np.random.default_rng(0)
+    speech = speech_like(rng, SECONDS)
+    noise = rng.standard_normal(len(speech))
+    # 3.5 dB signal-to-noise ratio
+    speech *= np.sqrt(np.mean(noise ** 2) / np.mean(speech ** 2) * 10 ** (3.5 / 10))
+    audio = (0.05 * (speech + noise)).astype(np.float32)
+    
+    regions = detect_speech_regions(audio, aggressiveness=aggressiveness)
+    
+    assert kept_fraction(regions, len(audio)) > 0.9
+
+
+def test_digital_silence_has_no_speech():
+    assert detect_speech_regions(np.zeros(5 * WHISPER_SAMPLE_RATE, dtype=np.float32)) == []
+
+
+def test_long_pause_is_cut():
+    rng = np.random.default_rng(0)
+    speech = 0.1 * speech_like(rng, 3)
+    pause = 0.001 * rng.standard_normal(len(seconds(4)))
+    audio = np.concatenate((speech, pause, speech)).astype(np.float32)
+    
+    regions = detect_speech_regions(audio, aggressiveness=1)
+    
+    assert len(regions) == 2
+    assert 0.4 < kept_fraction(regions, len(audio)) < 0.7